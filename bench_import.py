@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+# Cold import of the library in a fresh interpreter must stay under this
+# many milliseconds (interpreter startup excluded) and print nothing
+IMPORT_BUDGET_MS = 50.0
+RUNS = 10
+
+BASELINE = 'import time; t = time.perf_counter(); {}; print(1000 * (time.perf_counter() - t))'
+
+
+def time_import(statement):
+    # Run from this directory so the package imports from the source tree
+    result = subprocess.run([sys.executable, '-c', BASELINE.format(statement)],
+                            capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    lines = result.stdout.strip().split('\n')
+    # Anything but the timing line means the import printed something
+    return float(lines[-1]), lines[:-1]
+
+
+def linear_algebra_engines():
+    from linear_algebra import LAZY_NAMES
+    return ['linear_algebra.' + module for module in LAZY_NAMES.values()]
+
+
+def main():
+    failures = []
+    for statement in ['import linear_algebra', 'import linear_algebra.linsys', 'import my_vector']:
+        timings = []
+        for _ in range(RUNS):
+            ms, output = time_import(statement)
+            timings.append(ms)
+            if output:
+                failures.append('{} printed {!r}'.format(statement, output[0]))
+                break
+        best = min(timings)
+        print('{:<32} best {:7.2f} ms  median {:7.2f} ms'.format(
+            statement, best, sorted(timings)[len(timings) // 2]))
+        if best > IMPORT_BUDGET_MS:
+            failures.append('{} took {:.2f} ms, budget is {} ms'.format(statement, best, IMPORT_BUDGET_MS))
+
+    engines = sorted(set(linear_algebra_engines()))
+    try:
+        time_import('import linear_algebra, sys; assert not {!r} & set(sys.modules)'.format(set(engines)))
+    except subprocess.CalledProcessError:
+        failures.append('import linear_algebra loaded one of {}'.format(', '.join(engines)))
+
+    for failure in failures:
+        print('FAIL: ' + failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
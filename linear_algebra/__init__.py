@@ -0,0 +1,58 @@
+from .vector import Vector
+from .line import Line
+from .plane import Plane
+from .linsys import EliminationStep, LinearSystem, Parametrization, SolveReport
+from .lu import LUFactorization
+from .precision import current_tolerance, local_precision
+from .structure import BandedSolver, MatrixStructure
+
+# The solver engines are submodules imported the first time one of their
+# names is used, so importing the package stays cheap for workers that only
+# need the core types
+LAZY_NAMES = {
+    'PlaneArrangement': 'arrangement',
+    'CheckpointedEliminator': 'checkpoint',
+    'BlockDecomposition': 'decomposition',
+    'solve_decomposed': 'decomposition',
+    'EigenResult': 'eigen',
+    'LinearOperator': 'eigen',
+    'inverse_iteration': 'eigen',
+    'lanczos': 'eigen',
+    'power_iteration': 'eigen',
+    'EquationWriter': 'export',
+    'HalfSpaceClassifier': 'halfspace',
+    'IterativeResult': 'iterative',
+    'IterativeSolver': 'iterative',
+    'Matrix': 'matrix',
+    'batched_product': 'matrix',
+    'TriangleMesh': 'mesh',
+    'ParallelEliminator': 'parallel_elimination',
+    'OperationProfiler': 'profiling',
+    'SubspaceProjector': 'projection',
+    'RecordReader': 'serialization',
+    'RecordWriter': 'serialization',
+    'SolverClient': 'service',
+    'SolverService': 'service',
+    'CachedSolution': 'solve_cache',
+    'SolveCache': 'solve_cache',
+    'HyperplaneIndex': 'spatial_index',
+    'ChunkedVector': 'streaming',
+}
+
+__all__ = ['Vector', 'Line', 'Plane', 'LinearSystem', 'EliminationStep', 'Parametrization', 'SolveReport', 'LUFactorization',
+           'BandedSolver', 'MatrixStructure', 'current_tolerance', 'local_precision'] + sorted(LAZY_NAMES)
+
+
+def __getattr__(name):
+    module_name = LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    from importlib import import_module
+    value = getattr(import_module('.' + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,162 @@
+from itertools import combinations
+
+from .plane import equation_terms
+
+
+def plane_values(p):
+    # Accepts a Plane or a (normal_vector, constant_term) pair
+    n, c = equation_terms(p)
+    x, y, z = n
+    return float(x), float(y), float(z), float(c)
+
+
+def cross(a, b):
+    return (a[1]*b[2] - b[1]*a[2],
+            -(a[0]*b[2] - b[0]*a[2]),
+            a[0]*b[1] - b[0]*a[1])
+
+
+def dot(a, b):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+
+class PairIntersections(object):
+
+    def __init__(self):
+        # For pair i: points[i] and directions[i] describe the line, or are
+        # None when parallel[i]; coincident[i] marks parallel pairs that
+        # are the same plane
+        self.points = []
+        self.directions = []
+        self.parallel = []
+        self.coincident = []
+
+    def add_line(self, point, direction):
+        self.points.append(point)
+        self.directions.append(direction)
+        self.parallel.append(False)
+        self.coincident.append(False)
+
+    def add_parallel(self, coincident):
+        self.points.append(None)
+        self.directions.append(None)
+        self.parallel.append(True)
+        self.coincident.append(coincident)
+
+
+class TripleIntersections(object):
+
+    def __init__(self):
+        # points[i] is None exactly when singular[i]: two of the planes are
+        # parallel or all three share a line
+        self.points = []
+        self.singular = []
+
+
+def intersect_pair(p, q, tolerance=1e-10):
+    n1, c1 = p[:3], p[3]
+    n2, c2 = q[:3], q[3]
+    d = cross(n1, n2)
+    d_squared = dot(d, d)
+
+    if d_squared < tolerance * tolerance:
+        # Parallel normals: the planes coincide when c1*n2 == c2*n1
+        coincident = all(abs(c1*b - c2*a) < tolerance for a, b in zip(n1, n2))
+        return None, None, coincident
+
+    # The point of the line closest to the origin
+    u = cross(n2, d)
+    v = cross(d, n1)
+    point = tuple((c1*a + c2*b) / d_squared for a, b in zip(u, v))
+    return point, d, False
+
+
+def intersect_pairs(planes1, planes2, tolerance=1e-10):
+    result = PairIntersections()
+    for p, q in zip(planes1, planes2):
+        point, direction, coincident = intersect_pair(plane_values(p), plane_values(q), tolerance)
+        if point is None:
+            result.add_parallel(coincident)
+        else:
+            result.add_line(point, direction)
+    return result
+
+
+def intersect_triples(planes1, planes2, planes3, tolerance=1e-10):
+    result = TripleIntersections()
+    for p, q, r in zip(planes1, planes2, planes3):
+        p, q, r = plane_values(p), plane_values(q), plane_values(r)
+        add_triple(result, p, q, r, cross(q[:3], r[:3]), tolerance)
+    return result
+
+
+def add_triple(result, p, q, r, q_cross_r, tolerance):
+    # Cramer's rule: x = (c1 (n2 x n3) + c2 (n3 x n1) + c3 (n1 x n2)) / det
+    det = dot(p[:3], q_cross_r)
+    if abs(det) < tolerance:
+        result.points.append(None)
+        result.singular.append(True)
+        return
+
+    r_cross_p = cross(r[:3], p[:3])
+    p_cross_q = cross(p[:3], q[:3])
+    result.points.append(tuple((p[3]*a + q[3]*b + r[3]*c) / det
+                               for a, b, c in zip(q_cross_r, r_cross_p, p_cross_q)))
+    result.singular.append(False)
+
+
+class PlaneArrangement(object):
+
+    def __init__(self, planes, tolerance=1e-10):
+        # Plane coefficients are converted to floats once for all queries
+        self.planes = [plane_values(p) for p in planes]
+        self.tolerance = tolerance
+
+    def __len__(self):
+        return len(self.planes)
+
+    def pair_indices(self):
+        return combinations(range(len(self.planes)), 2)
+
+    def triple_indices(self):
+        return combinations(range(len(self.planes)), 3)
+
+    def lines(self):
+        # Intersections of every pair, in pair_indices() order
+        result = PairIntersections()
+        for i, j in self.pair_indices():
+            point, direction, coincident = intersect_pair(self.planes[i], self.planes[j], self.tolerance)
+            if point is None:
+                result.add_parallel(coincident)
+            else:
+                result.add_line(point, direction)
+        return result
+
+    def vertices(self):
+        # Intersections of every triple, in triple_indices() order. The
+        # cross product of each pair is computed once and shared by all
+        # triples that end in that pair.
+        planes = self.planes
+        crosses = {}
+        for j, k in self.pair_indices():
+            crosses[j, k] = cross(planes[j][:3], planes[k][:3])
+
+        result = TripleIntersections()
+        for i, j, k in self.triple_indices():
+            add_triple(result, planes[i], planes[j], planes[k], crosses[j, k], self.tolerance)
+        return result
+
+
+"""
+planes = [Plane(Vector(['1', '0', '0']), '1'),
+          Plane(Vector(['0', '1', '0']), '2'),
+          Plane(Vector(['0', '0', '1']), '3'),
+          Plane(Vector(['2', '0', '0']), '2')]
+
+a = PlaneArrangement(planes)
+lines = a.lines()
+print(list(a.pair_indices()))
+print(lines.points, lines.parallel, lines.coincident)
+vertices = a.vertices()
+print(vertices.points, vertices.singular)
+"""
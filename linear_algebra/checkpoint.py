@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import time
+import zlib
+from decimal import Decimal, getcontext
+from fractions import Fraction
+
+from .parallel_elimination import elimination_step
+from .precision import current_tolerance
+
+# A checkpoint is one zlib compressed JSON document, replaced atomically:
+#   version, kind       format version and value type of the entries
+#   fingerprint         hash of the input system, the Decimal precision and
+#                       the tolerance, so a checkpoint is never resumed
+#                       against a different system or under other settings
+#   column, row         next pivot column and the row its pivot goes to
+#   permutation         permutation[i] is the original row now at row i
+#   finished            rows above `row`, which elimination no longer touches
+#   trailing            rows from `row` down, from column `column` on (the
+#                       entries to the left have been eliminated)
+# Values are written as strings so Decimal and Fraction entries round trip
+# exactly.
+VERSION = 1
+
+KINDS = {
+    'decimal': Decimal,
+    'fraction': Fraction,
+    'float': float,
+}
+
+
+def kind_of(value):
+    if isinstance(value, Decimal):
+        return 'decimal'
+    if isinstance(value, float):
+        return 'float'
+    # ints and Fractions are eliminated in exact rational arithmetic
+    return 'fraction'
+
+
+def fingerprint(rows, kind, tolerance):
+    h = hashlib.sha256()
+    h.update('{};{}x{};prec={};tolerance={!r}\n'.format(
+        kind, len(rows), len(rows[0]), getcontext().prec, tolerance).encode())
+    for row in rows:
+        h.update((','.join(str(x) for x in row) + '\n').encode())
+    return h.hexdigest()
+
+
+class CheckpointStats(object):
+
+    def __init__(self):
+        self.checkpoints = 0
+        self.checkpoint_seconds = 0.0
+        self.checkpoint_bytes = 0
+        self.elimination_seconds = 0.0
+        self.resumed_from_column = None
+
+    def as_dict(self):
+        total = self.elimination_seconds + self.checkpoint_seconds
+        return {
+            'checkpoints': self.checkpoints,
+            'checkpoint_seconds': self.checkpoint_seconds,
+            'checkpoint_bytes': self.checkpoint_bytes,
+            'elimination_seconds': self.elimination_seconds,
+            'checkpoint_overhead': self.checkpoint_seconds / total if total else 0.0,
+            'resumed_from_column': self.resumed_from_column,
+        }
+
+
+class CheckpointError(Exception):
+    pass
+
+
+class CheckpointedEliminator(object):
+
+    WRONG_SYSTEM_MSG = 'Checkpoint {} belongs to a different system'
+    UNSUPPORTED_VERSION_MSG = 'Unsupported checkpoint version {}'
+
+    def __init__(self, path, every_columns=16, every_seconds=None, tolerance=None, keep=False):
+        # A checkpoint is written after every_columns pivot columns or
+        # every_seconds of elimination, whichever comes first. With
+        # keep=False the file is removed once the elimination completes.
+        self.path = path
+        self.every_columns = every_columns
+        self.every_seconds = every_seconds
+        self.tolerance = tolerance
+        self.keep = keep
+        self.stats = CheckpointStats()
+        self.permutation = None
+
+    def save(self, state):
+        start = time.perf_counter()
+        data = zlib.compress(json.dumps(state, separators=(',', ':')).encode())
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+        self.stats.checkpoints += 1
+        self.stats.checkpoint_bytes += len(data)
+        self.stats.checkpoint_seconds += time.perf_counter() - start
+
+    def load(self, key):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'rb') as f:
+            state = json.loads(zlib.decompress(f.read()))
+        if state['version'] != VERSION:
+            raise CheckpointError(self.UNSUPPORTED_VERSION_MSG.format(state['version']))
+        if state['fingerprint'] != key:
+            raise CheckpointError(self.WRONG_SYSTEM_MSG.format(self.path))
+        return state
+
+    def triangular_form(self, system, constants=None, time_budget=None):
+        # Same elimination as ParallelEliminator.triangular_form, resumed
+        # from the checkpoint at self.path when there is one. Returns the
+        # triangular rows and their constants, or None when time_budget
+        # seconds ran out first, in which case a checkpoint has just been
+        # written and a later call carries on from it.
+        if constants is None:
+            coefficients, constants = system.matrix_form()
+        else:
+            coefficients = system
+        kind = kind_of(coefficients[0][0])
+        convert = KINDS[kind]
+        rows = [[convert(x) for x in row] + [convert(c)] for row, c in zip(coefficients, constants)]
+        tolerance = self.tolerance if self.tolerance is not None else current_tolerance()
+        key = fingerprint(rows, kind, tolerance)
+        num_equations = len(rows)
+        num_variables = len(coefficients[0])
+        zero = convert(0)
+
+        col, r = 0, 0
+        permutation = list(range(num_equations))
+        state = self.load(key)
+        if state is not None:
+            col, r, permutation = state['column'], state['row'], state['permutation']
+            rows = [[convert(x) for x in row] for row in state['finished']]
+            rows += [[zero] * col + [convert(x) for x in row] for row in state['trailing']]
+            self.stats.resumed_from_column = col
+
+        def checkpoint():
+            self.save({
+                'version': VERSION,
+                'kind': kind,
+                'fingerprint': key,
+                'column': col,
+                'row': r,
+                'permutation': permutation,
+                'finished': [[str(x) for x in row] for row in rows[:r]],
+                'trailing': [[str(x) for x in row[col:]] for row in rows[r:]],
+            })
+
+        started = last_checkpoint = time.perf_counter()
+        columns_since = 0
+        while col < num_variables and r < num_equations - 1:
+            pivot = elimination_step(rows, col, r, tolerance)
+            if pivot is not None:
+                permutation[r], permutation[pivot] = permutation[pivot], permutation[r]
+                r += 1
+            col += 1
+            columns_since += 1
+
+            now = time.perf_counter()
+            out_of_time = time_budget is not None and now - started >= time_budget
+            due = (columns_since >= self.every_columns or
+                   (self.every_seconds is not None and now - last_checkpoint >= self.every_seconds))
+            if (due or out_of_time) and col < num_variables and r < num_equations - 1:
+                self.stats.elimination_seconds += now - last_checkpoint
+                checkpoint()
+                last_checkpoint = time.perf_counter()
+                columns_since = 0
+                if out_of_time:
+                    self.permutation = permutation
+                    return None
+
+        self.stats.elimination_seconds += time.perf_counter() - last_checkpoint
+        self.permutation = permutation
+        if not self.keep and os.path.exists(self.path):
+            os.remove(self.path)
+        return [row[:-1] for row in rows], [row[-1] for row in rows]
+
+    def solve(self, system, constants=None, time_budget=None):
+        # Back substitution on the resumable triangular form. Returns the
+        # exact solution values, like LUFactorization.solve, or None when
+        # the time budget ran out; call again to continue.
+        result = self.triangular_form(system, constants, time_budget)
+        if result is None:
+            return None
+
+        from .linsys import LinearSystem
+        rows, row_constants = result
+        tolerance = self.tolerance if self.tolerance is not None else current_tolerance()
+        n = len(rows[0])
+        for row, c in zip(rows, row_constants):
+            if all(abs(a) < tolerance for a in row) and abs(c) >= tolerance:
+                raise Exception(LinearSystem.NO_SOLUTIONS_MSG)
+        if len(rows) < n or any(abs(rows[i][i]) < tolerance for i in range(n)):
+            raise Exception(LinearSystem.NO_UNIQUE_SOLUTION_MSG)
+
+        x = [None] * n
+        for i in range(n - 1, -1, -1):
+            row = rows[i]
+            x[i] = (row_constants[i] - sum(row[j] * x[j] for j in range(i + 1, n))) / row[i]
+        return x
+
+
+"""
+from fractions import Fraction
+import random
+
+rng = random.Random(0)
+a = [[Fraction(rng.randint(-9, 9)) for _ in range(40)] for _ in range(40)]
+b = [Fraction(rng.randint(-9, 9)) for _ in range(40)]
+
+eliminator = CheckpointedEliminator('solve.ckpt', every_columns=8)
+while eliminator.solve(a, b, time_budget=0.05) is None:
+    print('pre-empted, resuming')
+print(eliminator.stats.as_dict())
+"""
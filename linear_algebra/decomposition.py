@@ -0,0 +1,220 @@
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from .vector import Vector
+from .plane import Plane
+from .precision import current_settings, local_precision
+
+
+class Block(object):
+
+    def __init__(self, equations, variables):
+        self.equations = equations
+        self.variables = variables
+
+    def __len__(self):
+        return len(self.variables)
+
+
+class BlockDecomposition(object):
+
+    NO_SOLUTIONS_MSG = 'No solutions'
+    NO_UNIQUE_SOLUTION_MSG = 'No unique solution'
+
+    def __init__(self, coefficients, constants, ordering='components'):
+        # ordering='components' splits the equation-variable graph into
+        # connected components, which share no variable and can be solved
+        # independently. ordering='triangular' further splits each
+        # component into the strongly connected blocks of its
+        # block-triangular form, to be solved in order.
+        self.coefficients = coefficients
+        self.constants = constants
+        self.num_variables = len(coefficients[0])
+
+        for row, c in zip(coefficients, constants):
+            if all(a == 0 for a in row) and c != 0:
+                raise Exception(self.NO_SOLUTIONS_MSG)
+        self.rows = [[j for j, a in enumerate(row) if a != 0] for row in coefficients]
+
+        self.components = self.connected_components()
+        for block in self.components:
+            if len(block.equations) != len(block.variables):
+                raise Exception(self.NO_UNIQUE_SOLUTION_MSG)
+
+        # stages[k] is the list of blocks of component k in solve order
+        if ordering == 'triangular':
+            self.stages = [self.triangular_blocks(block) for block in self.components]
+        else:
+            self.stages = [[block] for block in self.components]
+
+    def connected_components(self):
+        # Union-find over variables; each equation joins its variables
+        parent = list(range(self.num_variables))
+
+        def find(v):
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            return v
+
+        for row in self.rows:
+            for v in row[1:]:
+                a, b = find(row[0]), find(v)
+                if a != b:
+                    parent[a] = b
+
+        equations = {}
+        for e, row in enumerate(self.rows):
+            if row:
+                equations.setdefault(find(row[0]), []).append(e)
+        variables = {}
+        for v in range(self.num_variables):
+            variables.setdefault(find(v), []).append(v)
+
+        return [Block(equations.get(root, []), vs) for root, vs in variables.items()]
+
+    def triangular_blocks(self, block):
+        # Match every variable to an equation (augmenting paths), then the
+        # strongly connected components of "equation e uses a variable
+        # matched to equation f" come out of Tarjan's algorithm with every
+        # block after the blocks it depends on
+        match = {}      # variable -> equation
+
+        for e in block.equations:
+            seen = set()
+            stack = [(e, iter(self.rows[e]))]
+            path = []
+            while stack:
+                eq, options = stack[-1]
+                advanced = False
+                for v in options:
+                    if v in seen:
+                        continue
+                    seen.add(v)
+                    path.append((eq, v))
+                    if v not in match:
+                        for pe, pv in path:
+                            match[pv] = pe
+                        stack = []
+                    else:
+                        stack.append((match[v], iter(self.rows[match[v]])))
+                    advanced = True
+                    break
+                if not advanced:
+                    stack.pop()
+                    if path:
+                        path.pop()
+            if not any(match.get(v) == e for v in self.rows[e]):
+                raise Exception(self.NO_UNIQUE_SOLUTION_MSG)
+
+        matched_variable = dict((e, v) for v, e in match.items())
+        depends_on = dict((e, [match[v] for v in self.rows[e] if match[v] != e])
+                          for e in block.equations)
+
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        order = []
+        counter = 0
+        for root in block.equations:
+            if root in index:
+                continue
+            work = [(root, iter(depends_on[root]))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                e, successors = work[-1]
+                pushed = False
+                for f in successors:
+                    if f not in index:
+                        index[f] = low[f] = counter
+                        counter += 1
+                        stack.append(f)
+                        on_stack.add(f)
+                        work.append((f, iter(depends_on[f])))
+                        pushed = True
+                        break
+                    if f in on_stack:
+                        low[e] = min(low[e], index[f])
+                if pushed:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[e])
+                if low[e] == index[e]:
+                    equations = []
+                    while True:
+                        f = stack.pop()
+                        on_stack.discard(f)
+                        equations.append(f)
+                        if f == e:
+                            break
+                    order.append(Block(sorted(equations),
+                                       sorted(matched_variable[f] for f in equations)))
+        return order
+
+    def __str__(self):
+        sizes = [[len(b) for b in stage] for stage in self.stages]
+        return '{} independent components, block sizes {}'.format(len(self.stages), sizes)
+
+
+def solve_stage(stage, coefficients, constants, precision, tolerance):
+    # Solves the blocks of one component in order, substituting values
+    # found by earlier blocks. Module level so a ProcessPoolExecutor can
+    # run it too.
+    from .linsys import LinearSystem
+
+    with local_precision(precision, tolerance):
+        known = {}
+        for block in stage:
+            planes = []
+            for e in block.equations:
+                row = coefficients[e]
+                c = constants[e] - sum(row[v] * known[v] for v in known if row[v] != 0)
+                planes.append(Plane(Vector([row[v] for v in block.variables]), c))
+            solution = LinearSystem(planes).solve().solution
+            known.update(zip(block.variables, solution))
+        return known
+
+
+def solve_decomposed(system, executor=None, ordering='components'):
+    # Solves every independent component concurrently on executor (a
+    # thread pool by default; pass a ProcessPoolExecutor to sidestep the
+    # GIL) and stitches the pieces back into one solution
+    from .linsys import SolveReport
+
+    coefficients, constants = system.matrix_form()
+    decomposition = BlockDecomposition(coefficients, constants, ordering)
+    precision, tolerance = current_settings()
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor()
+    try:
+        futures = [executor.submit(solve_stage, stage, coefficients, constants, precision, tolerance)
+                   for stage in decomposition.stages]
+        x = [Decimal(0)] * decomposition.num_variables
+        for future in futures:
+            for v, value in future.result().items():
+                x[v] = value
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    residual = max(abs(c - sum(a * xj for a, xj in zip(row, x)))
+                   for row, c in zip(coefficients, constants))
+    return SolveReport(Vector(x), 'blocks', residual=residual, structure=decomposition)
+
+
+"""
+s = LinearSystem([Plane(Vector(['2', '0', '1', '0']), '3'),
+                  Plane(Vector(['0', '1', '0', '0']), '2'),
+                  Plane(Vector(['1', '0', '1', '0']), '2'),
+                  Plane(Vector(['0', '3', '0', '1']), '7')])
+print(solve_decomposed(s))
+print(solve_decomposed(s, ordering='triangular'))
+"""
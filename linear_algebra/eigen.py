@@ -0,0 +1,260 @@
+import random
+from math import copysign, hypot, sqrt
+
+from .vector import Vector
+from .lu import LUFactorization
+
+
+class LinearOperator(object):
+
+    NOT_SQUARE_MSG = 'Eigenvalues need a square matrix'
+
+    def __init__(self, matvec, dimension):
+        # matvec maps a list of floats to the list A x
+        self.matvec = matvec
+        self.dimension = dimension
+
+    @classmethod
+    def from_matrix(cls, A):
+        # A LinearOperator, anything with matvec() and dimension, a
+        # LinearSystem, dense rows, or sparse rows given as dicts
+        # {column: value}. Only nonzero entries are kept.
+        if isinstance(A, cls):
+            return A
+        if hasattr(A, 'matvec'):
+            return cls(lambda x: list(A.matvec(x)), A.dimension)
+        if hasattr(A, 'matrix_form'):
+            A = A.matrix_form()[0]
+
+        rows = []
+        for row in A:
+            items = row.items() if isinstance(row, dict) else enumerate(row)
+            rows.append([(j, float(a)) for j, a in items if a != 0])
+        n = len(rows)
+        for row in rows:
+            if row and max(j for j, _ in row) >= n:
+                raise Exception(cls.NOT_SQUARE_MSG)
+        return cls(lambda x: [sum(a * x[j] for j, a in row) for row in rows], n)
+
+    def dense(self):
+        # Column by column from unit vectors; only needed to factor
+        n = self.dimension
+        columns = []
+        for j in range(n):
+            e = [0.0] * n
+            e[j] = 1.0
+            columns.append(self.matvec(e))
+        return [[columns[j][i] for j in range(n)] for i in range(n)]
+
+
+class EigenResult(object):
+
+    def __init__(self, eigenvalue, eigenvector, iterations, residual, converged):
+        self.eigenvalue = eigenvalue
+        self.eigenvector = eigenvector
+        self.iterations = iterations
+        self.residual = residual
+        self.converged = converged
+
+    def __str__(self):
+        return 'eigenvalue {} (iterations={}, residual={}, converged={})\n{}'.format(
+            self.eigenvalue, self.iterations, self.residual, self.converged, self.eigenvector)
+
+
+def dot(u, v):
+    return sum(a * b for a, b in zip(u, v))
+
+
+def normalized(x):
+    # Same idea as Vector.normalized, on plain floats
+    magnitude = sqrt(dot(x, x))
+    if magnitude == 0:
+        raise Exception(Vector.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+    return [a / magnitude for a in x]
+
+
+def start_vector(x0, n):
+    # A fixed pseudo-random start is unlikely to be orthogonal to the
+    # wanted eigenvector, unlike all ones on many graph matrices
+    if x0 is not None:
+        return normalized([float(a) for a in x0])
+    rng = random.Random(0)
+    return normalized([rng.uniform(0.5, 1.5) for _ in range(n)])
+
+
+def residual_of(A, x, eigenvalue, ax=None):
+    ax = ax if ax is not None else A.matvec(x)
+    r = [a - eigenvalue * b for a, b in zip(ax, x)]
+    return sqrt(dot(r, r))
+
+
+def power_iteration(A, x0=None, shift=0.0, tolerance=1e-10, max_iterations=1000):
+    # Dominant eigenpair. Converged when ||A x - lambda x|| is below
+    # tolerance * |lambda|. The iteration runs on A + shift I, which has
+    # the same eigenvectors: when A has eigenvalues lambda and -lambda, as
+    # the adjacency matrix of every bipartite graph (trees, paths, grids)
+    # does, plain iteration oscillates forever, and a positive shift makes
+    # lambda the unique dominant one. The eigenvalue reported is of A.
+    A = LinearOperator.from_matrix(A)
+    x = start_vector(x0, A.dimension)
+    eigenvalue = 0.0
+    residual = float('inf')
+
+    for k in range(1, max_iterations + 1):
+        ax = A.matvec(x)
+        eigenvalue = dot(x, ax)
+        residual = residual_of(A, x, eigenvalue, ax)
+        if residual <= tolerance * max(abs(eigenvalue), 1e-300):
+            return EigenResult(eigenvalue, Vector(x), k, residual, True)
+        if shift:
+            ax = [a + shift * b for a, b in zip(ax, x)]
+        x = normalized(ax)
+
+    return EigenResult(eigenvalue, Vector(x), max_iterations, residual, False)
+
+
+def inverse_iteration(A, shift=0.0, x0=None, factorization=None, tolerance=1e-10, max_iterations=100):
+    # Eigenpair with eigenvalue closest to shift. (A - shift I) is
+    # factored once; pass factorization to reuse an existing
+    # LUFactorization of exactly that matrix (with shift=0, of A itself).
+    A = LinearOperator.from_matrix(A)
+    n = A.dimension
+    if factorization is None:
+        shifted = A.dense()
+        for i in range(n):
+            shifted[i][i] -= shift
+        factorization = LUFactorization(shifted, tolerance=1e-300)
+
+    x = start_vector(x0, n)
+    eigenvalue = shift
+    residual = float('inf')
+
+    for k in range(1, max_iterations + 1):
+        x = normalized(factorization.solve(x))
+        ax = A.matvec(x)
+        eigenvalue = dot(x, ax)
+        residual = residual_of(A, x, eigenvalue, ax)
+        if residual <= tolerance * max(abs(eigenvalue), 1.0):
+            return EigenResult(eigenvalue, Vector(x), k, residual, True)
+
+    return EigenResult(eigenvalue, Vector(x), max_iterations, residual, False)
+
+
+def tridiagonal_eigen(diagonal, off_diagonal):
+    # Implicit QL on a symmetric tridiagonal matrix. Returns the
+    # eigenvalues and the matrix whose columns are the eigenvectors.
+    n = len(diagonal)
+    d = [float(a) for a in diagonal]
+    e = [float(a) for a in off_diagonal] + [0.0]
+    z = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+    for l in range(n):
+        iterations = 0
+        while True:
+            m = l
+            while m < n - 1:
+                dd = abs(d[m]) + abs(d[m + 1])
+                if abs(e[m]) <= 1e-15 * dd:
+                    break
+                m += 1
+            if m == l:
+                break
+
+            iterations += 1
+            if iterations > 60:
+                raise Exception('Tridiagonal eigenvalues did not converge')
+
+            g = (d[l + 1] - d[l]) / (2.0 * e[l])
+            r = hypot(g, 1.0)
+            g = d[m] - d[l] + e[l] / (g + copysign(r, g))
+            s = c = 1.0
+            p = 0.0
+            deflated = False
+            for i in range(m - 1, l - 1, -1):
+                f = s * e[i]
+                b = c * e[i]
+                r = hypot(f, g)
+                e[i + 1] = r
+                if r == 0.0:
+                    d[i + 1] -= p
+                    e[m] = 0.0
+                    deflated = True
+                    break
+                s = f / r
+                c = g / r
+                g = d[i + 1] - p
+                r = (d[i] - g) * s + 2.0 * c * b
+                p = s * r
+                d[i + 1] = g + p
+                g = c * r - b
+                for row in z:
+                    f = row[i + 1]
+                    row[i + 1] = s * row[i] + c * f
+                    row[i] = c * row[i] - s * f
+            if deflated:
+                continue
+            d[l] -= p
+            e[l] = g
+            e[m] = 0.0
+
+    return d, z
+
+
+def lanczos(A, count=1, which='largest', x0=None, tolerance=1e-10, max_iterations=None):
+    # The count largest (or smallest) eigenpairs of a symmetric A. The
+    # Krylov basis is fully reorthogonalized, which costs O(n k) per step
+    # but keeps the Ritz values free of spurious copies.
+    A = LinearOperator.from_matrix(A)
+    n = A.dimension
+    max_iterations = min(max_iterations or n, n)
+
+    q = start_vector(x0, n)
+    basis = [q]
+    alphas = []
+    betas = []
+    previous = None
+
+    for j in range(1, max_iterations + 1):
+        w = A.matvec(basis[-1])
+        alpha = dot(w, basis[-1])
+        alphas.append(alpha)
+        w = [a - alpha * b for a, b in zip(w, basis[-1])]
+        if previous is not None:
+            w = [a - betas[-1] * b for a, b in zip(w, previous)]
+        for qi in basis:
+            weight = dot(w, qi)
+            w = [a - weight * b for a, b in zip(w, qi)]
+        beta = sqrt(dot(w, w))
+
+        theta, s = tridiagonal_eigen(alphas, betas)
+        order = sorted(range(j), key=lambda i: theta[i], reverse=(which == 'largest'))[:count]
+        # The residual of Ritz pair i is beta times the last component
+        # of its eigenvector in T
+        residuals = [abs(beta * s[j - 1][i]) for i in order]
+        done = (j >= count and all(r <= tolerance * max(abs(theta[i]), 1.0)
+                                   for r, i in zip(residuals, order)))
+        if done or beta == 0 or j == max_iterations:
+            results = []
+            for r, i in zip(residuals, order):
+                x = [sum(s[k][i] * basis[k][m] for k in range(j)) for m in range(n)]
+                results.append(EigenResult(theta[i], Vector(x), j, r,
+                                           r <= tolerance * max(abs(theta[i]), 1.0)))
+            return results
+
+        betas.append(beta)
+        previous = basis[-1]
+        basis.append([a / beta for a in w])
+
+
+"""
+# Centrality of a small undirected graph from its adjacency rows
+A = [{1: 1, 2: 1}, {0: 1, 2: 1, 3: 1}, {0: 1, 1: 1}, {1: 1}]
+print(power_iteration(A))
+
+# A path is bipartite, so its spectrum is symmetric and needs a shift
+path = [{1: 1}, {0: 1, 2: 1}, {1: 1}]
+print(power_iteration(path, shift=1.0))
+print(inverse_iteration(A, shift=-1.6))
+for r in lanczos(A, count=2):
+    print(r)
+"""
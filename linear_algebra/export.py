@@ -0,0 +1,165 @@
+import csv
+from decimal import Decimal
+
+from .precision import current_tolerance
+
+
+class EquationWriter(object):
+
+    UNKNOWN_FORMAT_MSG = 'Unknown format {}'
+    FORMATS = ('text', 'latex', 'csv')
+
+    def __init__(self, f, format='text', num_decimal_places=3, batch_size=1024, cache_entries=4096):
+        # Rows are formatted a batch at a time and written straight to f,
+        # so the whole system is never held as one string
+        if format not in self.FORMATS:
+            raise Exception(self.UNKNOWN_FORMAT_MSG.format(format))
+        self.f = f
+        self.format = format
+        self.num_decimal_places = num_decimal_places
+        self.batch_size = batch_size
+        # Each distinct coefficient is rounded and formatted once. The
+        # caches are emptied when they reach cache_entries, so a stream of
+        # all-distinct values costs bounded memory and the common case of
+        # few distinct values stays a plain dict lookup.
+        self.cache_entries = cache_entries
+        self.coefficients = {}
+        self.constants = {}
+        self.count = 0
+
+    def rounded(self, value):
+        value = round(Decimal(value), self.num_decimal_places)
+        if value % 1 == 0:
+            value = int(value)
+        return value
+
+    def coefficient(self, value):
+        # (sign, magnitude text) as in Line.__str__ and Plane.__str__:
+        # sign is -1, 0 or 1 after rounding, a magnitude of 1 is not written
+        token = self.coefficients.get(value)
+        if token is None:
+            c = self.rounded(value)
+            sign = (c > 0) - (c < 0)
+            text = '' if abs(c) == 1 else '{}'.format(abs(c))
+            token = (sign, text)
+            if len(self.coefficients) >= self.cache_entries:
+                self.coefficients.clear()
+            self.coefficients[value] = token
+        return token
+
+    def constant(self, value):
+        text = self.constants.get(value)
+        if text is None:
+            text = '{}'.format(self.rounded(value))
+            if len(self.constants) >= self.cache_entries:
+                self.constants.clear()
+            self.constants[value] = text
+        return text
+
+    def equation(self, coefficients, constant):
+        eps = current_tolerance()
+        terms = []
+        initial = True
+        for i, a in enumerate(coefficients):
+            if initial and abs(a) < eps:
+                continue
+            sign, text = self.coefficient(a)
+            if initial:
+                # The first coefficient that is not near zero starts the
+                # equation even when it rounds away
+                initial = False
+                if sign == 0:
+                    continue
+                terms.append(('-' if sign < 0 else '') + text + self.variable(i))
+            elif sign != 0:
+                terms.append(('+ ' if sign > 0 else '- ') + text + self.variable(i))
+
+        lhs = ' '.join(terms) if not initial else '0'
+        if self.format == 'latex':
+            return '{} &= {}'.format(lhs, self.constant(constant))
+        return '{} = {}'.format(lhs, self.constant(constant))
+
+    def variable(self, i):
+        if self.format == 'latex':
+            return 'x_{{{}}}'.format(i + 1)
+        return 'x_{}'.format(i + 1)
+
+    def rows(self, equations, constants=None):
+        # A LinearSystem or a sequence of Lines/Planes, or coefficient rows
+        # when constants holds the right hand side
+        if constants is not None:
+            return zip(equations, constants)
+        if hasattr(equations, 'planes'):
+            equations = equations.planes
+        return ((e.normal_vector.coordinates, e.constant_term) for e in equations)
+
+    def write_system(self, equations, constants=None):
+        rows = self.rows(equations, constants)
+        if self.format == 'csv':
+            return self.write_csv(rows)
+
+        if self.format == 'text':
+            # Same layout as LinearSystem.__str__
+            self.f.write('Linear System:')
+            line = '\nEquation {}: {}'
+        else:
+            self.f.write('\\begin{align*}')
+            line = '\n{1} \\\\'
+
+        batch = []
+        for coefficients, constant in rows:
+            self.count += 1
+            batch.append(line.format(self.count, self.equation(coefficients, constant)))
+            if len(batch) == self.batch_size:
+                self.f.write(''.join(batch))
+                batch = []
+        self.f.write(''.join(batch))
+
+        if self.format == 'latex':
+            self.f.write('\n\\end{align*}\n')
+
+    def write_csv(self, rows):
+        # Full precision values, one equation per row
+        writer = csv.writer(self.f)
+        header_written = False
+        batch = []
+        for coefficients, constant in rows:
+            if not header_written:
+                writer.writerow(['x_{}'.format(i + 1) for i in range(len(coefficients))] + ['constant'])
+                header_written = True
+            self.count += 1
+            batch.append([str(a) for a in coefficients] + [str(constant)])
+            if len(batch) == self.batch_size:
+                writer.writerows(batch)
+                batch = []
+        writer.writerows(batch)
+
+
+def benchmark_against_str(system, repeat=3):
+    # Best times of str(system) and of EquationWriter into a StringIO,
+    # plus whether both produced the same text
+    import io
+    from .profiling import best_time
+
+    def write():
+        buf = io.StringIO()
+        EquationWriter(buf).write_system(system)
+        return buf.getvalue()
+
+    str_time = best_time(lambda: str(system), repeat)
+    writer_time = best_time(write, repeat)
+    return {'str_sec': str_time, 'writer_sec': writer_time,
+            'speedup': str_time / writer_time, 'identical': str(system) == write()}
+
+
+if __name__ == '__main__':
+    import random
+    from .vector import Vector
+    from .plane import Plane
+    from .linsys import LinearSystem
+
+    rng = random.Random(0)
+    values = ['0', '1', '-1', '2', '0.5', '-3.25', '1.0004']
+    system = LinearSystem([Plane(Vector([rng.choice(values) for _ in range(3)]), rng.choice(values))
+                           for _ in range(10000)])
+    print(benchmark_against_str(system))
@@ -0,0 +1,203 @@
+from math import sqrt
+from operator import mul
+
+from .plane import equation_terms
+
+
+class Classification(object):
+
+    def __init__(self, count):
+        # Bit j of negative[i], on_plane[i] or positive[i] is set when point
+        # i is below, on (within tolerance) or above equation j; inside[i]
+        # is True when no equation has point i on its outer side
+        self.count = count
+        self.negative = []
+        self.on_plane = []
+        self.positive = []
+        self.inside = []
+
+    def side(self, i, j):
+        bit = 1 << j
+        if self.positive[i] & bit:
+            return 1
+        if self.negative[i] & bit:
+            return -1
+        return 0
+
+    def sides(self, i):
+        return [self.side(i, j) for j in range(self.count)]
+
+    def __len__(self):
+        return len(self.inside)
+
+
+class HalfSpaceClassifier(object):
+
+    ZERO_NORMAL_MSG = 'Cannot classify against an equation whose normal vector is zero'
+    DIMENSION_MISMATCH_MSG = 'Points must have dimension {}'
+
+    def __init__(self, equations, tolerance=1e-10, normalize=True, inside=-1, block_size=256):
+        # equations are Lines, Planes or (normal_vector, constant_term)
+        # pairs, unpacked once to floats. With normalize each one is
+        # rescaled to a unit normal, so values are true signed distances
+        # and tolerance is a distance. The polytope is the intersection of
+        # the half-spaces n.x <= c (inside=-1) or n.x >= c (inside=1).
+        self.tolerance = tolerance
+        self.block_size = block_size
+        self.normals = []
+        self.constants = []
+
+        for e in equations:
+            n, c = equation_terms(e)
+            n = [float(x) for x in n]
+            c = float(c)
+            magnitude = sqrt(sum(x * x for x in n))
+            if magnitude == 0:
+                raise Exception(self.ZERO_NORMAL_MSG)
+            if normalize:
+                n = [x / magnitude for x in n]
+                c = c / magnitude
+            self.normals.append(n)
+            self.constants.append(c)
+
+        self.count = len(self.normals)
+        self.dimension = len(self.normals[0]) if self.normals else 0
+        # The outer side of every equation, as a sign the inner loops can
+        # compare against directly
+        self.outside = -inside
+
+    def __len__(self):
+        return self.count
+
+    def unpack(self, points):
+        block = [[float(x) for x in p] for p in points]
+        for p in block:
+            if len(p) != self.dimension:
+                raise Exception(self.DIMENSION_MISMATCH_MSG.format(self.dimension))
+        return block
+
+    def point_blocks(self, points):
+        block = []
+        for p in points:
+            block.append(p)
+            if len(block) == self.block_size:
+                yield self.unpack(block)
+                block = []
+        if block:
+            yield self.unpack(block)
+
+    def distance_block(self, block):
+        # Row i holds n_j.x_i - c_j for every equation j. One comprehension
+        # per equation over the whole block keeps the inner loop in C; the
+        # common 2D and 3D cases are unrolled.
+        columns = []
+        if self.dimension == 2:
+            for (a, b), c in zip(self.normals, self.constants):
+                columns.append([a * x + b * y - c for x, y in block])
+        elif self.dimension == 3:
+            for (a, b, d), c in zip(self.normals, self.constants):
+                columns.append([a * x + b * y + d * z - c for x, y, z in block])
+        else:
+            for n, c in zip(self.normals, self.constants):
+                columns.append([sum(map(mul, n, p)) - c for p in block])
+        return [list(row) for row in zip(*columns)] if columns else [[] for _ in block]
+
+    def signed_distances(self, points):
+        # Yields the N x M signed distance matrix one row per point,
+        # computed a block of points at a time so N can be a stream
+        for block in self.point_blocks(points):
+            for row in self.distance_block(block):
+                yield row
+
+    def classify(self, points):
+        result = Classification(self.count)
+        tolerance = self.tolerance
+        outside = self.outside
+        for row in self.signed_distances(points):
+            negative = on_plane = positive = 0
+            bit = 1
+            for value in row:
+                if value > tolerance:
+                    positive |= bit
+                elif value < -tolerance:
+                    negative |= bit
+                else:
+                    on_plane |= bit
+                bit <<= 1
+            result.negative.append(negative)
+            result.on_plane.append(on_plane)
+            result.positive.append(positive)
+            result.inside.append(not (positive if outside > 0 else negative))
+        return result
+
+    def first_violated(self, point, start=0):
+        # Index of the first equation with point (a list of floats) on its
+        # outer side, testing from start and wrapping around, or None when
+        # the point is inside
+        tolerance = self.tolerance
+        outside = self.outside
+        for k in range(self.count):
+            j = (start + k) % self.count
+            if outside * (sum(map(mul, self.normals[j], point)) - self.constants[j]) > tolerance:
+                return j
+        return None
+
+    def contains(self, points):
+        # Polytope membership with an early exit per point: a point is
+        # rejected by the first constraint it violates. Nearby points tend
+        # to violate the same constraint, so each point starts from the
+        # one that rejected the previous point.
+        result = []
+        start = 0
+        for block in self.point_blocks(points):
+            for p in block:
+                j = self.first_violated(p, start)
+                if j is None:
+                    result.append(True)
+                else:
+                    result.append(False)
+                    start = j
+        return result
+
+
+def benchmark(num_points=2000, num_planes=50, repeat=3, seed=0):
+    # Classifies random points against the faces of a random polytope,
+    # compared with one Vector.dot per point and plane on Decimals
+    import random
+    from .vector import Vector
+    from .plane import Plane
+    from .profiling import best_time
+
+    rng = random.Random(seed)
+    planes = []
+    for _ in range(num_planes):
+        n = [rng.gauss(0, 1) for _ in range(3)]
+        planes.append(Plane(Vector(n), sqrt(sum(x * x for x in n))))
+    points = [Vector([rng.uniform(-2, 2) for _ in range(3)]) for _ in range(num_points)]
+
+    def vector_dot():
+        return [[p.normal_vector.dot(x) - p.constant_term for p in planes] for x in points]
+
+    classifier = HalfSpaceClassifier(planes, normalize=False)
+    return {
+        'vector_dot_sec': best_time(vector_dot, repeat),
+        'classify_sec': best_time(lambda: classifier.classify(points), repeat),
+        'contains_sec': best_time(lambda: classifier.contains(points), repeat),
+    }
+
+
+"""
+from linear_algebra.plane import Plane
+from linear_algebra.vector import Vector
+
+# The unit cube as six half-spaces n.x <= c
+cube = [Plane(Vector(n), c) for n, c in [
+    ([1, 0, 0], 1), ([-1, 0, 0], 0), ([0, 1, 0], 1),
+    ([0, -1, 0], 0), ([0, 0, 1], 1), ([0, 0, -1], 0)]]
+classifier = HalfSpaceClassifier(cube)
+points = [[0.5, 0.5, 0.5], [1, 0.5, 0.5], [2, 0, 0]]
+c = classifier.classify(points)
+print(c.inside, [c.sides(i) for i in range(len(c))])
+print(classifier.contains(points))
+print(benchmark())
+"""
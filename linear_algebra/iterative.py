@@ -0,0 +1,167 @@
+from math import sqrt
+
+from .vector import Vector
+
+
+class IterativeResult(object):
+
+    def __init__(self, solution, iterations, residual_history, converged, method):
+        self.solution = Vector(solution)
+        self.iterations = iterations
+        self.residual_history = residual_history
+        self.converged = converged
+        self.method = method
+
+    def __str__(self):
+        residual = self.residual_history[-1] if self.residual_history else None
+        return '{}: converged={}, iterations={}, residual={}\n{}'.format(
+            self.method, self.converged, self.iterations, residual, self.solution)
+
+
+class IterativeSolver(object):
+
+    NOT_SQUARE_MSG = 'Iterative solvers need as many equations as variables'
+    ZERO_DIAGONAL_MSG = 'Zero on the diagonal in row {}'
+    NOT_POSITIVE_DEFINITE_MSG = 'The matrix is not symmetric positive definite'
+    UNKNOWN_PRECONDITIONER_MSG = 'Unknown preconditioner {}'
+
+    def __init__(self, system, constants=None, tolerance=1e-10, max_iterations=1000):
+        # system is either a LinearSystem or a list of coefficient rows,
+        # in which case constants holds the right hand side
+        if constants is None:
+            coefficients, constants = system.matrix_form()
+        else:
+            coefficients = system
+
+        self.dimension = len(coefficients)
+        if len(constants) != self.dimension:
+            raise Exception(self.NOT_SQUARE_MSG)
+        for row in coefficients:
+            if len(row) != self.dimension:
+                raise Exception(self.NOT_SQUARE_MSG)
+
+        # Only the nonzero entries are kept so sparse systems stay cheap
+        self.rows = [[(j, float(a)) for j, a in enumerate(row) if a != 0]
+                     for row in coefficients]
+        self.constants = [float(c) for c in constants]
+        self.diagonal = [float(row[i]) for i, row in enumerate(coefficients)]
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+        self.constants_norm = sqrt(sum(c * c for c in self.constants)) or 1.0
+
+    def check_diagonal(self):
+        for i, d in enumerate(self.diagonal):
+            if d == 0:
+                raise Exception(self.ZERO_DIAGONAL_MSG.format(i))
+
+    def initial_guess(self, x0):
+        if x0 is None:
+            return [0.0] * self.dimension
+        return [float(x) for x in x0]
+
+    def times(self, x):
+        return [sum(a * x[j] for j, a in row) for row in self.rows]
+
+    def relative_residual(self, x):
+        r = [c - ax for c, ax in zip(self.constants, self.times(x))]
+        return sqrt(sum(e * e for e in r)) / self.constants_norm
+
+    def jacobi(self, x0=None):
+        self.check_diagonal()
+        x = self.initial_guess(x0)
+        history = [self.relative_residual(x)]
+
+        iterations = 0
+        while history[-1] >= self.tolerance and iterations < self.max_iterations:
+            x = [(c - sum(a * x[j] for j, a in row if j != i)) / d
+                 for i, (row, c, d) in enumerate(zip(self.rows, self.constants, self.diagonal))]
+            history.append(self.relative_residual(x))
+            iterations += 1
+
+        return IterativeResult(x, iterations, history, history[-1] < self.tolerance, 'jacobi')
+
+    def gauss_seidel(self, x0=None, omega=1.0):
+        # omega == 1 is plain Gauss-Seidel, 1 < omega < 2 over-relaxes (SOR)
+        self.check_diagonal()
+        x = self.initial_guess(x0)
+        history = [self.relative_residual(x)]
+
+        iterations = 0
+        while history[-1] >= self.tolerance and iterations < self.max_iterations:
+            for i, (row, c, d) in enumerate(zip(self.rows, self.constants, self.diagonal)):
+                sigma = sum(a * x[j] for j, a in row if j != i)
+                x[i] = (1 - omega) * x[i] + omega * (c - sigma) / d
+            history.append(self.relative_residual(x))
+            iterations += 1
+
+        method = 'gauss_seidel' if omega == 1.0 else 'sor'
+        return IterativeResult(x, iterations, history, history[-1] < self.tolerance, method)
+
+    def conjugate_gradient(self, x0=None, preconditioner=None):
+        if preconditioner is None:
+            inverse_m = [1.0] * self.dimension
+        elif preconditioner == 'jacobi':
+            self.check_diagonal()
+            inverse_m = [1.0 / d for d in self.diagonal]
+        else:
+            raise Exception(self.UNKNOWN_PRECONDITIONER_MSG.format(preconditioner))
+
+        def dot(u, v):
+            return sum(a * b for a, b in zip(u, v))
+
+        x = self.initial_guess(x0)
+        r = [c - ax for c, ax in zip(self.constants, self.times(x))]
+        z = [m * e for m, e in zip(inverse_m, r)]
+        p = list(z)
+        rz = dot(r, z)
+        history = [sqrt(dot(r, r)) / self.constants_norm]
+
+        iterations = 0
+        while history[-1] >= self.tolerance and iterations < self.max_iterations:
+            ap = self.times(p)
+            pap = dot(p, ap)
+            if pap <= 0:
+                raise Exception(self.NOT_POSITIVE_DEFINITE_MSG)
+
+            alpha = rz / pap
+            x = [xi + alpha * pi for xi, pi in zip(x, p)]
+            r = [ri - alpha * api for ri, api in zip(r, ap)]
+            history.append(sqrt(dot(r, r)) / self.constants_norm)
+            iterations += 1
+
+            z = [m * e for m, e in zip(inverse_m, r)]
+            rz_next = dot(r, z)
+            beta = rz_next / rz
+            rz = rz_next
+            p = [zi + beta * pi for zi, pi in zip(z, p)]
+
+        method = 'conjugate_gradient' if preconditioner is None else 'pcg_jacobi'
+        return IterativeResult(x, iterations, history, history[-1] < self.tolerance, method)
+
+    def compare_methods(self, x0=None, omega=1.5):
+        # Runs every method from the same start so the fastest one for a
+        # workload can be picked by iteration count
+        results = [self.jacobi(x0), self.gauss_seidel(x0), self.gauss_seidel(x0, omega)]
+        try:
+            results.append(self.conjugate_gradient(x0))
+            results.append(self.conjugate_gradient(x0, preconditioner='jacobi'))
+        except Exception as e:
+            if str(e) != self.NOT_POSITIVE_DEFINITE_MSG:
+                raise e
+        return results
+
+
+"""
+s = IterativeSolver([[4, -1, 0], [-1, 4, -1], [0, -1, 4]], [15, 10, 10])
+print(s.jacobi())
+print(s.gauss_seidel())
+print(s.gauss_seidel(omega=1.1))
+print(s.conjugate_gradient(preconditioner='jacobi'))
+
+warm = s.gauss_seidel().solution
+print(s.conjugate_gradient(x0=warm).iterations)
+
+for r in s.compare_methods():
+    print('{}: {}'.format(r.method, r.iterations))
+"""
@@ -1,8 +1,7 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
 
-from vector import Vector
-
-getcontext().prec = 30
+from .vector import Vector
+from .precision import current_tolerance
 
 
 class Line(object):
@@ -153,7 +152,9 @@ class Line(object):
         return n1.is_parallel_to(n2)
 
 class MyDecimal(Decimal):
-    def is_near_zero(self, eps=1e-10):
+    def is_near_zero(self, eps=None):
+        if eps is None:
+            eps = current_tolerance()
         return abs(self) < eps
 
 """
@@ -0,0 +1,586 @@
+from decimal import Decimal
+from copy import deepcopy
+from functools import wraps
+
+from .vector import Vector
+from .plane import Plane
+from .lu import LUFactorization
+from .precision import current_tolerance, local_precision
+from .structure import MatrixStructure, BandedSolver, thomas_solve, triangular_solve
+
+
+class SolveReport(object):
+
+    def __init__(self, solution, method, iterations=0, residual=None, converged=True, structure=None):
+        self.solution = solution
+        self.method = method
+        self.iterations = iterations
+        self.residual = residual
+        self.converged = converged
+        self.structure = structure
+
+    def __str__(self):
+        output = '{}: converged={}, iterations={}, residual={}\n'.format(
+            self.method, self.converged, self.iterations, self.residual)
+        if self.structure is not None:
+            output += 'structure: {}\n'.format(self.structure)
+        return output + str(self.solution)
+
+
+class EliminationStep(object):
+
+    def __init__(self, operation, rows, coefficient=None, deltas=None):
+        # operation 'swap' exchanges rows[0] and rows[1]; 'add' adds
+        # coefficient times row rows[0] to row rows[1], changing that row
+        # by deltas: (column, change) pairs where column == number of
+        # variables stands for the constant term
+        self.operation = operation
+        self.rows = rows
+        self.coefficient = coefficient
+        self.deltas = deltas or []
+
+    def apply(self, coefficients, constants):
+        # Replays the step on coefficient rows and constants, in place
+        if self.operation == 'swap':
+            i, j = self.rows
+            coefficients[i], coefficients[j] = coefficients[j], coefficients[i]
+            constants[i], constants[j] = constants[j], constants[i]
+            return
+
+        row = coefficients[self.rows[1]]
+        for col, change in self.deltas:
+            if col == len(row):
+                constants[self.rows[1]] += change
+            else:
+                row[col] += change
+
+    def __str__(self):
+        if self.operation == 'swap':
+            return 'swap rows {} and {}'.format(*self.rows)
+        return 'add {} times row {} to row {}'.format(round(self.coefficient, 3), *self.rows)
+
+
+class Parametrization(object):
+
+    BASEPT_AND_DIR_VECTORS_MUST_BE_IN_SAME_DIM = 'The basepoint and direction vectors should all live in the same dimension'
+    WRONG_NUMBER_OF_PARAMETERS_MSG = 'Expected {} parameters'
+
+    def __init__(self, basepoint, direction_vectors):
+        self.basepoint = basepoint
+        self.direction_vectors = direction_vectors
+        self.dimension = self.basepoint.dimension
+
+        for v in direction_vectors:
+            if v.dimension != self.dimension:
+                raise Exception(self.BASEPT_AND_DIR_VECTORS_MUST_BE_IN_SAME_DIM)
+
+    def point(self, parameters):
+        # basepoint + t_1 * d_1 + ... + t_k * d_k
+        if len(parameters) != len(self.direction_vectors):
+            raise Exception(self.WRONG_NUMBER_OF_PARAMETERS_MSG.format(len(self.direction_vectors)))
+        coordinates = list(self.basepoint)
+        for t, d in zip(parameters, self.direction_vectors):
+            t = Decimal(t)
+            coordinates = [x + t * y for x, y in zip(coordinates, d)]
+        return Vector(coordinates)
+
+    def __str__(self):
+        output = ''
+        for coord in range(self.dimension):
+            output += 'x_{} = {}'.format(coord + 1, round(self.basepoint[coord], 3))
+            for free_var, vector in enumerate(self.direction_vectors):
+                output += ' + {} t_{}'.format(round(vector[coord], 3), free_var + 1)
+            output += '\n'
+        return output
+
+
+def in_system_precision(method):
+    # Runs a LinearSystem method under the system's own Decimal precision
+    # and tolerance, leaving the caller's context untouched
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with local_precision(self.precision, self.tolerance):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class LinearSystem(object):
+
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+    NO_UNIQUE_SOLUTION_MSG = 'No unique solution'
+
+    def __init__(self, planes, precision=None, tolerance=None):
+        # precision (Decimal digits) and tolerance (near-zero eps) apply
+        # to this system's solves only; None uses the caller's context
+        self.precision = precision
+        self.tolerance = tolerance
+        try:
+            d = planes[0].dimension
+            for p in planes:
+                assert p.dimension == d
+
+            self.planes = planes
+            self.dimension = d
+
+        except AssertionError:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+
+    def swap_rows(self, row1, row2):
+        temp = deepcopy(self.planes[row1])
+        self.planes[row1] = self.planes[row2]
+        self.planes[row2] = temp
+
+
+    def multiply_coefficient_and_row(self, coefficient, row):
+        #new_normal_vector = [x*coefficient for x in self.planes[row].normal_vector]
+        new_normal_vector = self.planes[row].normal_vector.times_scalar(coefficient)
+        self.planes[row] = Plane(new_normal_vector, self.planes[row].constant_term * coefficient)
+
+
+    def add_multiple_times_row_to_row(self, coefficient, row_to_add, row_to_be_added_to):
+        #new_normal = [x*coefficient for x in self.planes[row_to_add].normal_vector]
+        new_normal = self.planes[row_to_add].normal_vector.times_scalar(coefficient)
+        #print(str(type(new_normal)))
+        self.planes[row_to_be_added_to] = Plane(self.planes[row_to_be_added_to].normal_vector.plus(new_normal),
+                                                self.planes[row_to_be_added_to].constant_term +
+                                                  (self.planes[row_to_add].constant_term * coefficient))
+
+    def indices_of_first_nonzero_terms_in_each_row(self):
+        num_equations = len(self)
+        num_variables = self.dimension
+
+        indices = [-1] * num_equations
+
+        for i,p in enumerate(self.planes):
+            try:
+                indices[i] = p.first_nonzero_index(p.normal_vector)
+            except Exception as e:
+                if str(e) == Plane.NO_NONZERO_ELTS_FOUND_MSG:
+                    continue
+                else:
+                    raise e
+
+        return indices
+
+
+    def matrix_form(self):
+        coefficients = [list(p.normal_vector) for p in self.planes]
+        constants = [p.constant_term for p in self.planes]
+        return coefficients, constants
+
+
+    def __len__(self):
+        return len(self.planes)
+
+
+    def __getitem__(self, i):
+        return self.planes[i]
+
+
+    def __setitem__(self, i, x):
+        try:
+            assert x.dimension == self.dimension
+            self.planes[i] = x
+
+        except AssertionError:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+
+    def __str__(self):
+        ret = 'Linear System:\n'
+        temp = ['Equation {}: {}'.format(i+1,p) for i,p in enumerate(self.planes)]
+        ret += '\n'.join(temp)
+        return ret
+
+    """
+        Assumptions for Test Cases:
+        1. Swap with the topmost row below current row
+        2. Don't numtiply rows by numbers
+        3. Only add a multiple of a row to the rows underneath
+    """
+    @in_system_precision
+    def compute_triangular_form(self):
+        coefficients, constants = self.matrix_form()
+        for step in self.triangular_form_steps(coefficients, constants):
+            pass
+        planes = [Plane(Vector(row), c) for row, c in zip(coefficients, constants)]
+        return LinearSystem(planes, self.precision, self.tolerance)
+
+    def triangular_form_steps(self, coefficients=None, constants=None):
+        # Yields one EliminationStep per row operation as the elimination
+        # runs. The operations work on plain coefficient lists (the
+        # system's matrix form unless given), updated in place, so no
+        # step copies or formats the system. Each step is computed under
+        # the system's own precision and tolerance; the context is left
+        # between steps so the consumer runs under its own.
+        if coefficients is None:
+            coefficients, constants = self.matrix_form()
+
+        def steps():
+            end_row = len(coefficients) - 1
+
+            for start_row in range(0, len(coefficients)):
+                col = start_row
+                if start_row == end_row:
+                    return
+
+                if not Plane.first_nonzero_index(coefficients[start_row]) == col:
+                    ahead_row = start_row + 1
+                    while ahead_row <= end_row:
+                        if Plane.first_nonzero_index(coefficients[ahead_row]) == col:
+                            step = EliminationStep('swap', (start_row, ahead_row))
+                            step.apply(coefficients, constants)
+                            yield step
+                            break
+                        ahead_row = ahead_row + 1
+
+                    if ahead_row > end_row:
+                        raise Exception("No row with non zero index for col {}".format(col))
+
+                current = coefficients[start_row]
+                for ahead_row in range(start_row + 1, end_row + 1):
+                    coeff = (coefficients[ahead_row][col]/current[col]) * -1
+                    if not MyDecimal(coeff).is_near_zero():
+                        deltas = [(j, coeff * a) for j, a in enumerate(current) if a != 0]
+                        deltas.append((len(current), coeff * constants[start_row]))
+                        step = EliminationStep('add', (start_row, ahead_row), coeff, deltas)
+                        step.apply(coefficients, constants)
+                        yield step
+
+        pending = steps()
+        while True:
+            with local_precision(self.precision, self.tolerance):
+                step = next(pending, None)
+            if step is None:
+                return
+            yield step
+
+    @in_system_precision
+    def solve_mixed_precision(self, tolerance=Decimal('1e-20'), max_refinements=10):
+        # Factor once in float64, then refine: residuals are computed in
+        # Decimal and each correction is solved with the float factorization.
+        # Full Decimal elimination is only used when refinement stalls.
+        coefficients, constants = self.matrix_form()
+
+        try:
+            f = LUFactorization(coefficients)
+        except Exception as e:
+            if str(e) == LUFactorization.SINGULAR_MSG:
+                return self.solve_decimal()
+            raise e
+
+        x = [Decimal(v) for v in f.solve(constants)]
+        previous_correction = None
+
+        k = 0
+        for k in range(1, max_refinements+1):
+            residual = [c - sum(a * xj for a, xj in zip(row, x))
+                        for row, c in zip(coefficients, constants)]
+            correction = [Decimal(d) for d in f.solve(residual)]
+            x = [xj + dj for xj, dj in zip(x, correction)]
+
+            correction_norm = max(abs(d) for d in correction)
+            if correction_norm <= tolerance * max(max(abs(xj) for xj in x), 1):
+                return SolveReport(Vector(x), 'mixed_precision', k, max(abs(r) for r in residual))
+
+            # Corrections that stop shrinking mean float64 is too coarse
+            # for this matrix
+            if previous_correction is not None and correction_norm > previous_correction / 2:
+                break
+            previous_correction = correction_norm
+
+        report = self.solve_decimal()
+        report.iterations = k
+        return report
+
+    @in_system_precision
+    def solve_decimal(self):
+        coefficients, constants = self.matrix_form()
+        try:
+            f = LUFactorization(coefficients, convert=Decimal)
+        except Exception as e:
+            if str(e) == LUFactorization.SINGULAR_MSG:
+                raise Exception(self.NO_UNIQUE_SOLUTION_MSG)
+            raise e
+
+        x = f.solve(constants)
+        residual = max(abs(c - sum(a * xj for a, xj in zip(row, x)))
+                       for row, c in zip(coefficients, constants))
+        return SolveReport(Vector(x), 'decimal', residual=residual)
+
+    @in_system_precision
+    def solve(self):
+        # Picks the cheapest solver the coefficient structure allows and
+        # records the choice in the report: diagonal, triangular,
+        # tridiagonal (Thomas), banded, and otherwise dense mixed precision
+        coefficients, constants = self.matrix_form()
+        if len(coefficients) != len(coefficients[0]):
+            raise Exception(self.NO_UNIQUE_SOLUTION_MSG)
+        structure = MatrixStructure(coefficients)
+
+        try:
+            if structure.is_diagonal():
+                method = 'diagonal'
+                x = triangular_solve(coefficients, constants, lower=True)
+            elif structure.is_lower_triangular() or structure.is_upper_triangular():
+                method = 'triangular'
+                x = triangular_solve(coefficients, constants, lower=structure.is_lower_triangular())
+            elif structure.is_tridiagonal() and structure.weakly_diagonally_dominant:
+                method = 'thomas'
+                x = thomas_solve(coefficients, constants)
+            elif structure.is_banded() and structure.weakly_diagonally_dominant:
+                method = 'banded'
+                x = BandedSolver(coefficients, structure.lower_bandwidth,
+                                 structure.upper_bandwidth).solve(constants)
+            else:
+                method = None
+        except Exception as e:
+            if str(e) != BandedSolver.ZERO_PIVOT_MSG:
+                raise e
+            method = None
+
+        if method is None:
+            report = self.solve_mixed_precision()
+            report.structure = structure
+            return report
+
+        residual = max(abs(c - sum(a * xj for a, xj in zip(row, x)))
+                       for row, c in zip(coefficients, constants))
+        return SolveReport(Vector(x), method, residual=residual, structure=structure)
+
+    @in_system_precision
+    def solve_decomposed(self, executor=None, ordering='components'):
+        # Independent blocks of equations are solved separately and
+        # concurrently, see decomposition.solve_decomposed
+        from .decomposition import solve_decomposed
+        return solve_decomposed(self, executor, ordering)
+
+    @in_system_precision
+    def compute_rref(self):
+        # Gauss-Jordan elimination on the coefficient rows. Columns without
+        # a usable pivot are skipped (they become free variables) instead
+        # of stopping elimination. Returns the reduced rows, their
+        # constants and the pivot column of each nonzero row.
+        coefficients, constants = self.matrix_form()
+        rows = [row + [c] for row, c in zip(coefficients, constants)]
+        num_variables = len(coefficients[0])
+
+        pivot_columns = []
+        r = 0
+        for col in range(num_variables):
+            if r == len(rows):
+                break
+
+            pivot = None
+            for i in range(r, len(rows)):
+                if not MyDecimal(rows[i][col]).is_near_zero():
+                    pivot = i
+                    break
+            if pivot is None:
+                continue
+
+            rows[r], rows[pivot] = rows[pivot], rows[r]
+            pivot_row = rows[r]
+            scale = pivot_row[col]
+            pivot_row[col:] = [x / scale for x in pivot_row[col:]]
+
+            for i, row in enumerate(rows):
+                factor = row[col]
+                if i == r or MyDecimal(factor).is_near_zero():
+                    continue
+                row[col:] = [x - factor * p for x, p in zip(row[col:], pivot_row[col:])]
+
+            pivot_columns.append(col)
+            r += 1
+
+        return [row[:-1] for row in rows], [row[-1] for row in rows], pivot_columns
+
+    @in_system_precision
+    def compute_parametrization(self):
+        rows, constants, pivot_columns = self.compute_rref()
+        num_variables = len(rows[0])
+
+        # A row 0 = c with c != 0 below the pivots means no solution
+        for c in constants[len(pivot_columns):]:
+            if not MyDecimal(c).is_near_zero():
+                raise Exception(self.NO_SOLUTIONS_MSG)
+
+        # Free variables set to zero give the particular solution; setting
+        # one free variable to 1 gives one null space basis vector
+        basepoint = [Decimal(0)] * num_variables
+        for r, col in enumerate(pivot_columns):
+            basepoint[col] = constants[r]
+
+        pivots = set(pivot_columns)
+        direction_vectors = []
+        for free in range(num_variables):
+            if free in pivots:
+                continue
+            direction = [Decimal(0)] * num_variables
+            direction[free] = Decimal(1)
+            for r, col in enumerate(pivot_columns):
+                direction[col] = -rows[r][free]
+            direction_vectors.append(Vector(direction))
+
+        return Parametrization(Vector(basepoint), direction_vectors)
+
+
+class MyDecimal(Decimal):
+    def is_near_zero(self, eps=None):
+        if eps is None:
+            eps = current_tolerance()
+        return abs(self) < eps
+
+
+if __name__ == '__main__':
+    p0 = Plane(normal_vector=Vector(['1','1','1']), constant_term='1')
+    p1 = Plane(normal_vector=Vector(['0','1','0']), constant_term='2')
+    p2 = Plane(normal_vector=Vector(['1','1','-1']), constant_term='3')
+    p3 = Plane(normal_vector=Vector(['1','0','-2']), constant_term='2')
+
+    s = LinearSystem([p0,p1,p2,p3])
+
+    s.swap_rows(0,1)
+    if not (s[0] == p1 and s[1] == p0 and s[2] == p2 and s[3] == p3):
+        print("test case 1 failed")
+    else:
+        print('test case 1 passed')
+
+
+    s.swap_rows(1,3)
+    if not (s[0] == p1 and s[1] == p3 and s[2] == p2 and s[3] == p0):
+        print("test case 2 failed")
+    else:
+        print('test case 2 passed')
+
+
+    s.swap_rows(3,1)
+    if not (s[0] == p1 and s[1] == p0 and s[2] == p2 and s[3] == p3):
+        print("test case 3 failed")
+    else:
+        print('test case 3 passed')
+
+
+    s.multiply_coefficient_and_row(1,0)
+    if not (s[0] == p1 and s[1] == p0 and s[2] == p2 and s[3] == p3):
+        print('test case 4 failed')
+    else:
+        print('test case 4 passed')
+
+
+    s.multiply_coefficient_and_row(-1,2)
+    if not (s[0] == p1 and
+            s[1] == p0 and
+            s[2] == Plane(normal_vector=Vector(['-1','-1','1']), constant_term='-3') and
+            s[3] == p3):
+        print('test case 5 failed')
+    else:
+        print('test case 5 passed')
+
+
+    s.multiply_coefficient_and_row(10,1)
+    if not (s[0] == p1 and
+            s[1] == Plane(normal_vector=Vector(['10','10','10']), constant_term='10') and
+            s[2] == Plane(normal_vector=Vector(['-1','-1','1']), constant_term='-3') and
+            s[3] == p3):
+        print('test case 6 failed')
+    else:
+        print('test case 6 passed')
+
+
+    s.add_multiple_times_row_to_row(0,0,1)
+    if not (s[0] == p1 and
+            s[1] == Plane(normal_vector=Vector(['10','10','10']), constant_term='10') and
+            s[2] == Plane(normal_vector=Vector(['-1','-1','1']), constant_term='-3') and
+            s[3] == p3):
+        print('test case 7 failed')
+    else:
+        print('test case 7 passed')
+
+
+    s.add_multiple_times_row_to_row(1,0,1)
+    if not (s[0] == p1 and
+            s[1] == Plane(normal_vector=Vector(['10','11','10']), constant_term='12') and
+            s[2] == Plane(normal_vector=Vector(['-1','-1','1']), constant_term='-3') and
+            s[3] == p3):
+        print('test case 8 failed')
+    else:
+        print('test case 8 passed')
+
+
+    s.add_multiple_times_row_to_row(-1,1,0)
+    if not (s[0] == Plane(normal_vector=Vector(['-10','-10','-10']), constant_term='-10') and
+            s[1] == Plane(normal_vector=Vector(['10','11','10']), constant_term='12') and
+            s[2] == Plane(normal_vector=Vector(['-1','-1','1']), constant_term='-3') and
+            s[3] == p3):
+        print('test case 9 failed')
+    else:
+        print('test case 9 passed')
+
+
+    p1 = Plane(normal_vector=Vector(['1','1','1']), constant_term='1')
+    p2 = Plane(normal_vector=Vector(['0','1','1']), constant_term='2')
+    s = LinearSystem([p1,p2])
+    t = s.compute_triangular_form()
+    print("test case 10 t: {}".format(t))
+    if not (t[0] == p1 and
+            t[1] == p2):
+        print('test case 10 failed')
+    else:
+        print('test case 10 passed')
+
+
+    p1 = Plane(normal_vector=Vector(['1','1','1']), constant_term='1')
+    p2 = Plane(normal_vector=Vector(['1','1','1']), constant_term='2')
+    s = LinearSystem([p1,p2])
+    t = s.compute_triangular_form()
+    print("test case 11 t: {}".format(t))
+    if not (t[0] == p1 and
+            t[1] == Plane(constant_term='1')):
+        print('test case 11 failed')
+    else:
+        print('test case 11 passed')
+
+
+    p1 = Plane(normal_vector=Vector(['1','1','1']), constant_term='1')
+    p2 = Plane(normal_vector=Vector(['0','1','0']), constant_term='2')
+    p3 = Plane(normal_vector=Vector(['1','1','-1']), constant_term='3')
+    p4 = Plane(normal_vector=Vector(['1','0','-2']), constant_term='2')
+    s = LinearSystem([p1,p2,p3,p4])
+    t = s.compute_triangular_form()
+    print("test case 12 t: {}".format(t))
+    if not (t[0] == p1 and
+            t[1] == p2 and
+            t[2] == Plane(normal_vector=Vector(['0','0','-2']), constant_term='2') and
+            t[3] == Plane()):
+        print('test case 12 failed')
+    else:
+        print('test case 12 passed')
+
+    p1 = Plane(normal_vector=Vector(['0','1','1']), constant_term='1')
+    p2 = Plane(normal_vector=Vector(['1','-1','1']), constant_term='2')
+    p3 = Plane(normal_vector=Vector(['1','2','-5']), constant_term='3')
+    s = LinearSystem([p1,p2,p3])
+    t = s.compute_triangular_form()
+    print("test case 13 t: {}".format(t))
+    if not (t[0] == Plane(normal_vector=Vector(['1','-1','1']), constant_term='2') and
+            t[1] == Plane(normal_vector=Vector(['0','1','1']), constant_term='1') and
+            t[2] == Plane(normal_vector=Vector(['0','0','-9']), constant_term='-2')):
+        print('test case 13 failed')
+    else:
+        print('test case 13 passed')
+
+
+    print(s.indices_of_first_nonzero_terms_in_each_row())
+    #print '{},{},{},{}'.format(s[0],s[1],s[2],s[3])
+    print(len(s))
+    print(s)
+
+    s[0] = p1
+    print(s)
+
+    print(MyDecimal('1e-9').is_near_zero())
+    print(MyDecimal('1e-11').is_near_zero())
@@ -0,0 +1,64 @@
+from .precision import current_tolerance
+
+
+class LUFactorization(object):
+
+    NOT_SQUARE_MSG = 'LU factorization needs a square matrix'
+    SINGULAR_MSG = 'The matrix is singular'
+
+    def __init__(self, coefficients, tolerance=None, convert=float):
+        if tolerance is None:
+            tolerance = current_tolerance()
+        # convert=Decimal factors in Decimal arithmetic instead of float64
+        n = len(coefficients)
+        lu = [[convert(a) for a in row] for row in coefficients]
+        for row in lu:
+            if len(row) != n:
+                raise Exception(self.NOT_SQUARE_MSG)
+
+        # Partial pivoting: permutation[i] is the original row now at row i
+        permutation = list(range(n))
+        for k in range(n):
+            pivot_index = max(range(k, n), key=lambda i: abs(lu[i][k]))
+            if abs(lu[pivot_index][k]) < tolerance:
+                raise Exception(self.SINGULAR_MSG)
+            if pivot_index != k:
+                lu[k], lu[pivot_index] = lu[pivot_index], lu[k]
+                permutation[k], permutation[pivot_index] = permutation[pivot_index], permutation[k]
+
+            pivot_row = lu[k]
+            pivot = pivot_row[k]
+            for i in range(k+1, n):
+                row = lu[i]
+                multiplier = row[k] / pivot
+                row[k] = multiplier
+                if multiplier != 0:
+                    for j in range(k+1, n):
+                        row[j] -= multiplier * pivot_row[j]
+
+        self.lu = lu
+        self.permutation = permutation
+        self.dimension = n
+        self.convert = convert
+
+    def solve(self, constants):
+        lu = self.lu
+        n = self.dimension
+
+        y = [self.convert(constants[p]) for p in self.permutation]
+        for i in range(n):
+            row = lu[i]
+            y[i] -= sum(row[j] * y[j] for j in range(i))
+
+        x = [self.convert(0)] * n
+        for i in range(n-1, -1, -1):
+            row = lu[i]
+            x[i] = (y[i] - sum(row[j] * x[j] for j in range(i+1, n))) / row[i]
+        return x
+
+
+"""
+f = LUFactorization([[2, 1, 1], [4, -6, 0], [-2, 7, 2]])
+print(f.solve([5, -2, 9]))
+print(f.solve([1, 0, 0]))
+"""
@@ -0,0 +1,271 @@
+from operator import mul
+
+from .vector import Vector
+
+
+class Matrix(object):
+
+    SHAPE_MISMATCH_MSG = 'Cannot multiply a {}x{} matrix by a {}x{} matrix'
+    RAGGED_ROWS_MSG = 'All rows must have the same length'
+    EMPTY_MATRIX_MSG = 'The matrix must be nonempty'
+
+    # Block edge for the blocked product, and the size below which the
+    # Strassen recursion hands over to it
+    BLOCK_SIZE = 64
+    STRASSEN_CUTOFF = 64
+
+    def __init__(self, rows, convert=float):
+        # convert=Decimal keeps exact arithmetic, as in LUFactorization
+        rows = [list(row) for row in rows]
+        if not rows or not rows[0]:
+            raise ValueError(self.EMPTY_MATRIX_MSG)
+        columns = len(rows[0])
+        data = []
+        for row in rows:
+            if len(row) != columns:
+                raise ValueError(self.RAGGED_ROWS_MSG)
+            data.extend(convert(a) for a in row)
+        self.init_view(data, (len(rows), columns), (columns, 1), 0, convert)
+
+    def init_view(self, data, shape, strides, offset, convert):
+        # Entry (i, j) lives at data[offset + i * strides[0] + j * strides[1]],
+        # so views such as the transpose share data with their source
+        self.data = data
+        self.shape = shape
+        self.strides = strides
+        self.offset = offset
+        self.convert = convert
+
+    @classmethod
+    def view(cls, data, shape, strides, offset=0, convert=float):
+        m = cls.__new__(cls)
+        m.init_view(data, shape, strides, offset, convert)
+        return m
+
+    @classmethod
+    def from_system(cls, system, convert=float):
+        return cls(system.matrix_form()[0], convert)
+
+    @classmethod
+    def identity(cls, n, convert=float):
+        return cls([[1 if i == j else 0 for j in range(n)] for i in range(n)], convert)
+
+    @property
+    def dimension(self):
+        # Lets a square Matrix stand in wherever an operator with matvec()
+        # and dimension is expected, e.g. the eigensolvers
+        return self.shape[0]
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def transpose(self):
+        return Matrix.view(self.data, (self.shape[1], self.shape[0]),
+                           (self.strides[1], self.strides[0]), self.offset, self.convert)
+
+    def __getitem__(self, index):
+        i, j = index
+        return self.data[self.offset + i * self.strides[0] + j * self.strides[1]]
+
+    def __setitem__(self, index, value):
+        i, j = index
+        self.data[self.offset + i * self.strides[0] + j * self.strides[1]] = self.convert(value)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __eq__(self, other):
+        return self.shape == other.shape and self.rows() == other.rows()
+
+    def __str__(self):
+        return 'Matrix:\n' + '\n'.join(str(tuple(row)) for row in self.rows())
+
+    def row(self, i):
+        # A slice, so a copy, but taken at C speed even on a transposed view
+        start = self.offset + i * self.strides[0]
+        step = self.strides[1]
+        return self.data[start:start + (self.shape[1] - 1) * step + 1:step]
+
+    def column(self, j):
+        return self.transpose().row(j)
+
+    def rows(self):
+        return [self.row(i) for i in range(self.shape[0])]
+
+    def __iter__(self):
+        return iter(self.rows())
+
+    def copy(self):
+        return Matrix(self.rows(), self.convert)
+
+    def matvec(self, x):
+        x = [self.convert(a) for a in x]
+        if len(x) != self.shape[1]:
+            raise Exception(self.SHAPE_MISMATCH_MSG.format(self.shape[0], self.shape[1], len(x), 1))
+        return [sum(map(mul, row, x)) for row in self.rows()]
+
+    def times_vector(self, v):
+        return Vector(self.matvec(v))
+
+    def times_scalar(self, c):
+        c = self.convert(c)
+        return Matrix([[c * a for a in row] for row in self.rows()], self.convert)
+
+    def plus(self, other):
+        return Matrix([[a + b for a, b in zip(r1, r2)] for r1, r2 in zip(self.rows(), other.rows())],
+                      self.convert)
+
+    def minus(self, other):
+        return Matrix([[a - b for a, b in zip(r1, r2)] for r1, r2 in zip(self.rows(), other.rows())],
+                      self.convert)
+
+    def times(self, other, block_size=None, strassen=False):
+        # Blocked i-k-j product. With strassen=True, large products are
+        # split recursively with Strassen's seven multiplications until the
+        # pieces fall below STRASSEN_CUTOFF. Strassen trades accuracy for
+        # speed, so it is off by default and best kept to float matrices.
+        (n, m), (m2, p) = self.shape, other.shape
+        if m != m2:
+            raise Exception(self.SHAPE_MISMATCH_MSG.format(n, m, m2, p))
+
+        a, b = self.rows(), other.rows()
+        if strassen and min(n, m, p) > self.STRASSEN_CUTOFF:
+            product = strassen_product(a, b, self.convert(0), block_size or self.BLOCK_SIZE)
+        else:
+            product = blocked_product(a, b, self.convert(0), block_size or self.BLOCK_SIZE)
+        return Matrix(product, self.convert)
+
+    def to_linear_system(self, constants, **kwargs):
+        from .plane import Plane
+        from .linsys import LinearSystem
+        return LinearSystem([Plane(Vector(row), c) for row, c in zip(self.rows(), constants)], **kwargs)
+
+
+def blocked_product(a, b, zero, block_size):
+    # a and b are lists of rows. Each block of b's rows is streamed against
+    # every row of a while it is still hot, and whole row segments are
+    # updated per multiplier instead of one entry at a time.
+    n, m, p = len(a), len(b), len(b[0])
+    c = [[zero] * p for _ in range(n)]
+    for kk in range(0, m, block_size):
+        k_end = min(kk + block_size, m)
+        for jj in range(0, p, block_size):
+            j_end = min(jj + block_size, p)
+            b_block = [row[jj:j_end] for row in b[kk:k_end]]
+            for i in range(n):
+                a_row = a[i]
+                segment = c[i][jj:j_end]
+                for k, b_row in zip(range(kk, k_end), b_block):
+                    multiplier = a_row[k]
+                    if multiplier:
+                        segment = [s + multiplier * x for s, x in zip(segment, b_row)]
+                c[i][jj:j_end] = segment
+    return c
+
+
+def split(rows, h, w, zero):
+    # Quarters of a matrix zero padded to 2h x 2w
+    def quarter(r0, c0):
+        out = []
+        for row in rows[r0:r0 + h]:
+            part = row[c0:c0 + w]
+            out.append(part + [zero] * (w - len(part)))
+        while len(out) < h:
+            out.append([zero] * w)
+        return out
+    return quarter(0, 0), quarter(0, w), quarter(h, 0), quarter(h, w)
+
+
+def add(x, y):
+    return [[a + b for a, b in zip(r1, r2)] for r1, r2 in zip(x, y)]
+
+
+def sub(x, y):
+    return [[a - b for a, b in zip(r1, r2)] for r1, r2 in zip(x, y)]
+
+
+def strassen_product(a, b, zero, block_size, cutoff=Matrix.STRASSEN_CUTOFF):
+    n, m, p = len(a), len(b), len(b[0])
+    if min(n, m, p) <= cutoff:
+        return blocked_product(a, b, zero, block_size)
+
+    hn, hm, hp = (n + 1) // 2, (m + 1) // 2, (p + 1) // 2
+    a11, a12, a21, a22 = split(a, hn, hm, zero)
+    b11, b12, b21, b22 = split(b, hm, hp, zero)
+
+    def recurse(x, y):
+        return strassen_product(x, y, zero, block_size, cutoff)
+
+    m1 = recurse(add(a11, a22), add(b11, b22))
+    m2 = recurse(add(a21, a22), b11)
+    m3 = recurse(a11, sub(b12, b22))
+    m4 = recurse(a22, sub(b21, b11))
+    m5 = recurse(add(a11, a12), b22)
+    m6 = recurse(sub(a21, a11), add(b11, b12))
+    m7 = recurse(sub(a12, a22), add(b21, b22))
+
+    c11 = add(sub(add(m1, m4), m5), m7)
+    c12 = add(m3, m5)
+    c21 = add(m2, m4)
+    c22 = add(sub(add(m1, m3), m2), m6)
+
+    # Stitch the quarters back together and drop the padding
+    top = [r1 + r2 for r1, r2 in zip(c11, c12)]
+    bottom = [r1 + r2 for r1, r2 in zip(c21, c22)]
+    return [row[:p] for row in (top + bottom)[:n]]
+
+
+def batched_product(lefts, rights):
+    # Products of many small matrices. Either side may be a single Matrix,
+    # which is then paired with every matrix on the other side. Working on
+    # the raw rows keeps the per-product overhead to one comprehension.
+    if isinstance(lefts, Matrix):
+        lefts = [lefts] * len(rights)
+    if isinstance(rights, Matrix):
+        rights = [rights] * len(lefts)
+
+    results = []
+    columns_cache = {}
+    for left, right in zip(lefts, rights):
+        if left.shape[1] != right.shape[0]:
+            raise Exception(Matrix.SHAPE_MISMATCH_MSG.format(
+                left.shape[0], left.shape[1], right.shape[0], right.shape[1]))
+        # A shared right factor only has its columns gathered once
+        columns = columns_cache.get(id(right))
+        if columns is None:
+            columns = columns_cache[id(right)] = (right, right.transpose().rows())
+        columns = columns[1]
+        results.append(Matrix([[sum(map(mul, row, column)) for column in columns]
+                               for row in left.rows()], left.convert))
+    return results
+
+
+def benchmark(n=120, repeat=3):
+    # Compares the row-by-row Vector.dot approach with the blocked and
+    # Strassen products on an n x n float matrix
+    import random
+    from .profiling import best_time
+
+    rng = random.Random(0)
+    a = Matrix([[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)])
+    b = Matrix([[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)])
+
+    def vector_dot():
+        columns = [Vector(column) for column in b.transpose().rows()]
+        return [[Vector(row).dot(column) for column in columns] for row in a.rows()]
+
+    return {
+        'vector_dot_sec': best_time(vector_dot, repeat),
+        'blocked_sec': best_time(lambda: a.times(b), repeat),
+        'strassen_sec': best_time(lambda: a.times(b, strassen=True), repeat),
+    }
+
+
+"""
+a = Matrix([[1, 2], [3, 4], [5, 6]])
+print(a.times_vector(Vector([1, 1])))
+print(a.T.times(a))
+print(batched_product([a.T] * 3, a))
+print(benchmark())
+"""
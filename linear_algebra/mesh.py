@@ -0,0 +1,94 @@
+from array import array
+from math import sqrt
+
+
+class TriangleMesh(object):
+
+    BAD_FACE_MSG = 'Face {} refers to a vertex that does not exist'
+
+    def __init__(self, vertices, faces, chunk_size=65536):
+        # vertices is a sequence of (x, y, z), faces a sequence of
+        # (i, j, k) vertex indices. Coordinates are kept in flat float
+        # arrays rather than one Vector per vertex.
+        self.xs = array('d', (float(v[0]) for v in vertices))
+        self.ys = array('d', (float(v[1]) for v in vertices))
+        self.zs = array('d', (float(v[2]) for v in vertices))
+        self.faces = faces
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return len(self.faces)
+
+    def chunks(self):
+        # Yields (unit normals, areas) for chunk_size faces at a time, so
+        # only one chunk of results is ever held in memory
+        xs, ys, zs = self.xs, self.ys, self.zs
+        n = len(self.faces)
+
+        for start in range(0, n, self.chunk_size):
+            normals = array('d')
+            areas = array('d')
+            for f in range(start, min(start + self.chunk_size, n)):
+                try:
+                    i, j, k = self.faces[f]
+                    # Negative indices would wrap around to the last vertices
+                    if i < 0 or j < 0 or k < 0:
+                        raise IndexError
+                    ax, ay, az = xs[i], ys[i], zs[i]
+                    ux, uy, uz = xs[j] - ax, ys[j] - ay, zs[j] - az
+                    vx, vy, vz = xs[k] - ax, ys[k] - ay, zs[k] - az
+                except IndexError:
+                    raise Exception(self.BAD_FACE_MSG.format(f))
+
+                # Same cross product as Vector.cross, on unpacked floats
+                cx = uy*vz - vy*uz
+                cy = -(ux*vz - vx*uz)
+                cz = ux*vy - vx*uy
+                magnitude = sqrt(cx*cx + cy*cy + cz*cz)
+
+                areas.append(magnitude / 2.0)
+                if magnitude == 0:
+                    # Degenerate triangles have no direction
+                    normals.extend((0.0, 0.0, 0.0))
+                else:
+                    normals.extend((cx / magnitude, cy / magnitude, cz / magnitude))
+            yield normals, areas
+
+    def face_normals(self):
+        # Flat array: the normal of face f is at [3*f, 3*f + 3)
+        normals = array('d')
+        for chunk, _ in self.chunks():
+            normals.extend(chunk)
+        return normals
+
+    def face_areas(self):
+        areas = array('d')
+        for _, chunk in self.chunks():
+            areas.extend(chunk)
+        return areas
+
+    def total_area(self):
+        return sum(sum(areas) for _, areas in self.chunks())
+
+    def normals_and_areas(self):
+        # Normals, areas and total area from a single pass over the faces,
+        # for callers that need more than one of them
+        normals = array('d')
+        areas = array('d')
+        total = 0.0
+        for normal_chunk, area_chunk in self.chunks():
+            normals.extend(normal_chunk)
+            areas.extend(area_chunk)
+            total += sum(area_chunk)
+        return normals, areas, total
+
+
+"""
+vertices = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)]
+faces = [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)]
+m = TriangleMesh(vertices, faces)
+print(m.face_areas())
+print(m.face_normals())
+print(m.total_area())
+normals, areas, total = m.normals_and_areas()
+"""
@@ -0,0 +1,122 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from .precision import current_settings, current_tolerance, local_precision
+
+
+def eliminate_rows(rows, block, col, pivot_row, tolerance):
+    # Adds the multiple of pivot_row to each row in block that clears its
+    # entry in column col. Only entries from col on can change, since the
+    # pivot row is zero to the left of col.
+    pivot = pivot_row[col]
+    for i in block:
+        row = rows[i]
+        factor = row[col] / pivot
+        if abs(factor) < tolerance:
+            continue
+        row[col:] = [x - factor * p for x, p in zip(row[col:], pivot_row[col:])]
+        row[col] = row[col] * 0
+
+
+def elimination_step(rows, col, r, tolerance, eliminate=None):
+    # One column of forward elimination: swaps the topmost row from r down
+    # with a usable entry in col into row r, then clears col in every row
+    # below it with eliminate(block, col, pivot_row). Returns the index
+    # the pivot row came from, or None when col has no pivot.
+    pivot = None
+    for i in range(r, len(rows)):
+        if abs(rows[i][col]) >= tolerance:
+            pivot = i
+            break
+    if pivot is None:
+        return None
+
+    rows[r], rows[pivot] = rows[pivot], rows[r]
+    block = range(r + 1, len(rows))
+    if eliminate is None:
+        eliminate_rows(rows, block, col, rows[r], tolerance)
+    else:
+        eliminate(block, col, rows[r])
+    return pivot
+
+
+class ParallelEliminator(object):
+
+    def __init__(self, workers=None, min_parallel_rows=64, tolerance=None):
+        # Steps with fewer than min_parallel_rows rows below the pivot are
+        # done serially: handing them to the pool would cost more than the
+        # updates themselves
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_rows = min_parallel_rows
+        self.tolerance = tolerance
+
+    def partition(self, start, end):
+        # Contiguous blocks of rows, one per worker
+        size = -(-(end - start) // self.workers)
+        return [range(i, min(i + size, end)) for i in range(start, end, size)]
+
+    def triangular_form(self, system, constants=None):
+        # Same elimination as LinearSystem.compute_triangular_form (swap
+        # with the topmost usable row below, add multiples of the pivot
+        # row to the rows underneath, never scale rows), except that
+        # columns with no pivot are skipped. Returns the triangular rows
+        # and their constants.
+        if constants is None:
+            coefficients, constants = system.matrix_form()
+        else:
+            coefficients = system
+        rows = [list(row) + [c] for row, c in zip(coefficients, constants)]
+        tolerance = self.tolerance if self.tolerance is not None else current_tolerance()
+        num_equations = len(rows)
+        num_variables = len(coefficients[0])
+        precision, _ = current_settings()
+
+        def update(block, col, pivot_row):
+            with local_precision(precision, tolerance):
+                eliminate_rows(rows, block, col, pivot_row, tolerance)
+
+        def eliminate(block, col, pivot_row):
+            # Rows below the pivot do not depend on each other
+            if self.workers > 1 and len(block) >= self.min_parallel_rows:
+                blocks = self.partition(block.start, block.stop)
+                list(pool.map(lambda b: update(b, col, pivot_row), blocks))
+            else:
+                eliminate_rows(rows, block, col, pivot_row, tolerance)
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            r = 0
+            for col in range(num_variables):
+                if r >= num_equations - 1:
+                    break
+                if elimination_step(rows, col, r, tolerance, eliminate) is not None:
+                    r += 1
+
+        return [row[:-1] for row in rows], [row[-1] for row in rows]
+
+
+def scaling_benchmark(size=200, max_threads=None, convert=Decimal, repeat=3, seed=0):
+    # Times elimination of a random size x size system with 1..max_threads
+    # workers. Returns (threads, best seconds, speedup over one thread).
+    # The GIL serializes pure Python Decimal and float updates, so real
+    # speedups need an array backend that releases it or free-threaded
+    # CPython.
+    from .profiling import best_time
+
+    max_threads = max_threads or os.cpu_count() or 1
+    rng = random.Random(seed)
+    coefficients = [[convert(rng.uniform(-1, 1)) for _ in range(size)] for _ in range(size)]
+    constants = [convert(rng.uniform(-1, 1)) for _ in range(size)]
+
+    results = []
+    for threads in range(1, max_threads + 1):
+        eliminator = ParallelEliminator(workers=threads, min_parallel_rows=1)
+        best = best_time(lambda: eliminator.triangular_form(coefficients, constants), repeat)
+        results.append((threads, best, results[0][1] / best if results else 1.0))
+    return results
+
+
+if __name__ == '__main__':
+    for threads, seconds, speedup in scaling_benchmark():
+        print('{:>3} threads: {:8.3f} s  speedup {:5.2f}x'.format(threads, seconds, speedup))
@@ -1,20 +1,19 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
 
-from vector import Vector
-
-getcontext().prec = 30
+from .vector import Vector
+from .precision import current_tolerance
 
 class Plane(object):
 
     NO_NONZERO_ELTS_FOUND_MSG = 'No nonzero elements found'
 
     def __init__(self, normal_vector=None, constant_term=None):
-        self.dimension = 3
-
         if not normal_vector:
-            all_zeros = ['0']*self.dimension
+            all_zeros = ['0']*3
             normal_vector = Vector(all_zeros)
         self.normal_vector = Vector([Decimal(x) for x in normal_vector])
+        # 3 unless a longer normal vector makes this a hyperplane
+        self.dimension = self.normal_vector.dimension
 
         if not constant_term:
             constant_term = Decimal('0')
@@ -125,8 +124,21 @@ class Plane(object):
 
 
 class MyDecimal(Decimal):
-    def is_near_zero(self, eps=1e-10):
+    def is_near_zero(self, eps=None):
+        if eps is None:
+            eps = current_tolerance()
         return abs(self) < eps
+
+
+def equation_terms(equation):
+    # The normal vector and constant term of a Line, a Plane or a
+    # (normal_vector, constant_term) pair
+    if hasattr(equation, 'normal_vector'):
+        return equation.normal_vector, equation.constant_term
+    normal_vector, constant_term = equation
+    return normal_vector, constant_term
+
+
 """
 v = Plane([-0.412, 3.806, 0.728], -3.46)
 w = Plane([1.03, -9.515, -1.82], 8.65)
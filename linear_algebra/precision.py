@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import getcontext, localcontext
+
+DEFAULT_TOLERANCE = 1e-10
+
+# Like the Decimal context itself, the tolerance lives in a context
+# variable: every thread (and every asyncio task) sees its own value, so
+# low and high precision work can run side by side
+tolerance_var = ContextVar('tolerance', default=DEFAULT_TOLERANCE)
+
+
+def current_tolerance():
+    return tolerance_var.get()
+
+
+def current_settings():
+    # The calling thread's precision and tolerance. Pool threads and
+    # processes start from the default Decimal context and tolerance, so
+    # work handed to them re-enters these with local_precision(*settings).
+    return getcontext().prec, current_tolerance()
+
+
+@contextmanager
+def local_precision(digits=None, tolerance=None):
+    # Sets the Decimal precision and/or the near-zero tolerance for the
+    # enclosed code only; arguments left as None keep the current values
+    with localcontext() as ctx:
+        if digits is not None:
+            ctx.prec = digits
+        token = tolerance_var.set(tolerance) if tolerance is not None else None
+        try:
+            yield ctx
+        finally:
+            if token is not None:
+                tolerance_var.reset(token)
+
+
+"""
+from linear_algebra.linsys import LinearSystem
+
+with local_precision(12, tolerance=1e-6):
+    print(s.solve_decimal())
+
+s = LinearSystem(planes, precision=50, tolerance=1e-30)
+print(s.solve_mixed_precision(tolerance=Decimal('1e-40')))
+"""
@@ -0,0 +1,148 @@
+import threading
+import time
+from types import FunctionType
+
+
+class OperationStats(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.objects = 0
+        self.decimals = 0
+
+
+class OperationProfiler(object):
+
+    ALREADY_ACTIVE_MSG = 'The profiler is already active'
+
+    def __init__(self, classes=None):
+        # Methods are only wrapped between __enter__ and __exit__, so
+        # nothing is paid while the profiler is not active
+        if classes is None:
+            from .vector import Vector
+            from .line import Line
+            from .plane import Plane
+            classes = (Vector, Line, Plane)
+        self.classes = classes
+        self.stats = {}
+        self.collapsed = {}
+        self.originals = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def stack(self):
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    def wrap(self, name, function, is_init):
+        profiler = self
+
+        def wrapper(*args, **kwargs):
+            stack = profiler.stack()
+            # frame: [name, child time, objects, decimals]
+            frame = [name, 0.0, 0, 0]
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                if is_init:
+                    # Every operation on the stack allocated this object
+                    decimals = len(getattr(args[0], 'coordinates', ()))
+                    frame[2] += 1
+                    frame[3] += decimals
+                    for f in stack:
+                        f[2] += 1
+                        f[3] += decimals
+                if stack:
+                    stack[-1][1] += elapsed
+                profiler.record(stack, frame, elapsed)
+
+        wrapper.__name__ = function.__name__
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+
+    def record(self, stack, frame, elapsed):
+        name, child_time, objects, decimals = frame
+        path = ';'.join([f[0] for f in stack] + [name])
+        with self.lock:
+            s = self.stats.get(name)
+            if s is None:
+                s = self.stats[name] = OperationStats(name)
+            s.calls += 1
+            s.total_time += elapsed
+            s.self_time += elapsed - child_time
+            s.objects += objects
+            s.decimals += decimals
+            self.collapsed[path] = self.collapsed.get(path, 0.0) + elapsed - child_time
+
+    def __enter__(self):
+        if self.originals:
+            raise Exception(self.ALREADY_ACTIVE_MSG)
+        for cls in self.classes:
+            for attr, value in list(vars(cls).items()):
+                name = '{}.{}'.format(cls.__name__, attr)
+                if isinstance(value, staticmethod):
+                    wrapped = staticmethod(self.wrap(name, value.__func__, False))
+                elif isinstance(value, FunctionType):
+                    wrapped = self.wrap(name, value, attr == '__init__')
+                else:
+                    continue
+                self.originals.append((cls, attr, value))
+                setattr(cls, attr, wrapped)
+        return self
+
+    def __exit__(self, *exc):
+        for cls, attr, value in self.originals:
+            setattr(cls, attr, value)
+        self.originals = []
+
+    def table(self):
+        # total time includes nested operations, objects counts every
+        # Vector/Line/Plane created inside the operation and decimals the
+        # Decimal coordinates of those vectors
+        header = '{:<45} {:>10} {:>12} {:>12} {:>10} {:>10}'.format(
+            'operation', 'calls', 'total ms', 'self ms', 'objects', 'decimals')
+        lines = [header, '-' * len(header)]
+        for s in sorted(self.stats.values(), key=lambda s: s.total_time, reverse=True):
+            lines.append('{:<45} {:>10} {:>12.3f} {:>12.3f} {:>10} {:>10}'.format(
+                s.name, s.calls, 1000 * s.total_time, 1000 * s.self_time, s.objects, s.decimals))
+        return '\n'.join(lines)
+
+    def write_collapsed(self, f):
+        # One 'outer;inner;innermost <self microseconds>' line per call
+        # path, the input format of flamegraph.pl and speedscope
+        for path, seconds in sorted(self.collapsed.items()):
+            f.write('{} {}\n'.format(path, int(round(seconds * 1e6))))
+
+
+def best_time(fn, repeat=3):
+    # Best of repeat wall clock timings of fn(), in seconds, as used by the
+    # benchmark helpers across the package
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+"""
+with OperationProfiler() as profiler:
+    v = Vector([3.183, -7.627])
+    w = Vector([-2.668, 5.319])
+    for _ in range(100):
+        v.angle_with(w)
+        v.component_orthogonal_to(w)
+
+print(profiler.table())
+with open('vector.collapsed', 'w') as f:
+    profiler.write_collapsed(f)
+"""
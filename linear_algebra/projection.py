@@ -0,0 +1,76 @@
+from math import sqrt
+from operator import mul, sub
+
+from .vector import Vector
+
+
+class SubspaceProjector(object):
+
+    DIMENSION_MISMATCH_MSG = 'All vectors must have dimension {}'
+
+    def __init__(self, basis_vectors, tolerance=1e-10):
+        basis_vectors = [[float(x) for x in b] for b in basis_vectors]
+        self.dimension = len(basis_vectors[0])
+        for b in basis_vectors:
+            if len(b) != self.dimension:
+                raise Exception(self.DIMENSION_MISMATCH_MSG.format(self.dimension))
+
+        # Modified Gram-Schmidt, done once here instead of normalizing the
+        # basis on every projection. Basis vectors that depend on earlier
+        # ones add nothing to the subspace and are dropped.
+        basis = []
+        for b in basis_vectors:
+            for u in basis:
+                weight = sum(map(mul, b, u))
+                b = [x - weight * y for x, y in zip(b, u)]
+            magnitude = sqrt(sum(x * x for x in b))
+            if magnitude >= tolerance:
+                basis.append([x / magnitude for x in b])
+
+        if not basis:
+            raise Exception(Vector.NO_UNIQUE_PARALLEL_COMPONENT_MSG)
+
+        self.basis = basis
+        self.rank = len(basis)
+        # Column j holds coordinate j of every basis vector
+        self.columns = list(zip(*basis))
+
+    def decompose(self, vectors):
+        # One pass over the batch giving the parallel and orthogonal
+        # components of every vector together
+        basis = self.basis
+        columns = self.columns
+        parallels = []
+        orthogonals = []
+        for v in vectors:
+            v = [float(x) for x in v]
+            if len(v) != self.dimension:
+                raise Exception(self.DIMENSION_MISMATCH_MSG.format(self.dimension))
+            weights = [sum(map(mul, u, v)) for u in basis]
+            parallel = [sum(map(mul, weights, c)) for c in columns]
+            parallels.append(parallel)
+            orthogonals.append(list(map(sub, v, parallel)))
+        return parallels, orthogonals
+
+    def project(self, vectors):
+        return self.decompose(vectors)[0]
+
+    def reject(self, vectors):
+        return self.decompose(vectors)[1]
+
+    def component_parallel_to(self, v):
+        return Vector(self.project([v])[0])
+
+    def component_orthogonal_to(self, v):
+        return Vector(self.reject([v])[0])
+
+
+"""
+p = SubspaceProjector([Vector([6.404, -9.144, 2.759, 8.718])])
+print(p.component_parallel_to(Vector([3.009, -6.172, 3.692, -2.51])))
+
+p = SubspaceProjector([[1, 0, 0], [1, 1, 0]])
+parallel, orthogonal = p.decompose([[1, 2, 3], [4, 5, 6]])
+print(parallel)
+print(orthogonal)
+"""
@@ -0,0 +1,284 @@
+import io
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from decimal import Decimal
+
+from .vector import Vector
+from .line import Line
+from .plane import Plane, equation_terms
+
+# File layout, all little endian:
+#   header  magic, version, kind, dtype, reserved, dimension, count, scale, reserved
+#   data    count records of dimension (vectors) or dimension + 1
+#           (equations: normal vector followed by the constant term) values,
+#           packed as float64 or as int64 fixed point with `scale` decimals
+MAGIC = b'LARF'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBBIIiI')
+
+KIND_VECTOR = 0
+KIND_EQUATION = 1
+
+DTYPE_FLOAT64 = 0
+DTYPE_DECIMAL = 1
+DTYPE_NAMES = {'float64': DTYPE_FLOAT64, 'decimal': DTYPE_DECIMAL}
+
+INT64_MAX = 2**63 - 1
+
+
+class FormatError(Exception):
+    pass
+
+
+def record_values(obj):
+    # A Line or Plane is written as its normal vector followed by the constant
+    if hasattr(obj, 'normal_vector'):
+        normal_vector, constant_term = equation_terms(obj)
+        return KIND_EQUATION, list(normal_vector) + [constant_term]
+    return KIND_VECTOR, list(obj)
+
+
+class RecordWriter(object):
+
+    BAD_RECORD_MSG = 'Record does not match the file: expected kind {} with dimension {}'
+    VALUE_OUT_OF_RANGE_MSG = 'Value {} does not fit in fixed point with scale {}'
+
+    def __init__(self, f, kind, dimension, dtype='float64', scale=6, count=0):
+        self.f = f
+        self.kind = kind
+        self.dimension = dimension
+        self.dtype = DTYPE_NAMES[dtype] if isinstance(dtype, str) else dtype
+        self.scale = scale
+        self.count = count
+        if count == 0:
+            self.f.write(self.header())
+
+    @classmethod
+    def open(cls, path, kind, dimension, dtype='float64', scale=6):
+        # Appends to an existing file (its header wins) or starts a new one
+        if os.path.exists(path) and os.path.getsize(path) >= HEADER.size:
+            f = open(path, 'r+b')
+            header = read_header(f.read(HEADER.size))
+            f.seek(0, os.SEEK_END)
+            count = (f.tell() - HEADER.size) // (8 * record_length(header['kind'], header['dimension']))
+            return cls(f, header['kind'], header['dimension'], header['dtype'], header['scale'], count)
+        return cls(open(path, 'w+b'), kind, dimension, dtype, scale)
+
+    def header(self):
+        return HEADER.pack(MAGIC, VERSION, self.kind, self.dtype, 0,
+                           self.dimension, self.count, self.scale, 0)
+
+    def pack(self, values):
+        if self.dtype == DTYPE_FLOAT64:
+            packed = array('d', [float(x) for x in values])
+        else:
+            packed = array('q')
+            for x in values:
+                fixed = int(Decimal(x).scaleb(self.scale).to_integral_value())
+                if abs(fixed) > INT64_MAX:
+                    raise FormatError(self.VALUE_OUT_OF_RANGE_MSG.format(x, self.scale))
+                packed.append(fixed)
+        if sys.byteorder != 'little':
+            packed.byteswap()
+        return packed.tobytes()
+
+    def append(self, obj):
+        kind, values = record_values(obj)
+        if kind != self.kind or len(values) != record_length(self.kind, self.dimension):
+            raise FormatError(self.BAD_RECORD_MSG.format(self.kind, self.dimension))
+        self.f.write(self.pack(values))
+        self.count += 1
+
+    def extend(self, objs):
+        for obj in objs:
+            self.append(obj)
+
+    def write_header(self):
+        # Keeps the header count current without disturbing further appends
+        self.f.seek(0)
+        self.f.write(self.header())
+        self.f.seek(0, os.SEEK_END)
+
+    def close(self):
+        self.write_header()
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record_length(kind, dimension):
+    return dimension + 1 if kind == KIND_EQUATION else dimension
+
+
+def read_header(buf):
+    if len(buf) < HEADER.size:
+        raise FormatError('Truncated header')
+    magic, version, kind, dtype, _, dimension, count, scale, _ = HEADER.unpack_from(buf)
+    if magic != MAGIC:
+        raise FormatError('Not a vector record file')
+    if version != VERSION:
+        raise FormatError('Unsupported format version {}'.format(version))
+    return {'kind': kind, 'dtype': dtype, 'dimension': dimension, 'count': count, 'scale': scale}
+
+
+class RecordReader(object):
+
+    def __init__(self, buf):
+        # buf is anything exposing the buffer protocol: bytes, bytearray,
+        # memoryview or an mmap. Records are read straight out of it.
+        header = read_header(buf)
+        self.kind = header['kind']
+        self.dtype = header['dtype']
+        self.dimension = header['dimension']
+        self.scale = header['scale']
+        self.record_length = record_length(self.kind, self.dimension)
+
+        data = memoryview(buf)[HEADER.size:]
+        usable = len(data) - len(data) % (8 * self.record_length)
+        # Records appended after the header was last rewritten are still
+        # valid, so the count comes from the data itself
+        self.count = usable // (8 * self.record_length)
+
+        typecode = 'd' if self.dtype == DTYPE_FLOAT64 else 'q'
+        if sys.byteorder == 'little':
+            self.values = data[:usable].cast(typecode)
+        else:
+            swapped = array(typecode, data[:usable].tobytes())
+            swapped.byteswap()
+            self.values = memoryview(swapped)
+
+        self.views = []
+        self.mmap = None
+        self.file = None
+
+    @classmethod
+    def open(cls, path):
+        f = open(path, 'rb')
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        reader = cls(m)
+        reader.mmap = m
+        reader.file = f
+        return reader
+
+    def close(self):
+        # An mmap cannot be closed while any view into it is alive, so the
+        # views handed out by raw() are released along with the reader's own
+        for view in self.views:
+            view.release()
+        self.views = []
+        self.values.release()
+        if self.mmap is not None:
+            self.mmap.close()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def raw(self, i):
+        # Zero copy view of the packed values of record i, valid until the
+        # reader is closed
+        start = i * self.record_length
+        view = self.values[start:start + self.record_length]
+        self.views.append(view)
+        return view
+
+    def decode(self, values):
+        # Floats go through repr, the shortest string that reads back as
+        # the same float, so '0.1' written as float64 comes back as
+        # Decimal('0.1') rather than its exact binary expansion
+        if self.dtype == DTYPE_FLOAT64:
+            return list(map(Decimal, map(repr, values)))
+        scale = -self.scale
+        return [Decimal(x).scaleb(scale) for x in values]
+
+    def build(self, values):
+        # Decoded values are Decimals already, so the constructors only
+        # wrap them; a list is passed so Line and Plane build one Vector
+        if self.kind == KIND_VECTOR:
+            return Vector(values)
+        if self.dimension == 2:
+            return Line(values[:-1], values[-1])
+        return Plane(values[:-1], values[-1])
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError('record index out of range')
+        start = i * self.record_length
+        return self.build(self.decode(self.values[start:start + self.record_length]))
+
+    def __iter__(self):
+        # Decodes a few thousand values per call rather than one record at
+        # a time
+        step = max(1, 4096 // self.record_length)
+        n = self.record_length
+        for start in range(0, self.count, step):
+            stop = min(start + step, self.count)
+            values = self.decode(self.values[start * n:stop * n])
+            for offset in range(0, len(values), n):
+                yield self.build(values[offset:offset + n])
+
+    def to_linear_system(self):
+        from .linsys import LinearSystem
+        return LinearSystem(list(self))
+
+
+def dumps(objs, dtype='float64', scale=6):
+    # A LinearSystem is stored as its equations
+    objs = list(getattr(objs, 'planes', objs))
+    kind, values = record_values(objs[0])
+    dimension = len(values) - 1 if kind == KIND_EQUATION else len(values)
+
+    buf = io.BytesIO()
+    writer = RecordWriter(buf, kind, dimension, dtype, scale)
+    writer.extend(objs)
+    writer.write_header()
+    return buf.getvalue()
+
+
+def loads(buf):
+    return list(RecordReader(buf))
+
+
+def compare_with_pickle(objs, dtype='float64', repeat=5):
+    from .profiling import best_time
+
+    packed = dumps(objs, dtype)
+    pickled = pickle.dumps(list(getattr(objs, 'planes', objs)))
+
+    return {
+        'binary_bytes': len(packed),
+        'pickle_bytes': len(pickled),
+        'binary_open_sec': best_time(lambda: RecordReader(packed), repeat),
+        'binary_load_sec': best_time(lambda: loads(packed), repeat),
+        'pickle_load_sec': best_time(lambda: pickle.loads(pickled), repeat),
+    }
+
+
+"""
+vectors = [Vector([i, i * 0.5, -i]) for i in range(10000)]
+print(compare_with_pickle(vectors))
+print(compare_with_pickle(vectors, dtype='decimal'))
+
+with RecordWriter.open('planes.larf', KIND_EQUATION, 3, dtype='decimal', scale=9) as w:
+    w.append(Plane(Vector(['1', '1', '1']), '1'))
+    w.append(Plane(Vector(['0', '1', '0']), '2'))
+
+with RecordReader.open('planes.larf') as r:
+    print(len(r), r.raw(1).tolist(), r[0])
+"""
@@ -0,0 +1,315 @@
+import asyncio
+import json
+import time
+from math import sqrt
+
+from .lu import LUFactorization
+
+
+class ServiceMetrics(object):
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.total_queue_latency = 0.0
+        self.max_queue_latency = 0.0
+
+    def record_batch(self, enqueue_times, now):
+        self.batches += 1
+        self.requests += len(enqueue_times)
+        for t in enqueue_times:
+            latency = now - t
+            self.total_queue_latency += latency
+            self.max_queue_latency = max(self.max_queue_latency, latency)
+
+    def as_dict(self):
+        elapsed = time.perf_counter() - self.started_at
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'batches': self.batches,
+            'mean_batch_size': self.requests / self.batches if self.batches else 0.0,
+            'throughput_per_sec': self.requests / elapsed if elapsed else 0.0,
+            'mean_queue_latency_ms': 1000 * self.total_queue_latency / self.requests if self.requests else 0.0,
+            'max_queue_latency_ms': 1000 * self.max_queue_latency,
+        }
+
+
+class SolverService(object):
+
+    UNKNOWN_OP_MSG = 'Unknown operation {}'
+    INVALID_REQUEST_MSG = 'A request must be a JSON object'
+    CANNOT_PROJECT_ONTO_ZERO_VECTOR_MSG = 'No unique parallel component'
+
+    def __init__(self, batch_window=0.002, max_batch_size=256, tolerance=1e-10):
+        # Requests with the same operation and shape that arrive within
+        # batch_window seconds of each other are computed together
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.tolerance = tolerance
+        self.pending = {}
+        self.metrics = ServiceMetrics()
+        self.handlers = {
+            'solve': self.solve_batch,
+            'intersect': self.intersect_batch,
+            'project': self.project_batch,
+        }
+
+    @staticmethod
+    def shape_of(op, payload):
+        if op == 'solve':
+            a = payload['coefficients']
+            return (len(a), len(a[0]) if a else 0)
+        if op == 'intersect':
+            return len(payload['lines'][0][0])
+        if op == 'project':
+            return len(payload['vector'])
+        return None
+
+    async def submit(self, op, payload):
+        if op not in self.handlers:
+            raise Exception(self.UNKNOWN_OP_MSG.format(op))
+
+        loop = asyncio.get_running_loop()
+        key = (op, self.shape_of(op, payload))
+        batch = self.pending.get(key)
+        if batch is None:
+            batch = self.pending[key] = []
+            loop.call_later(self.batch_window, self.flush, key, batch)
+
+        future = loop.create_future()
+        batch.append((payload, future, time.perf_counter()))
+        if len(batch) >= self.max_batch_size:
+            self.flush(key, batch)
+        return await future
+
+    def flush(self, key, batch):
+        # The timer of a batch that was already flushed for being full must
+        # not cut short the next batch collected under the same key
+        if self.pending.get(key) is not batch:
+            return
+        del self.pending[key]
+
+        self.metrics.record_batch([t for _, _, t in batch], time.perf_counter())
+        payloads = [p for p, _, _ in batch]
+        results = self.handlers[key[0]](payloads)
+
+        for (_, future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                self.metrics.errors += 1
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def solve_batch(self, payloads):
+        # Systems sharing a coefficient matrix are factored only once
+        factorizations = {}
+        results = []
+        for p in payloads:
+            try:
+                key = tuple(tuple(row) for row in p['coefficients'])
+                f = factorizations.get(key)
+                if f is None:
+                    f = factorizations[key] = LUFactorization(p['coefficients'], self.tolerance)
+                results.append({'solution': f.solve(p['constants'])})
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def intersect_batch(self, payloads):
+        results = []
+        for p in payloads:
+            try:
+                ((a, b), k1), ((c, d), k2) = p['lines']
+                denom = a*d - b*c
+                if abs(denom) < self.tolerance:
+                    # Parallel lines: coincident when one equation is a
+                    # multiple of the other, otherwise no intersection
+                    coincident = abs(a*k2 - c*k1) < self.tolerance and abs(b*k2 - d*k1) < self.tolerance
+                    results.append({'point': None, 'coincident': coincident})
+                else:
+                    results.append({'point': [(d*k1 - b*k2) / denom, (a*k2 - c*k1) / denom],
+                                    'coincident': False})
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def project_batch(self, payloads):
+        # Each distinct basis vector is normalized once per batch
+        unit_bases = {}
+        results = []
+        for p in payloads:
+            try:
+                key = tuple(p['basis'])
+                u = unit_bases.get(key)
+                if u is None:
+                    magnitude = sqrt(sum(x * x for x in key))
+                    if magnitude < self.tolerance:
+                        raise Exception(self.CANNOT_PROJECT_ONTO_ZERO_VECTOR_MSG)
+                    u = unit_bases[key] = [x / magnitude for x in key]
+
+                v = p['vector']
+                weight = sum(x * y for x, y in zip(v, u))
+                parallel = [weight * x for x in u]
+                results.append({'parallel': parallel,
+                                'orthogonal': [x - y for x, y in zip(v, parallel)]})
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def handle_connection(self, reader, writer):
+        # Newline delimited JSON: {"id": ..., "op": ..., ...} per line.
+        # Every request is answered independently so one slow or failing
+        # request does not hold up the rest of the connection
+        tasks = set()
+        lock = asyncio.Lock()
+
+        async def respond(message):
+            request_id = None
+            try:
+                if not isinstance(message, dict):
+                    raise Exception(self.INVALID_REQUEST_MSG)
+                request_id = message.get('id')
+                op = message.get('op')
+                if op == 'metrics':
+                    response = {'id': request_id, 'result': self.metrics.as_dict()}
+                else:
+                    response = {'id': request_id, 'result': await self.submit(op, message)}
+            except Exception as e:
+                response = {'id': request_id, 'error': str(e)}
+            async with lock:
+                # Once the client has gone away the remaining answers have
+                # nowhere to go, so they are dropped instead of written
+                if writer.is_closing():
+                    return
+                try:
+                    writer.write((json.dumps(response) + '\n').encode())
+                    await writer.drain()
+                except ConnectionError:
+                    writer.close()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    message = None
+                task = asyncio.ensure_future(respond(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle_connection, path=path)
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+class SolverClient(object):
+
+    CONNECTION_CLOSED_MSG = 'Connection to the solver service closed'
+    BAD_RESPONSE_MSG = 'Malformed response from the solver service: {}'
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.waiting = {}
+        self.listener = asyncio.ensure_future(self.listen())
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=8765, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def listen(self):
+        # Once the connection closes or a response cannot be read, no
+        # pending request can be answered any more, so they all fail
+        error = Exception(self.CONNECTION_CLOSED_MSG)
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    response = json.loads(line)
+                    future = self.waiting.pop(response['id'], None)
+                except (ValueError, TypeError, KeyError) as e:
+                    error = Exception(self.BAD_RESPONSE_MSG.format(e))
+                    break
+                if future is None or future.done():
+                    continue
+                if 'error' in response:
+                    future.set_exception(Exception(response['error']))
+                else:
+                    future.set_result(response.get('result'))
+        except Exception as e:
+            error = e
+        finally:
+            waiting, self.waiting = self.waiting, {}
+            for future in waiting.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def request(self, op, **payload):
+        if self.listener.done():
+            raise Exception(self.CONNECTION_CLOSED_MSG)
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[self.next_id] = future
+        payload.update(id=self.next_id, op=op)
+        self.writer.write((json.dumps(payload) + '\n').encode())
+        await self.writer.drain()
+        return await future
+
+    def solve(self, coefficients, constants):
+        return self.request('solve', coefficients=coefficients, constants=constants)
+
+    def intersect(self, line1, line2):
+        # A line is [normal_vector, constant_term]
+        return self.request('intersect', lines=[line1, line2])
+
+    def project(self, vector, basis):
+        return self.request('project', vector=vector, basis=basis)
+
+    def metrics(self):
+        return self.request('metrics')
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.listener
+
+
+"""
+async def main():
+    service = SolverService(batch_window=0.005)
+    server = await service.start(port=8765)
+    client = await SolverClient.connect(port=8765)
+
+    results = await asyncio.gather(
+        client.solve([[2, 1], [1, 3]], [3, 5]),
+        client.solve([[2, 1], [1, 3]], [1, 1]),
+        client.intersect([[4.046, 2.836], 1.21], [[10.115, 7.09], 3.025]),
+        client.project([3.039, 1.879], [0.825, 2.036]))
+    print(results)
+    print(await client.metrics())
+
+    await client.close()
+    server.close()
+
+asyncio.run(main())
+"""
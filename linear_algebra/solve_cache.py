@@ -0,0 +1,178 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal, getcontext
+
+from .vector import Vector
+from .lu import LUFactorization
+from .parallel_elimination import ParallelEliminator
+from .precision import current_tolerance, local_precision
+
+
+def canonical_key(coefficients, constants):
+    # Equal values hash equally whatever their spelling ('1', '1.0',
+    # '1E+0'), and the Decimal precision and near-zero tolerance are part
+    # of the key because the cached results (and whether the LU
+    # factorization counts as singular) depend on them
+    def canonical(x):
+        x = Decimal(x)
+        return '0' if x == 0 else str(x.normalize())
+
+    h = hashlib.sha256()
+    h.update('{}x{};prec={};tolerance={!r}\n'.format(
+        len(coefficients), len(coefficients[0]), getcontext().prec, current_tolerance()).encode())
+    for row, c in zip(coefficients, constants):
+        h.update((','.join(canonical(a) for a in row) + '=' + canonical(c) + '\n').encode())
+    return h.hexdigest()
+
+
+class CachedSolution(object):
+
+    def __init__(self, triangular_rows, triangular_constants, lu, permutation, solution):
+        self.triangular_rows = triangular_rows
+        self.triangular_constants = triangular_constants
+        self.lu = lu
+        self.permutation = permutation
+        self.solution = solution
+
+    @classmethod
+    def compute(cls, coefficients, constants):
+        rows, row_constants = ParallelEliminator(workers=1).triangular_form(coefficients, constants)
+        f = LUFactorization(coefficients, convert=Decimal)
+        return cls(rows, row_constants, f.lu, f.permutation, Vector(f.solve(constants)))
+
+    def dumps(self):
+        return json.dumps({
+            'triangular_rows': [[str(x) for x in row] for row in self.triangular_rows],
+            'triangular_constants': [str(x) for x in self.triangular_constants],
+            'lu': [[str(x) for x in row] for row in self.lu],
+            'permutation': self.permutation,
+            'solution': [str(x) for x in self.solution],
+        })
+
+    @classmethod
+    def loads(cls, text):
+        d = json.loads(text)
+        return cls([[Decimal(x) for x in row] for row in d['triangular_rows']],
+                   [Decimal(x) for x in d['triangular_constants']],
+                   [[Decimal(x) for x in row] for row in d['lu']],
+                   d['permutation'],
+                   Vector(d['solution']))
+
+
+class SolveCache(object):
+
+    def __init__(self, path=None, memory_entries=1024, disk_bytes=256 * 1024 * 1024):
+        # path=None keeps only the in-memory LRU tier
+        self.memory = OrderedDict()
+        self.memory_entries = memory_entries
+        self.disk_bytes = disk_bytes
+        self.lock = threading.Lock()
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute('CREATE TABLE IF NOT EXISTS solutions '
+                            '(key TEXT PRIMARY KEY, value TEXT, size INTEGER, last_used REAL)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS solutions_last_used ON solutions (last_used)')
+            self.db.commit()
+
+    def remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory.move_to_end(key)
+                self.hits_memory += 1
+                return entry
+
+            if self.db is not None:
+                row = self.db.execute('SELECT value FROM solutions WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    self.db.execute('UPDATE solutions SET last_used = ? WHERE key = ?', (time.time(), key))
+                    self.db.commit()
+                    entry = CachedSolution.loads(row[0])
+                    self.remember(key, entry)
+                    self.hits_disk += 1
+                    return entry
+
+            self.misses += 1
+            return None
+
+    def store(self, key, entry):
+        with self.lock:
+            self.remember(key, entry)
+            if self.db is None:
+                return
+
+            value = entry.dumps()
+            self.db.execute('INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?)',
+                            (key, value, len(value), time.time()))
+            # Least recently used entries go first once the tier is full
+            total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM solutions').fetchone()[0]
+            while total > self.disk_bytes:
+                oldest, size = self.db.execute(
+                    'SELECT key, size FROM solutions ORDER BY last_used LIMIT 1').fetchone()
+                self.db.execute('DELETE FROM solutions WHERE key = ?', (oldest,))
+                total -= size
+                self.evictions += 1
+            self.db.commit()
+
+    def solve(self, system, constants=None):
+        # system is a LinearSystem, solved and keyed under its own
+        # precision and tolerance, or coefficient rows with constants,
+        # solved and keyed under the caller's
+        if constants is None:
+            with local_precision(system.precision, system.tolerance):
+                return self.solve(*system.matrix_form())
+
+        key = canonical_key(system, constants)
+        entry = self.lookup(key)
+        if entry is None:
+            entry = CachedSolution.compute(system, constants)
+            self.store(key, entry)
+        return entry
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits_memory + self.hits_disk + self.misses
+            disk_entries = 0
+            if self.db is not None:
+                disk_entries = self.db.execute('SELECT COUNT(*) FROM solutions').fetchone()[0]
+            return {
+                'hits_memory': self.hits_memory,
+                'hits_disk': self.hits_disk,
+                'misses': self.misses,
+                'hit_rate': (self.hits_memory + self.hits_disk) / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'memory_entries': len(self.memory),
+                'disk_entries': disk_entries,
+            }
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+"""
+cache = SolveCache('solutions.sqlite')
+s = LinearSystem([Plane(Vector(['0', '1', '1']), '1'),
+                  Plane(Vector(['1', '-1', '1']), '2'),
+                  Plane(Vector(['1', '2', '-5']), '3')])
+print(cache.solve(s).solution)
+print(cache.solve(s).solution)
+print(cache.stats())
+"""
@@ -0,0 +1,141 @@
+import heapq
+from bisect import bisect_left
+from math import sqrt
+
+from .plane import equation_terms
+
+
+class Bucket(object):
+
+    def __init__(self, center):
+        self.center = center
+        self.members = []
+
+    def freeze(self):
+        # Members are sorted by offset so a query only walks outwards from
+        # its own offset until no closer member can remain
+        self.members.sort(key=lambda m: m[1])
+        self.offsets = [m[1] for m in self.members]
+        self.spread = max(sqrt(sum((a - b) ** 2 for a, b in zip(u, self.center)))
+                          for u, _, _ in self.members)
+
+
+class HyperplaneIndex(object):
+
+    ZERO_NORMAL_MSG = 'Cannot index an equation whose normal vector is zero'
+    DIMENSION_MISMATCH_MSG = 'Points must have dimension {}'
+
+    def __init__(self, equations, resolution=0.05):
+        # equations are Lines, Planes or (normal_vector, constant_term)
+        # pairs. Each one is rewritten as u.x = c with u a unit vector, so
+        # the distance of x to it is |u.x - c|. Equations whose unit
+        # normals fall in the same grid cell share a bucket: for a bucket
+        # centered on u0 with every |u - u0| <= spread,
+        #     |u.x - c| >= |u0.x - c| - spread * |x|
+        # which lets a query skip most of the bucket after a binary search.
+        self.resolution = resolution
+        self.dimension = None
+        buckets = {}
+
+        for index, e in enumerate(equations):
+            n, c = equation_terms(e)
+            n = [float(x) for x in n]
+            c = float(c)
+            if self.dimension is None:
+                self.dimension = len(n)
+
+            magnitude = sqrt(sum(x * x for x in n))
+            if magnitude == 0:
+                raise Exception(self.ZERO_NORMAL_MSG)
+            u = [x / magnitude for x in n]
+            c = c / magnitude
+
+            # u and -u describe the same family of parallel hyperplanes
+            first = next(x for x in u if x != 0)
+            if first < 0:
+                u = [-x for x in u]
+                c = -c
+
+            key = tuple(int(round(x / resolution)) for x in u)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = Bucket([k * resolution for k in key])
+            bucket.members.append((u, c, index))
+
+        for bucket in buckets.values():
+            bucket.freeze()
+        self.buckets = list(buckets.values())
+        self.size = sum(len(b.members) for b in self.buckets)
+
+    def __len__(self):
+        return self.size
+
+    def candidates(self, x, bucket, bound):
+        # Members of bucket in order of increasing lower bound, stopping
+        # once the lower bound exceeds bound() (re-read after each yield)
+        s = sum(a * b for a, b in zip(bucket.center, x))
+        slack = bucket.spread * sqrt(sum(a * a for a in x))
+        offsets = bucket.offsets
+
+        right = bisect_left(offsets, s)
+        left = right - 1
+        while left >= 0 or right < len(offsets):
+            if right >= len(offsets) or (left >= 0 and s - offsets[left] <= offsets[right] - s):
+                gap, i = s - offsets[left], left
+                left -= 1
+            else:
+                gap, i = offsets[right] - s, right
+                right += 1
+            if gap - slack > bound():
+                return
+            yield bucket.members[i]
+
+    def check_point(self, x):
+        x = [float(a) for a in x]
+        if len(x) != self.dimension:
+            raise Exception(self.DIMENSION_MISMATCH_MSG.format(self.dimension))
+        return x
+
+    def nearest(self, points, k=1):
+        # For each point, the k closest equations as (distance, index)
+        results = []
+        for x in points:
+            x = self.check_point(x)
+            best = []   # max-heap of (-distance, index)
+
+            def bound():
+                return -best[0][0] if len(best) == k else float('inf')
+
+            for bucket in self.buckets:
+                for u, c, index in self.candidates(x, bucket, bound):
+                    d = abs(sum(a * b for a, b in zip(u, x)) - c)
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, index))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, index))
+
+            results.append(sorted((-d, index) for d, index in best))
+        return results
+
+    def within(self, points, radius):
+        # For each point, every equation no further than radius away
+        results = []
+        for x in points:
+            x = self.check_point(x)
+            found = []
+            for bucket in self.buckets:
+                for u, c, index in self.candidates(x, bucket, lambda: radius):
+                    d = abs(sum(a * b for a, b in zip(u, x)) - c)
+                    if d <= radius:
+                        found.append((d, index))
+            results.append(sorted(found))
+        return results
+
+
+"""
+planes = [Plane(Vector(['0', '0', '1']), str(z)) for z in range(100)]
+planes.append(Plane(Vector(['1', '1', '0']), '0'))
+index = HyperplaneIndex(planes)
+print(index.nearest([[0, 0, 41.3], [5, -5, 80]], k=2))
+print(index.within([[0, 0, 41.3]], radius=1.0))
+"""
@@ -0,0 +1,174 @@
+import mmap
+import sys
+from array import array
+from math import sqrt
+from operator import mul
+
+from .vector import Vector
+from .precision import current_tolerance
+from .serialization import (HEADER, MAGIC, VERSION, KIND_VECTOR, DTYPE_FLOAT64,
+                            FormatError, read_header)
+
+
+class ChunkedVector(object):
+
+    CANNOT_NORMALIZE_ZERO_VECTOR_MSG = Vector.CANNOT_NORMALIZE_ZERO_VECTOR_MSG
+    DIMENSION_MISMATCH_MSG = 'Vector dimensions do not match'
+    NOT_A_FLOAT_VECTOR_MSG = 'File does not hold a single float64 vector'
+    BIG_ENDIAN_MSG = 'Memory mapped vectors need a little endian host'
+
+    def __init__(self, values, chunk_size=1 << 16):
+        # values is a float64 buffer: an array('d') or a memoryview over a
+        # memory mapped file. Every operation reads it chunk_size
+        # coordinates at a time, so no more than one chunk of temporaries
+        # exists at once however long the vector is.
+        self.values = memoryview(values)
+        self.dimension = len(self.values)
+        self.chunk_size = chunk_size
+        self.mmap = None
+        self.file = None
+
+    @classmethod
+    def from_iterable(cls, coordinates, chunk_size=1 << 16):
+        return cls(array('d', (float(x) for x in coordinates)), chunk_size)
+
+    @classmethod
+    def create(cls, path, dimension, chunk_size=1 << 16):
+        # A zero vector in a single-record file of the serialization format
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, KIND_VECTOR, DTYPE_FLOAT64, 0, dimension, 1, 0, 0))
+            f.truncate(HEADER.size + 8 * dimension)
+        return cls.open(path, writable=True, chunk_size=chunk_size)
+
+    @classmethod
+    def open(cls, path, writable=False, chunk_size=1 << 16):
+        if sys.byteorder != 'little':
+            raise FormatError(cls.BIG_ENDIAN_MSG)
+
+        f = open(path, 'r+b' if writable else 'rb')
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        header = read_header(m)
+        if (header['kind'] != KIND_VECTOR or header['dtype'] != DTYPE_FLOAT64 or
+                len(m) != HEADER.size + 8 * header['dimension']):
+            m.close()
+            f.close()
+            raise FormatError(cls.NOT_A_FLOAT_VECTOR_MSG)
+
+        v = cls(memoryview(m)[HEADER.size:].cast('d'), chunk_size)
+        v.mmap = m
+        v.file = f
+        return v
+
+    def close(self):
+        if self.mmap is not None:
+            self.values.release()
+            self.mmap.flush()
+            self.mmap.close()
+            self.file.close()
+            self.mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.dimension
+
+    def __getitem__(self, i):
+        return self.values[i]
+
+    def chunks(self):
+        # Each chunk view is released once the caller moves on, so a
+        # leftover loop variable cannot keep the file mapped
+        for start in range(0, self.dimension, self.chunk_size):
+            chunk = self.values[start:start + self.chunk_size]
+            try:
+                yield start, chunk
+            finally:
+                chunk.release()
+
+    def check_dimension(self, v):
+        if v.dimension != self.dimension:
+            raise Exception(self.DIMENSION_MISMATCH_MSG)
+
+    def dot(self, v):
+        self.check_dimension(v)
+        total = 0.0
+        for start, chunk in self.chunks():
+            total += sum(map(mul, chunk, v.values[start:start + len(chunk)]))
+        return total
+
+    def magnitude(self):
+        # Scaled by the largest coordinate so squares of huge or tiny
+        # coordinates neither overflow nor underflow
+        largest = 0.0
+        for _, chunk in self.chunks():
+            largest = max(largest, max(map(abs, chunk)))
+        if largest == 0:
+            return 0.0
+
+        total = 0.0
+        for _, chunk in self.chunks():
+            total += sum((x / largest) ** 2 for x in chunk)
+        return largest * sqrt(total)
+
+    def is_zero(self, tolerance=None):
+        if tolerance is None:
+            tolerance = current_tolerance()
+        return self.magnitude() < tolerance
+
+    @staticmethod
+    def output(dimension, path, chunk_size):
+        if path is None:
+            return ChunkedVector(array('d', bytes(8 * dimension)), chunk_size)
+        return ChunkedVector.create(path, dimension, chunk_size)
+
+    @staticmethod
+    def linear_combination(coefficients, vectors, path=None):
+        # sum(c_i * v_i), written chunk by chunk into a new in-memory
+        # vector, or into a new memory mapped file at path
+        first = vectors[0]
+        for v in vectors:
+            first.check_dimension(v)
+
+        out = ChunkedVector.output(first.dimension, path, first.chunk_size)
+        for start, _ in out.chunks():
+            end = min(start + out.chunk_size, out.dimension)
+            result = array('d', [0.0]) * (end - start)
+            for c, v in zip(coefficients, vectors):
+                c = float(c)
+                result = array('d', [r + c * x for r, x in zip(result, v.values[start:end])])
+            out.values[start:end] = result
+        return out
+
+    def plus(self, v, path=None):
+        return ChunkedVector.linear_combination([1, 1], [self, v], path)
+
+    def minus(self, v, path=None):
+        return ChunkedVector.linear_combination([1, -1], [self, v], path)
+
+    def times_scalar(self, c, path=None):
+        return ChunkedVector.linear_combination([c], [self], path)
+
+    def normalized(self, path=None):
+        magnitude = self.magnitude()
+        if magnitude == 0:
+            raise Exception(self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+        return self.times_scalar(1.0 / magnitude, path)
+
+    def to_vector(self):
+        return Vector(list(self.values))
+
+
+"""
+with ChunkedVector.create('embedding.larf', 10**7) as v:
+    for start, chunk in v.chunks():
+        v.values[start:start + len(chunk)] = array('d', (float(i % 7) for i in range(start, start + len(chunk))))
+
+with ChunkedVector.open('embedding.larf') as v:
+    print(v.magnitude())
+    with v.normalized('unit.larf') as u:
+        print(u.dot(v))
+"""
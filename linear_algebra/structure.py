@@ -0,0 +1,160 @@
+from .precision import current_tolerance
+
+
+class MatrixStructure(object):
+
+    def __init__(self, coefficients):
+        # Bandwidths count exact zeros only: a tiny coefficient still
+        # couples its two variables
+        n = len(coefficients)
+        lower = 0
+        upper = 0
+        strictly_dominant = True
+        weakly_dominant = True
+
+        for i, row in enumerate(coefficients):
+            off_diagonal = 0
+            for j, a in enumerate(row):
+                if a == 0:
+                    continue
+                if j < i:
+                    lower = max(lower, i - j)
+                elif j > i:
+                    upper = max(upper, j - i)
+                if j != i:
+                    off_diagonal += abs(a)
+            diagonal = abs(row[i]) if i < len(row) else 0
+            if not diagonal > off_diagonal:
+                strictly_dominant = False
+            if not diagonal >= off_diagonal:
+                weakly_dominant = False
+
+        self.size = n
+        self.lower_bandwidth = lower
+        self.upper_bandwidth = upper
+        self.strictly_diagonally_dominant = strictly_dominant
+        self.weakly_diagonally_dominant = weakly_dominant
+
+    def is_diagonal(self):
+        return self.lower_bandwidth == 0 and self.upper_bandwidth == 0
+
+    def is_lower_triangular(self):
+        return self.upper_bandwidth == 0
+
+    def is_upper_triangular(self):
+        return self.lower_bandwidth == 0
+
+    def is_tridiagonal(self):
+        return self.lower_bandwidth <= 1 and self.upper_bandwidth <= 1
+
+    def is_banded(self, max_fraction=0.25):
+        # Worth a banded solver when the band is narrow next to n
+        return self.lower_bandwidth + self.upper_bandwidth + 1 <= max(3, max_fraction * self.size)
+
+    def __str__(self):
+        return 'n={}, bandwidth=({}, {}), diagonally dominant={}'.format(
+            self.size, self.lower_bandwidth, self.upper_bandwidth,
+            'strict' if self.strictly_diagonally_dominant else
+            'weak' if self.weakly_diagonally_dominant else 'no')
+
+
+class BandedSolver(object):
+
+    # Elimination without pivoting: safe for diagonally dominant matrices,
+    # otherwise a tiny pivot raises ZERO_PIVOT_MSG and the caller falls
+    # back to a pivoting dense solve
+    ZERO_PIVOT_MSG = 'Zero pivot in banded elimination'
+
+    def __init__(self, coefficients, lower, upper, tolerance=None):
+        if tolerance is None:
+            tolerance = current_tolerance()
+        n = len(coefficients)
+        self.size = n
+        self.lower = lower
+        self.upper = upper
+
+        # bands[i][k] holds A[i][i - lower + k]; only lower + upper + 1
+        # values per row are ever stored
+        width = lower + upper + 1
+        bands = []
+        for i, row in enumerate(coefficients):
+            band = [row[i - lower + k] if 0 <= i - lower + k < n else 0
+                    for k in range(width)]
+            bands.append(band)
+
+        # LU in place on the bands: O(n * lower * upper)
+        for k in range(n):
+            pivot = bands[k][lower]
+            if abs(pivot) < tolerance:
+                raise Exception(self.ZERO_PIVOT_MSG)
+            for i in range(k + 1, min(k + lower + 1, n)):
+                offset = k - i + lower          # column k inside row i
+                multiplier = bands[i][offset] / pivot
+                bands[i][offset] = multiplier
+                for j in range(1, upper + 1):
+                    if k + j >= n:
+                        break
+                    bands[i][offset + j] -= multiplier * bands[k][lower + j]
+        self.bands = bands
+
+    def solve(self, constants):
+        n, lower, upper, bands = self.size, self.lower, self.upper, self.bands
+        y = list(constants)
+        for i in range(n):
+            for j in range(max(0, i - lower), i):
+                y[i] -= bands[i][j - i + lower] * y[j]
+
+        x = list(y)
+        for i in range(n - 1, -1, -1):
+            for j in range(i + 1, min(i + upper + 1, n)):
+                x[i] -= bands[i][j - i + lower] * x[j]
+            x[i] /= bands[i][lower]
+        return x
+
+
+def thomas_solve(coefficients, constants, tolerance=None):
+    # Tridiagonal systems in O(n), reading only the three diagonals
+    if tolerance is None:
+        tolerance = current_tolerance()
+    n = len(coefficients)
+    sub = [coefficients[i][i - 1] if i > 0 else 0 for i in range(n)]
+    diag = [coefficients[i][i] for i in range(n)]
+    sup = [coefficients[i][i + 1] if i < n - 1 else 0 for i in range(n)]
+
+    c = [0] * n
+    d = [0] * n
+    for i in range(n):
+        denom = diag[i] - (sub[i] * c[i - 1] if i > 0 else 0)
+        if abs(denom) < tolerance:
+            raise Exception(BandedSolver.ZERO_PIVOT_MSG)
+        c[i] = sup[i] / denom
+        d[i] = (constants[i] - (sub[i] * d[i - 1] if i > 0 else 0)) / denom
+
+    x = d
+    for i in range(n - 2, -1, -1):
+        x[i] = d[i] - c[i] * x[i + 1]
+    return x
+
+
+def triangular_solve(coefficients, constants, lower, tolerance=None):
+    if tolerance is None:
+        tolerance = current_tolerance()
+    n = len(coefficients)
+    x = list(constants)
+    order = range(n) if lower else range(n - 1, -1, -1)
+    for i in order:
+        row = coefficients[i]
+        if abs(row[i]) < tolerance:
+            raise Exception(BandedSolver.ZERO_PIVOT_MSG)
+        others = range(i) if lower else range(i + 1, n)
+        x[i] = (x[i] - sum(row[j] * x[j] for j in others)) / row[i]
+    return x
+
+
+"""
+a = [[4, 1, 0, 0], [1, 4, 1, 0], [0, 1, 4, 1], [0, 0, 1, 4]]
+s = MatrixStructure(a)
+print(s, s.is_tridiagonal())
+print(thomas_solve(a, [5, 6, 6, 5]))
+print(BandedSolver(a, 1, 1).solve([5, 6, 6, 5]))
+"""
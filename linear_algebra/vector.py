@@ -1,7 +1,7 @@
 from math import sqrt, acos, pi
-from decimal import Decimal, getcontext
+from decimal import Decimal
 
-getcontext().prec = 30
+from .precision import current_tolerance
 
 class Vector(object):
 
@@ -64,7 +64,9 @@ class Vector(object):
         return sum([x * y for x, y in zip(self.coordinates, v.coordinates)])
     
     @staticmethod
-    def replace_if_within_tolerance(val, compare_with, tolerance=1e-10):
+    def replace_if_within_tolerance(val, compare_with, tolerance=None):
+        if tolerance is None:
+            tolerance = current_tolerance()
         if abs(val - compare_with) < tolerance:
             return compare_with
         else:
@@ -94,10 +96,14 @@ class Vector(object):
             else:
                 raise e
     
-    def is_zero(self, tolerance=1e-10):
+    def is_zero(self, tolerance=None):
+        if tolerance is None:
+            tolerance = current_tolerance()
         return self.magnitude() < tolerance
 
-    def is_orthogonal_to(self, v, tolerance=1e-10):
+    def is_orthogonal_to(self, v, tolerance=None):
+        if tolerance is None:
+            tolerance = current_tolerance()
         return abs(self.dot(v)) < tolerance
 
     def is_parallel_to(self, v):
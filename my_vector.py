@@ -269,107 +269,106 @@ Cross Product
 
 """
 
-my_vector = Vector([1,2,3])
-print(my_vector)
+if __name__ == '__main__':
+    my_vector = Vector([1,2,3])
+    print(my_vector)
 
-my_vector2 = Vector([1,2,3])
-print(my_vector == my_vector2) #True
+    my_vector2 = Vector([1,2,3])
+    print(my_vector == my_vector2) #True
 
-my_vector3 = Vector([3,2,1])
-print(my_vector == my_vector3) #False
+    my_vector3 = Vector([3,2,1])
+    print(my_vector == my_vector3) #False
 
-print(my_vector.my_add(my_vector2))
+    print(my_vector.my_add(my_vector2))
 
-ex1_v1 = Vector([8.218, -9.341])
-ex1_v2 = Vector([-1.129, 2.111])
+    ex1_v1 = Vector([8.218, -9.341])
+    ex1_v2 = Vector([-1.129, 2.111])
 
-print("Add: {}".format(ex1_v1.my_add(ex1_v2)))
-print("Plus: {}".format(ex1_v1.plus(ex1_v2)))
+    print("Add: {}".format(ex1_v1.my_add(ex1_v2)))
+    print("Plus: {}".format(ex1_v1.plus(ex1_v2)))
 
-ex2_v1 = Vector([7.119, 8.215])
-ex2_v2 = Vector([-8.223, 0.878])
+    ex2_v1 = Vector([7.119, 8.215])
+    ex2_v2 = Vector([-8.223, 0.878])
 
-print("Subtract: {}".format(ex2_v1.my_subtract(ex2_v2)))
-print("minus: {}".format(ex2_v1.minus(ex2_v2)))
+    print("Subtract: {}".format(ex2_v1.my_subtract(ex2_v2)))
+    print("minus: {}".format(ex2_v1.minus(ex2_v2)))
 
-ex3_v1 = Vector([1.671, -1.012, -0.318])
+    ex3_v1 = Vector([1.671, -1.012, -0.318])
 
-print("Scale: {}".format(ex3_v1.my_multiply(7.41)))
-print("Mulyiply: {}".format(ex3_v1.times_scalar(7.41)))
+    print("Scale: {}".format(ex3_v1.my_multiply(7.41)))
+    print("Mulyiply: {}".format(ex3_v1.times_scalar(7.41)))
 
-mag_v1 = Vector([-0.221, 7.437])
-mag_v2 = Vector([8.813, -1.331, -6.247])
-print("magnitude mag_v1: {}".format(mag_v1.my_magnitude()))
-print("magnitude mag_v2: {}".format(mag_v2.my_magnitude()))
-print("magnitude mag_v1: {}".format(mag_v1.magnitude()))
-print("magnitude mag_v2: {}".format(mag_v2.magnitude()))
+    mag_v1 = Vector([-0.221, 7.437])
+    mag_v2 = Vector([8.813, -1.331, -6.247])
+    print("magnitude mag_v1: {}".format(mag_v1.my_magnitude()))
+    print("magnitude mag_v2: {}".format(mag_v2.my_magnitude()))
+    print("magnitude mag_v1: {}".format(mag_v1.magnitude()))
+    print("magnitude mag_v2: {}".format(mag_v2.magnitude()))
 
-dir_v1 = Vector([5.581, -2.136])
-dir_v2 = Vector([1.996, 3.108,-4.554])
+    dir_v1 = Vector([5.581, -2.136])
+    dir_v2 = Vector([1.996, 3.108,-4.554])
 
-print("direction of unit vector for dir_v1: {}".format(dir_v1.my_direction()))
-print("direction of unit vector for dir_v2: {}".format(dir_v2.my_direction()))
-print("direction of unit vector for dir_v1: {}".format(dir_v1.normalized()))
-print("direction of unit vector for dir_v2: {}".format(dir_v2.normalized()))
+    print("direction of unit vector for dir_v1: {}".format(dir_v1.my_direction()))
+    print("direction of unit vector for dir_v2: {}".format(dir_v2.my_direction()))
+    print("direction of unit vector for dir_v1: {}".format(dir_v1.normalized()))
+    print("direction of unit vector for dir_v2: {}".format(dir_v2.normalized()))
 
-dotprod_v1 = Vector([7.887, 4.138])
-dotprod_v2 = Vector([-8.802, 6.776])
-print("v1 * v2: {}".format(dotprod_v1.my_dotproduct(dotprod_v2)))
+    dotprod_v1 = Vector([7.887, 4.138])
+    dotprod_v2 = Vector([-8.802, 6.776])
+    print("v1 * v2: {}".format(dotprod_v1.my_dotproduct(dotprod_v2)))
 
-dotprod_v3 = Vector([-5.955, -4.904, -1.874])
-dotprod_v4 = Vector([-4.496, -8.755, 7.103])
-print("v3 * v4: {}".format(dotprod_v3.my_dotproduct(dotprod_v4)))
+    dotprod_v3 = Vector([-5.955, -4.904, -1.874])
+    dotprod_v4 = Vector([-4.496, -8.755, 7.103])
+    print("v3 * v4: {}".format(dotprod_v3.my_dotproduct(dotprod_v4)))
 
-angle_v1 = Vector([3.183, -7.627])
-angle_v2 = Vector([-2.668, 5.319])
-print("theta(v1, v2): {}".format(angle_v1.my_theta(angle_v2)))
+    angle_v1 = Vector([3.183, -7.627])
+    angle_v2 = Vector([-2.668, 5.319])
+    print("theta(v1, v2): {}".format(angle_v1.my_theta(angle_v2)))
 
-angle_v3 = Vector([7.35, 0.221, 5.188])
-angle_v4 = Vector([2.751, 8.259, 3.985])
-print("theta(v3, v4): {}".format(angle_v3.my_theta(angle_v4)))
+    angle_v3 = Vector([7.35, 0.221, 5.188])
+    angle_v4 = Vector([2.751, 8.259, 3.985])
+    print("theta(v3, v4): {}".format(angle_v3.my_theta(angle_v4)))
 
-orth_v1 = Vector([-7.579, -7.88])
-orth_v2 = Vector([22.737, 23.64])
-print("Dot product of v1 and v2: {}".format(orth_v1.my_dotproduct(orth_v2)))
-print("v1 multiplied by scalar: {}".format(orth_v1.my_multiply(3)))
+    orth_v1 = Vector([-7.579, -7.88])
+    orth_v2 = Vector([22.737, 23.64])
+    print("Dot product of v1 and v2: {}".format(orth_v1.my_dotproduct(orth_v2)))
+    print("v1 multiplied by scalar: {}".format(orth_v1.my_multiply(3)))
 
-orth_v3 = Vector([-2.029, 9.97, 4.172])
-orth_v4 = Vector([-9.231, -6.639, -7.245])
-print("Dot product of v3 and v4: {}".format(orth_v3.my_dotproduct(orth_v4)))
+    orth_v3 = Vector([-2.029, 9.97, 4.172])
+    orth_v4 = Vector([-9.231, -6.639, -7.245])
+    print("Dot product of v3 and v4: {}".format(orth_v3.my_dotproduct(orth_v4)))
 
-orth_v5 = Vector([-2.328, -7.284, -1.214])
-orth_v6 = Vector([-1.821, 1.072, -2.94])
-print("Dot product of v5 and v6: {}".format(orth_v5.my_dotproduct(orth_v6)))
+    orth_v5 = Vector([-2.328, -7.284, -1.214])
+    orth_v6 = Vector([-1.821, 1.072, -2.94])
+    print("Dot product of v5 and v6: {}".format(orth_v5.my_dotproduct(orth_v6)))
 
-orth_v7 = Vector([-2.328, -7.284, -1.214])
-orth_v8 = Vector([-1.821, 1.072, -2.94])
-print("Dot product of v5 and v6: {}".format(orth_v5.my_dotproduct(orth_v6)))
+    orth_v7 = Vector([-2.328, -7.284, -1.214])
+    orth_v8 = Vector([-1.821, 1.072, -2.94])
+    print("Dot product of v5 and v6: {}".format(orth_v5.my_dotproduct(orth_v6)))
 
-proj_v1 = Vector([3.039, 1.879])
-proj_v2 = Vector([0.825, 2.036])
-print("Projection of v1 onto v2: {}".format(proj_v1.my_parallel_proj_to(proj_v2)))
+    proj_v1 = Vector([3.039, 1.879])
+    proj_v2 = Vector([0.825, 2.036])
+    print("Projection of v1 onto v2: {}".format(proj_v1.my_parallel_proj_to(proj_v2)))
 
-proj_v3 = Vector([-9.88, -3.264, -8.159])
-proj_v4 = Vector([-2.155, -9.353, -9.473])
-print("Orthogonal of v3 onto v4: {}".format(proj_v3.my_orthogonal_proj_to(proj_v4)))
+    proj_v3 = Vector([-9.88, -3.264, -8.159])
+    proj_v4 = Vector([-2.155, -9.353, -9.473])
+    print("Orthogonal of v3 onto v4: {}".format(proj_v3.my_orthogonal_proj_to(proj_v4)))
 
-proj_v5 = Vector([3.009, -6.172, 3.692, -2.51])
-proj_v6 = Vector([6.404, -9.144, 2.759, 8.718])
-print("Projection of v5 onto v6: {}".format(proj_v5.my_parallel_proj_to(proj_v6)))
-print("Orthogonal of v5 onto v6: {}".format(proj_v5.my_orthogonal_proj_to(proj_v6)))
+    proj_v5 = Vector([3.009, -6.172, 3.692, -2.51])
+    proj_v6 = Vector([6.404, -9.144, 2.759, 8.718])
+    print("Projection of v5 onto v6: {}".format(proj_v5.my_parallel_proj_to(proj_v6)))
+    print("Orthogonal of v5 onto v6: {}".format(proj_v5.my_orthogonal_proj_to(proj_v6)))
 
-cross_v1 = Vector([8.462, 7.893, -8.187])
-cross_v2 = Vector([6.984, -5.975, 4.778])
-print("v1 cross v2: {}".format(cross_v1.my_crossproduct(cross_v2)))
-
-cross_v3 = Vector([-8.987, -9.838, 5.031])
-cross_v4 = Vector([-4.268, -1.861, -8.866])
-print("Area of parallelogram spanned by v3 and v4: {}".format(
-    cross_v3.my_crossproduct(cross_v4).my_magnitude()))
-
-cross_v5 = Vector([1.5, 9.547, 3.691])
-cross_v6 = Vector([-6.007, 0.124, 5.772])
-print("Area of triangle spanned by v5 and v6: {}".format(
-    cross_v5.my_crossproduct(cross_v6).my_magnitude() * 0.5))
+    cross_v1 = Vector([8.462, 7.893, -8.187])
+    cross_v2 = Vector([6.984, -5.975, 4.778])
+    print("v1 cross v2: {}".format(cross_v1.my_crossproduct(cross_v2)))
 
+    cross_v3 = Vector([-8.987, -9.838, 5.031])
+    cross_v4 = Vector([-4.268, -1.861, -8.866])
+    print("Area of parallelogram spanned by v3 and v4: {}".format(
+        cross_v3.my_crossproduct(cross_v4).my_magnitude()))
 
+    cross_v5 = Vector([1.5, 9.547, 3.691])
+    cross_v6 = Vector([-6.007, 0.124, 5.772])
+    print("Area of triangle spanned by v5 and v6: {}".format(
+        cross_v5.my_crossproduct(cross_v6).my_magnitude() * 0.5))
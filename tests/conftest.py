@@ -0,0 +1,14 @@
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.plane import Plane
+from linear_algebra.linsys import LinearSystem
+
+
+@pytest.fixture
+def system():
+    # Builds a LinearSystem of Planes from coefficient rows and constants;
+    # keyword arguments (precision, tolerance) go to LinearSystem
+    def make(coefficients, constants, **kwargs):
+        return LinearSystem([Plane(Vector(row), c) for row, c in zip(coefficients, constants)], **kwargs)
+    return make
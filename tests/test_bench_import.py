@@ -0,0 +1,7 @@
+import bench_import
+
+
+def test_import_budget():
+    # Fails when a cold import takes longer than IMPORT_BUDGET_MS, prints
+    # anything or loads one of the lazily imported engines
+    assert bench_import.main() == 0
@@ -0,0 +1,93 @@
+import json
+import os
+import random
+import zlib
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from linear_algebra.checkpoint import CheckpointedEliminator, CheckpointError
+from linear_algebra.precision import local_precision
+
+
+def random_system(convert, n=8, seed=0):
+    rng = random.Random(seed)
+    coefficients = [[convert(rng.randint(-9, 9)) for _ in range(n)] for _ in range(n)]
+    constants = [convert(rng.randint(-9, 9)) for _ in range(n)]
+    return coefficients, constants
+
+
+def run_interrupted(path, coefficients, constants, **kwargs):
+    # time_budget=0 runs out after every column, so each call does one
+    # column and leaves a checkpoint for the next
+    calls = 0
+    while True:
+        eliminator = CheckpointedEliminator(path, **kwargs)
+        result = eliminator.triangular_form(coefficients, constants, time_budget=0)
+        calls += 1
+        if result is not None:
+            return result, eliminator, calls
+
+
+@pytest.mark.parametrize('convert', [Fraction, Decimal])
+def test_resume_matches_uninterrupted_run(tmp_path, convert):
+    coefficients, constants = random_system(convert)
+    expected = CheckpointedEliminator(str(tmp_path / 'once')).triangular_form(coefficients, constants)
+
+    result, eliminator, calls = run_interrupted(str(tmp_path / 'resumed'), coefficients, constants)
+    assert calls > 1
+    assert eliminator.stats.resumed_from_column is not None
+    assert result == expected
+
+
+def test_solve_after_resume(tmp_path):
+    coefficients, constants = random_system(Fraction)
+    path = str(tmp_path / 'solve.ckpt')
+    eliminator = CheckpointedEliminator(path)
+    assert eliminator.solve(coefficients, constants, time_budget=0) is None
+    x = CheckpointedEliminator(path).solve(coefficients, constants)
+    assert [sum(a * b for a, b in zip(row, x)) for row in coefficients] == constants
+
+
+def test_checkpoint_removed_unless_kept(tmp_path):
+    coefficients, constants = random_system(Fraction)
+    path = str(tmp_path / 'solve.ckpt')
+    run_interrupted(path, coefficients, constants)
+    assert not os.path.exists(path)
+
+    run_interrupted(path, coefficients, constants, keep=True)
+    assert os.path.exists(path)
+
+
+def test_wrong_system(tmp_path):
+    coefficients, constants = random_system(Fraction)
+    path = str(tmp_path / 'solve.ckpt')
+    CheckpointedEliminator(path).triangular_form(coefficients, constants, time_budget=0)
+
+    other, _ = random_system(Fraction, seed=1)
+    with pytest.raises(CheckpointError, match='different system'):
+        CheckpointedEliminator(path).triangular_form(other, constants)
+
+
+def test_wrong_precision(tmp_path):
+    coefficients, constants = random_system(Decimal)
+    path = str(tmp_path / 'solve.ckpt')
+    CheckpointedEliminator(path).triangular_form(coefficients, constants, time_budget=0)
+    with local_precision(50):
+        with pytest.raises(CheckpointError, match='different system'):
+            CheckpointedEliminator(path).triangular_form(coefficients, constants)
+
+
+def test_unsupported_version(tmp_path):
+    coefficients, constants = random_system(Fraction)
+    path = str(tmp_path / 'solve.ckpt')
+    CheckpointedEliminator(path).triangular_form(coefficients, constants, time_budget=0)
+    with open(path, 'rb') as f:
+        state = json.loads(zlib.decompress(f.read()))
+    state['version'] = 99
+    with open(path, 'wb') as f:
+        f.write(zlib.compress(json.dumps(state).encode()))
+
+    with pytest.raises(CheckpointError, match=CheckpointedEliminator.UNSUPPORTED_VERSION_MSG.format(99)):
+        CheckpointedEliminator(path).triangular_form(coefficients, constants)
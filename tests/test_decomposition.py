@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from linear_algebra.decomposition import BlockDecomposition, solve_decomposed
+from linear_algebra.precision import local_precision
+
+
+# Two independent 2x2 systems on variables (0, 2) and (1, 3)
+DECOUPLED = [[2, 0, 1, 0], [0, 3, 0, 1], [1, 0, 1, 0], [0, 1, 0, 2]]
+DECOUPLED_CONSTANTS = [3, 4, 2, 3]
+
+# Lower block triangular: x0 alone, then (x1, x2) using x0, then x3
+CHAINED = [[2, 0, 0, 0], [1, 1, 1, 0], [0, 1, -1, 0], [0, 0, 1, 1]]
+CHAINED_CONSTANTS = [2, 4, 0, 5]
+
+
+def test_components_split_independent_variables():
+    d = BlockDecomposition(DECOUPLED, DECOUPLED_CONSTANTS)
+    assert sorted(sorted(b.variables) for b in d.components) == [[0, 2], [1, 3]]
+    assert sorted(sorted(b.equations) for b in d.components) == [[0, 2], [1, 3]]
+    assert all(len(stage) == 1 for stage in d.stages)
+
+
+def test_triangular_ordering_solves_blocks_in_dependency_order():
+    d = BlockDecomposition(CHAINED, CHAINED_CONSTANTS, ordering='triangular')
+    assert len(d.stages) == 1
+    assert [b.variables for b in d.stages[0]] == [[0], [1, 2], [3]]
+
+
+@pytest.mark.parametrize('coefficients, constants, ordering', [
+    (DECOUPLED, DECOUPLED_CONSTANTS, 'components'),
+    (DECOUPLED, DECOUPLED_CONSTANTS, 'triangular'),
+    (CHAINED, CHAINED_CONSTANTS, 'components'),
+    (CHAINED, CHAINED_CONSTANTS, 'triangular'),
+])
+def test_solve_decomposed_matches_solve(coefficients, constants, ordering, system):
+    s = system(coefficients, constants)
+    report = s.solve_decomposed(ordering=ordering)
+    assert report.method == 'blocks'
+    assert report.residual < Decimal('1e-20')
+    expected = s.solve().solution
+    assert all(abs(a - b) < Decimal('1e-20') for a, b in zip(report.solution, expected))
+
+
+def test_solve_decomposed_on_given_executor(system):
+    with ThreadPoolExecutor(2) as executor:
+        report = solve_decomposed(system(DECOUPLED, DECOUPLED_CONSTANTS), executor)
+    assert report.residual < Decimal('1e-20')
+
+
+def test_workers_use_callers_precision(system):
+    s = system([[3, 0], [0, 7]], [1, 1])
+    with local_precision(50):
+        report = solve_decomposed(s)
+    assert len(str(report.solution[0]).split('.')[1]) == 50
+
+
+def test_inconsistent_zero_row():
+    with pytest.raises(Exception, match=BlockDecomposition.NO_SOLUTIONS_MSG):
+        BlockDecomposition([[1, 0], [0, 0]], [1, 1])
+
+
+def test_underdetermined_component():
+    with pytest.raises(Exception, match=BlockDecomposition.NO_UNIQUE_SOLUTION_MSG):
+        BlockDecomposition([[1, 1, 0], [0, 0, 1]], [1, 1])
+
+
+def test_structurally_singular_block():
+    # Two equations that only use x0, one equation for x1 and x2
+    with pytest.raises(Exception, match=BlockDecomposition.NO_UNIQUE_SOLUTION_MSG):
+        BlockDecomposition([[1, 0, 0], [2, 0, 0], [0, 1, 1]], [1, 2, 1], ordering='triangular')
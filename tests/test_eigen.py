@@ -0,0 +1,107 @@
+import random
+from math import sqrt
+
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.plane import Plane
+from linear_algebra.linsys import LinearSystem
+from linear_algebra.lu import LUFactorization
+from linear_algebra.eigen import (LinearOperator, power_iteration, inverse_iteration, lanczos,
+                                  tridiagonal_eigen)
+
+# Adjacency rows of a small non-bipartite graph (it has a triangle)
+GRAPH = [{1: 1, 2: 1}, {0: 1, 2: 1, 3: 1}, {0: 1, 1: 1}, {1: 1}]
+GRAPH_TOP = 2.170086486626034
+PATH = [{1: 1}, {0: 1, 2: 1}, {1: 1}]
+
+
+def random_symmetric(n, seed=5):
+    rng = random.Random(seed)
+    m = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i, n):
+            m[i][j] = m[j][i] = rng.uniform(-1, 1)
+    m[0][0] += 5
+    return m
+
+
+def test_operator_from_dense_sparse_and_system():
+    dense = LinearOperator.from_matrix([[2, 1], [1, 3]])
+    sparse = LinearOperator.from_matrix([{0: 2, 1: 1}, {0: 1, 1: 3}])
+    system = LinearOperator.from_matrix(LinearSystem([Plane(Vector([2, 1]), 0), Plane(Vector([1, 3]), 0)]))
+    for op in (dense, sparse, system):
+        assert op.dimension == 2
+        assert op.matvec([1.0, 1.0]) == [3.0, 4.0]
+    assert dense.dense() == [[2.0, 1.0], [1.0, 3.0]]
+
+
+def test_power_iteration_graph():
+    result = power_iteration(GRAPH)
+    assert result.converged
+    assert result.eigenvalue == pytest.approx(GRAPH_TOP, rel=1e-9)
+    assert all(x > 0 for x in result.eigenvector)
+
+
+def test_power_iteration_bipartite_needs_shift():
+    assert not power_iteration(PATH, max_iterations=200).converged
+    result = power_iteration(PATH, shift=1.0)
+    assert result.converged
+    assert result.eigenvalue == pytest.approx(sqrt(2), rel=1e-9)
+
+
+def test_power_iteration_warm_start():
+    m = random_symmetric(30)
+    cold = power_iteration(m, max_iterations=5000)
+    warm = power_iteration(m, x0=cold.eigenvector)
+    assert cold.converged and warm.converged
+    assert warm.iterations < cold.iterations
+    assert warm.eigenvalue == pytest.approx(cold.eigenvalue, rel=1e-9)
+
+
+def test_inverse_iteration_finds_nearest_eigenvalue():
+    result = inverse_iteration(GRAPH, shift=-1.6)
+    assert result.converged
+    assert result.eigenvalue == pytest.approx(-1.4811943040920155, rel=1e-9)
+
+
+def test_inverse_iteration_reuses_factorization():
+    m = [[4.0, 1.0], [1.0, 3.0]]
+    f = LUFactorization(m)
+    result = inverse_iteration(m, factorization=f)
+    assert result.eigenvalue == pytest.approx((7 - sqrt(5)) / 2, rel=1e-9)
+
+
+def test_lanczos_matches_power_iteration():
+    m = random_symmetric(60)
+    results = lanczos(m, count=3)
+    assert len(results) == 3 and all(r.converged for r in results)
+    assert results[0].eigenvalue >= results[1].eigenvalue >= results[2].eigenvalue
+    top = power_iteration(m, x0=results[0].eigenvector)
+    assert results[0].eigenvalue == pytest.approx(top.eigenvalue, rel=1e-9)
+
+
+def test_lanczos_smallest():
+    result, = lanczos(GRAPH, which='smallest')
+    assert result.eigenvalue == pytest.approx(-1.4811943040920155, rel=1e-9)
+
+
+def test_lanczos_invariant_subspace():
+    # Starting on an eigenvector closes the Krylov space after one step
+    result, = lanczos([[2.0, 0.0], [0.0, 1.0]], x0=[1, 0])
+    assert result.iterations == 1
+    assert result.eigenvalue == pytest.approx(2.0)
+
+
+def test_tridiagonal_eigen():
+    values, vectors = tridiagonal_eigen([2, 2, 2], [1, 1])
+    assert sorted(values) == pytest.approx([2 - sqrt(2), 2, 2 + sqrt(2)])
+    for k, value in enumerate(values):
+        v = [row[k] for row in vectors]
+        tv = [2 * v[0] + v[1], v[0] + 2 * v[1] + v[2], v[1] + 2 * v[2]]
+        assert tv == pytest.approx([value * a for a in v], abs=1e-12)
+
+
+def test_not_square():
+    with pytest.raises(Exception, match=LinearOperator.NOT_SQUARE_MSG):
+        LinearOperator.from_matrix([[1, 2, 3], [4, 5, 6]])
@@ -0,0 +1,59 @@
+import csv
+import io
+from decimal import Decimal
+
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.plane import Plane
+from linear_algebra.linsys import LinearSystem
+from linear_algebra.export import EquationWriter
+
+PLANES = (Plane(Vector(['1', '-1', '0.5']), '2'), Plane(Vector(['0', '2', '-1.0004']), '-3.25'))
+
+
+def write(equations, constants=None, **kwargs):
+    buf = io.StringIO()
+    EquationWriter(buf, **kwargs).write_system(equations, constants)
+    return buf.getvalue()
+
+
+def test_text_matches_str():
+    system = LinearSystem(list(PLANES))
+    assert write(system) == str(system)
+
+
+def test_tuple_of_planes():
+    assert write(PLANES) == str(LinearSystem(list(PLANES)))
+
+
+def test_matrix_form():
+    coefficients, constants = LinearSystem(list(PLANES)).matrix_form()
+    assert write(coefficients, constants) == write(PLANES)
+
+
+def test_latex():
+    assert write(PLANES, format='latex') == (
+        '\\begin{align*}\n'
+        'x_{1} - x_{2} + 0.500x_{3} &= 2 \\\\\n'
+        '2x_{2} - x_{3} &= -3.250 \\\\\n'
+        '\\end{align*}\n')
+
+
+def test_csv_keeps_full_precision():
+    rows = list(csv.reader(io.StringIO(write(PLANES, format='csv'))))
+    assert rows[0] == ['x_1', 'x_2', 'x_3', 'constant']
+    assert rows[2] == ['0', '2', '-1.0004', '-3.25']
+
+
+def test_caches_are_bounded():
+    buf = io.StringIO()
+    writer = EquationWriter(buf, cache_entries=10)
+    writer.write_system([Plane(Vector([Decimal(i), Decimal(i + 1), Decimal(1)]), i) for i in range(1, 200)])
+    assert len(writer.coefficients) <= 10
+    assert len(writer.constants) <= 10
+
+
+def test_unknown_format():
+    with pytest.raises(Exception, match='Unknown format'):
+        EquationWriter(io.StringIO(), format='html')
@@ -0,0 +1,41 @@
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.plane import Plane
+from linear_algebra.linsys import LinearSystem
+from linear_algebra.iterative import IterativeSolver
+
+COEFFICIENTS = [[4, -1, 0], [-1, 4, -1], [0, -1, 4]]
+CONSTANTS = [15, 10, 10]
+EXPECTED = [4.910714285714286, 4.642857142857143, 3.660714285714286]
+
+
+def test_linear_system_input_uses_matrix_form():
+    s = LinearSystem([Plane(Vector(row), c) for row, c in zip(COEFFICIENTS, CONSTANTS)])
+    result = IterativeSolver(s).conjugate_gradient()
+    assert result.converged
+    assert [float(x) for x in result.solution] == pytest.approx(EXPECTED)
+
+
+@pytest.mark.parametrize('method', ['jacobi', 'gauss_seidel', 'sor', 'conjugate_gradient', 'pcg_jacobi'])
+def test_methods_converge(method):
+    solver = IterativeSolver(COEFFICIENTS, CONSTANTS)
+    result = {r.method: r for r in solver.compare_methods(omega=1.1)}[method]
+    assert result.converged
+    assert result.residual_history[-1] < 1e-10
+    assert [float(x) for x in result.solution] == pytest.approx(EXPECTED)
+
+
+def test_warm_start_needs_fewer_iterations():
+    solver = IterativeSolver(COEFFICIENTS, CONSTANTS)
+    cold = solver.gauss_seidel()
+    assert solver.gauss_seidel(x0=cold.solution).iterations < cold.iterations
+
+
+def test_errors():
+    with pytest.raises(Exception, match=IterativeSolver.NOT_SQUARE_MSG):
+        IterativeSolver([[1, 2]], [1])
+    with pytest.raises(Exception, match='Zero on the diagonal in row 0'):
+        IterativeSolver([[0, 1], [1, 0]], [1, 1]).jacobi()
+    with pytest.raises(Exception, match=IterativeSolver.NOT_POSITIVE_DEFINITE_MSG):
+        IterativeSolver([[-1, 0], [0, -1]], [1, 1]).conjugate_gradient()
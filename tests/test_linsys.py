@@ -0,0 +1,193 @@
+from decimal import Decimal, getcontext
+
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.plane import Plane
+from linear_algebra.linsys import LinearSystem, EliminationStep
+from linear_algebra.precision import current_tolerance, local_precision
+
+
+def plane(normal, constant):
+    return Plane(Vector(normal), constant)
+
+
+def test_triangular_form_keeps_triangular_system():
+    p1 = plane(['1', '1', '1'], '1')
+    p2 = plane(['0', '1', '1'], '2')
+    t = LinearSystem([p1, p2]).compute_triangular_form()
+    assert t[0] == p1 and t[1] == p2
+
+
+def test_triangular_form_of_parallel_planes():
+    p1 = plane(['1', '1', '1'], '1')
+    p2 = plane(['1', '1', '1'], '2')
+    t = LinearSystem([p1, p2]).compute_triangular_form()
+    assert t[0] == p1
+    assert t[1] == Plane(constant_term='1')
+
+
+def test_triangular_form_with_redundant_row():
+    p1 = plane(['1', '1', '1'], '1')
+    p2 = plane(['0', '1', '0'], '2')
+    p3 = plane(['1', '1', '-1'], '3')
+    p4 = plane(['1', '0', '-2'], '2')
+    t = LinearSystem([p1, p2, p3, p4]).compute_triangular_form()
+    assert t[0] == p1
+    assert t[1] == p2
+    assert t[2] == plane(['0', '0', '-2'], '2')
+    assert t[3] == Plane()
+
+
+def test_triangular_form_swaps_rows():
+    p1 = plane(['0', '1', '1'], '1')
+    p2 = plane(['1', '-1', '1'], '2')
+    p3 = plane(['1', '2', '-5'], '3')
+    t = LinearSystem([p1, p2, p3]).compute_triangular_form()
+    assert t[0] == plane(['1', '-1', '1'], '2')
+    assert t[1] == plane(['0', '1', '1'], '1')
+    assert t[2] == plane(['0', '0', '-9'], '-2')
+
+
+def test_triangular_form_leaves_system_untouched():
+    planes = [plane(['0', '1', '1'], '1'), plane(['1', '-1', '1'], '2'), plane(['1', '2', '-5'], '3')]
+    s = LinearSystem(list(planes))
+    s.compute_triangular_form()
+    assert all(a == b for a, b in zip(s.planes, planes))
+
+
+def test_steps_replay_to_triangular_form():
+    s = LinearSystem([plane(['0', '1', '1'], '1'), plane(['1', '-1', '1'], '2'),
+                      plane(['1', '2', '-5'], '3')])
+    steps = list(s.triangular_form_steps())
+    assert [step.operation for step in steps] == ['swap', 'add', 'add']
+    assert steps[0].rows == (0, 1)
+
+    coefficients, constants = s.matrix_form()
+    for step in steps:
+        step.apply(coefficients, constants)
+    t = s.compute_triangular_form()
+    assert [Vector(row) for row in coefficients] == [p.normal_vector for p in t.planes]
+    assert constants == [p.constant_term for p in t.planes]
+
+
+def test_steps_update_given_lists_in_place():
+    s = LinearSystem([plane(['1', '1', '1'], '1'), plane(['2', '1', '1'], '1')])
+    coefficients = [[Decimal(1), Decimal(1), Decimal(1)], [Decimal(2), Decimal(1), Decimal(1)]]
+    constants = [Decimal(1), Decimal(1)]
+    step, = s.triangular_form_steps(coefficients, constants)
+    assert step.coefficient == -2
+    assert coefficients[1] == [0, -1, -1]
+    assert constants[1] == -1
+
+
+def test_steps_use_system_precision():
+    s = LinearSystem([plane(['3', '1', '0'], '1'), plane(['1', '1', '1'], '1')], precision=50)
+    default_prec = getcontext().prec
+    for step in s.triangular_form_steps():
+        # The consumer's context is untouched between steps
+        assert getcontext().prec == default_prec
+    assert len(str(step.coefficient).split('.')[1]) == 50
+    t = s.compute_triangular_form()
+    with local_precision(50):
+        assert t[1].normal_vector[1] == 1 + step.deltas[1][1]
+
+
+def test_steps_use_system_tolerance():
+    # 1e-15 is near zero under the default tolerance, not under 1e-30
+    rows = [plane(['1', '0', '0'], '1'), plane(['1e-15', '1', '0'], '1')]
+    assert list(LinearSystem(rows).triangular_form_steps()) == []
+    steps = list(LinearSystem(rows, tolerance=1e-30).triangular_form_steps())
+    assert len(steps) == 1
+    assert current_tolerance() != 1e-30
+
+
+def test_missing_pivot_raises():
+    s = LinearSystem([plane(['0', '1', '0'], '1'), plane(['0', '1', '1'], '1')])
+    with pytest.raises(Exception, match='No row with non zero index for col 0'):
+        list(s.triangular_form_steps())
+
+
+def test_step_str():
+    assert str(EliminationStep('swap', (0, 2))) == 'swap rows 0 and 2'
+    assert str(EliminationStep('add', (0, 1), Decimal('-0.5'))) == 'add -0.500 times row 0 to row 1'
+
+
+def test_row_operations(capsys):
+    p0 = plane(['1', '1', '1'], '1')
+    p1 = plane(['0', '1', '0'], '2')
+    p2 = plane(['1', '1', '-1'], '3')
+    p3 = plane(['1', '0', '-2'], '2')
+    s = LinearSystem([p0, p1, p2, p3])
+
+    s.swap_rows(0, 1)
+    s.swap_rows(1, 3)
+    s.swap_rows(3, 1)
+    assert s.planes == [p1, p0, p2, p3]
+
+    s.multiply_coefficient_and_row(1, 0)
+    s.multiply_coefficient_and_row(-1, 2)
+    s.multiply_coefficient_and_row(10, 1)
+    assert s[1] == plane(['10', '10', '10'], '10')
+    assert s[2] == plane(['-1', '-1', '1'], '-3')
+
+    s.add_multiple_times_row_to_row(0, 0, 1)
+    s.add_multiple_times_row_to_row(1, 0, 1)
+    s.add_multiple_times_row_to_row(-1, 1, 0)
+    assert s[0] == plane(['-10', '-10', '-10'], '-10')
+    assert s[1] == plane(['10', '11', '10'], '12')
+    assert s[3] == p3
+
+    # Row operations are library calls and must not write to stdout
+    assert capsys.readouterr().out == ''
+
+
+def satisfies(system, x):
+    return all(abs(p.normal_vector.dot(x) - p.constant_term) < Decimal('1e-20') for p in system)
+
+
+def test_rref_with_free_column_in_the_middle():
+    s = LinearSystem([plane(['1', '2', '1'], '4'), plane(['0', '0', '1'], '1')])
+    rows, constants, pivot_columns = s.compute_rref()
+    assert pivot_columns == [0, 2]
+    assert rows == [[1, 2, 0], [0, 0, 1]]
+    assert constants == [3, 1]
+
+    p = s.compute_parametrization()
+    assert p.basepoint == Vector(['3', '0', '1'])
+    assert p.direction_vectors == [Vector(['-2', '1', '0'])]
+    assert p.point(['2']) == Vector(['-1', '2', '1'])
+
+
+def test_parametrization_of_wide_system():
+    s = LinearSystem([plane(['1', '2', '0', '-1', '3'], '7'),
+                      plane(['2', '4', '1', '0', '1'], '-2'),
+                      plane(['0', '0', '3', '1', '-2'], '5')])
+    _, _, pivot_columns = s.compute_rref()
+    assert pivot_columns == [0, 2, 3]
+
+    p = s.compute_parametrization()
+    assert len(p.direction_vectors) == 2
+    for t in (['0', '0'], ['1', '0'], ['0', '1'], ['-2.5', '7'], ['1e3', '-1e-3']):
+        assert satisfies(s, p.point(t))
+
+
+def test_parametrization_of_inconsistent_system():
+    s = LinearSystem([plane(['1', '1', '1'], '1'), plane(['2', '2', '2'], '3')])
+    with pytest.raises(Exception, match=LinearSystem.NO_SOLUTIONS_MSG):
+        s.compute_parametrization()
+
+
+def test_parametrization_of_rank_deficient_square_system():
+    p1 = plane(['1', '2', '3'], '6')
+    p2 = plane(['0', '1', '-1'], '1')
+    p3 = plane(['1', '3', '2'], '7')
+    s = LinearSystem([p1, p2, p3])
+    rows, constants, pivot_columns = s.compute_rref()
+    assert pivot_columns == [0, 1]
+    assert rows[2] == [0, 0, 0] and constants[2] == 0
+
+    p = s.compute_parametrization()
+    assert len(p.direction_vectors) == 1
+    for t in ('0', '1', '-3.25'):
+        assert satisfies(s, p.point([t]))
@@ -0,0 +1,111 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.linsys import LinearSystem
+from linear_algebra.matrix import Matrix, batched_product
+
+
+def random_matrix(n, m, seed):
+    rng = random.Random(seed)
+    return Matrix([[rng.uniform(-1, 1) for _ in range(m)] for _ in range(n)])
+
+
+def naive_product(a, b):
+    return [[sum(x * y for x, y in zip(row, column)) for column in b.transpose().rows()]
+            for row in a.rows()]
+
+
+def assert_close(rows, expected, tolerance=1e-12):
+    for r, e in zip(rows, expected):
+        assert r == pytest.approx(e, abs=tolerance)
+
+
+def test_rows_and_entries():
+    a = Matrix([[1, 2, 3], [4, 5, 6]])
+    assert a.shape == (2, 3)
+    assert a[1, 2] == 6.0
+    assert a.row(0) == [1.0, 2.0, 3.0]
+    assert a.column(1) == [2.0, 5.0]
+
+
+def test_ragged_and_empty():
+    with pytest.raises(ValueError):
+        Matrix([[1, 2], [3]])
+    with pytest.raises(ValueError):
+        Matrix([])
+
+
+def test_transpose_is_a_view():
+    a = Matrix([[1, 2, 3], [4, 5, 6]])
+    t = a.T
+    assert t.data is a.data
+    assert t.shape == (3, 2)
+    assert t.rows() == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]
+    a[0, 1] = 9
+    assert t[1, 0] == 9.0
+    assert t.T == a
+
+
+def test_matvec_and_times_vector():
+    a = Matrix([[1, 2], [3, 4], [5, 6]])
+    assert a.matvec([1, 1]) == [3.0, 7.0, 11.0]
+    assert a.times_vector(Vector([1, 1])) == Vector([3, 7, 11])
+    with pytest.raises(Exception):
+        a.matvec([1, 2, 3])
+
+
+def test_shape_mismatch():
+    with pytest.raises(Exception, match='Cannot multiply a 2x3 matrix by a 2x3 matrix'):
+        Matrix([[1, 2, 3], [4, 5, 6]]).times(Matrix([[1, 2, 3], [4, 5, 6]]))
+
+
+@pytest.mark.parametrize('block_size', [None, 1, 7, 1000])
+def test_blocked_product(block_size):
+    a, b = random_matrix(23, 17, 1), random_matrix(17, 11, 2)
+    assert_close(a.times(b, block_size=block_size).rows(), naive_product(a, b))
+
+
+def test_product_of_transposed_views():
+    a = random_matrix(9, 5, 3)
+    assert_close(a.T.times(a).rows(), naive_product(a.T, a))
+
+
+def test_strassen_product():
+    a, b = random_matrix(Matrix.STRASSEN_CUTOFF * 2 + 3, 140, 4), random_matrix(140, 131, 5)
+    assert_close(a.times(b, strassen=True).rows(), naive_product(a, b), 1e-10)
+
+
+def test_decimal_product_is_exact():
+    a = Matrix([['0.1', '0.2'], ['0.3', '0.4']], convert=Decimal)
+    assert a.times(a).rows() == [[Decimal('0.07'), Decimal('0.10')], [Decimal('0.15'), Decimal('0.22')]]
+
+
+def test_batched_product():
+    lefts = [random_matrix(3, 3, seed) for seed in range(10)]
+    rights = [random_matrix(3, 2, seed + 100) for seed in range(10)]
+    for product, a, b in zip(batched_product(lefts, rights), lefts, rights):
+        assert_close(product.rows(), naive_product(a, b))
+
+
+def test_batched_product_with_shared_factor():
+    shared = random_matrix(3, 3, 7)
+    lefts = [random_matrix(2, 3, seed) for seed in range(5)]
+    for product, a in zip(batched_product(lefts, shared), lefts):
+        assert_close(product.rows(), naive_product(a, shared))
+
+
+def test_linear_system_round_trip():
+    s = Matrix([[1, 1, 1], [0, 1, 0], [1, 0, 2]]).to_linear_system([1, 2, 3])
+    assert isinstance(s, LinearSystem)
+    assert s.solve().solution == Vector([-5, 2, 4])
+    assert Matrix.from_system(s) == Matrix([[1, 1, 1], [0, 1, 0], [1, 0, 2]])
+
+
+def test_plus_minus_scalar_identity():
+    a = Matrix([[1, 2], [3, 4]])
+    assert a.plus(a) == a.times_scalar(2)
+    assert a.minus(a) == Matrix([[0, 0], [0, 0]])
+    assert a.times(Matrix.identity(2)) == a
@@ -0,0 +1,38 @@
+import pytest
+
+from linear_algebra.mesh import TriangleMesh
+
+SQUARE = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+
+
+def test_normals_and_areas():
+    mesh = TriangleMesh(SQUARE, [(0, 1, 2), (0, 2, 3)], chunk_size=1)
+    assert list(mesh.face_normals()) == [0.0, 0.0, 1.0, 0.0, 0.0, 1.0]
+    assert list(mesh.face_areas()) == [0.5, 0.5]
+    assert mesh.total_area() == 1.0
+
+
+def test_normals_and_areas_in_one_pass():
+    mesh = TriangleMesh(SQUARE, [(0, 1, 2), (0, 2, 3), (1, 2, 3)], chunk_size=2)
+    passes = []
+    chunks = mesh.chunks
+    mesh.chunks = lambda: passes.append(1) or chunks()
+
+    normals, areas, total = mesh.normals_and_areas()
+    assert passes == [1]
+    assert normals == mesh.face_normals()
+    assert areas == mesh.face_areas()
+    assert total == mesh.total_area() == 1.5
+
+
+def test_degenerate_face():
+    mesh = TriangleMesh(SQUARE, [(0, 1, 1)])
+    assert list(mesh.face_normals()) == [0.0, 0.0, 0.0]
+    assert mesh.total_area() == 0.0
+
+
+@pytest.mark.parametrize('face', [(0, 1, 4), (0, 1, -1), (-4, 1, 2)])
+def test_bad_vertex_index(face):
+    mesh = TriangleMesh(SQUARE, [(0, 1, 2), face])
+    with pytest.raises(Exception, match=TriangleMesh.BAD_FACE_MSG.format(1)):
+        mesh.total_area()
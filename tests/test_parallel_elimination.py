@@ -0,0 +1,50 @@
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from linear_algebra.parallel_elimination import ParallelEliminator
+from linear_algebra.precision import local_precision
+
+
+def random_system(convert, n=30, seed=0):
+    rng = random.Random(seed)
+    coefficients = [[convert(rng.randint(-9, 9)) for _ in range(n)] for _ in range(n)]
+    constants = [convert(rng.randint(-9, 9)) for _ in range(n)]
+    return coefficients, constants
+
+
+@pytest.mark.parametrize('convert', [Decimal, Fraction, float])
+def test_workers_match_serial_elimination(convert):
+    coefficients, constants = random_system(convert)
+    serial = ParallelEliminator(workers=1).triangular_form(coefficients, constants)
+    parallel = ParallelEliminator(workers=4, min_parallel_rows=1).triangular_form(coefficients, constants)
+    assert parallel == serial
+
+
+def test_triangular_form_of_linear_system():
+    from linear_algebra.vector import Vector
+    from linear_algebra.plane import Plane
+    from linear_algebra.linsys import LinearSystem
+
+    s = LinearSystem([Plane(Vector(['1', '1', '1']), '1'),
+                      Plane(Vector(['2', '2', '3']), '4'),
+                      Plane(Vector(['1', '2', '1']), '0')])
+    rows, constants = ParallelEliminator(workers=2, min_parallel_rows=1).triangular_form(s)
+    assert rows == [[1, 1, 1], [0, 1, 0], [0, 0, 1]]
+    assert constants == [1, -1, 2]
+
+
+def test_pool_uses_callers_precision():
+    coefficients = [[Decimal(3), Decimal(1), Decimal(1)],
+                    [Decimal(1), Decimal(1), Decimal(2)],
+                    [Decimal(2), Decimal(1), Decimal(7)]]
+    constants = [Decimal(1), Decimal(2), Decimal(3)]
+    with local_precision(50):
+        rows, constants = ParallelEliminator(workers=2, min_parallel_rows=1).triangular_form(
+            coefficients, constants)
+    # 1 - 1/3 and friends only have 50 digits if the pool threads used the
+    # caller's precision rather than their default of 28
+    assert len(rows[1][1].as_tuple().digits) == 50
+    assert len(constants[1].as_tuple().digits) == 50
@@ -0,0 +1,35 @@
+import threading
+from decimal import getcontext
+
+from linear_algebra.precision import DEFAULT_TOLERANCE, current_tolerance, local_precision
+
+
+def test_local_precision_restores_settings():
+    prec = getcontext().prec
+    with local_precision(50, tolerance=1e-30):
+        assert getcontext().prec == 50
+        assert current_tolerance() == 1e-30
+    assert getcontext().prec == prec
+    assert current_tolerance() == DEFAULT_TOLERANCE
+
+
+def test_tolerance_is_isolated_between_threads():
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def work(name, tolerance, digits):
+        with local_precision(digits, tolerance):
+            # Both threads are inside their own settings at this point
+            barrier.wait()
+            seen[name] = (current_tolerance(), getcontext().prec)
+            barrier.wait()
+
+    threads = [threading.Thread(target=work, args=('low', 1e-6, 12)),
+               threading.Thread(target=work, args=('high', 1e-40, 60))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen == {'low': (1e-6, 12), 'high': (1e-40, 60)}
+    assert current_tolerance() == DEFAULT_TOLERANCE
@@ -0,0 +1,80 @@
+import struct
+from decimal import Decimal
+
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.line import Line
+from linear_algebra.plane import Plane
+from linear_algebra.serialization import (HEADER, KIND_VECTOR, KIND_EQUATION, FormatError,
+                                          RecordWriter, RecordReader, dumps, loads, read_header)
+
+PLANES = [Plane(Vector(['1', '-1', '0.5']), '2'), Plane(Vector(['0', '2', '-1.25']), '-3.1')]
+
+
+def test_float64_round_trip():
+    vectors = [Vector(['0.1', '-2', '3.5']), Vector(['1e-7', '0', '12345.678'])]
+    assert loads(dumps(vectors)) == vectors
+
+
+def test_decimal_round_trip():
+    loaded = loads(dumps(PLANES, dtype='decimal', scale=4))
+    assert [p.normal_vector for p in loaded] == [p.normal_vector for p in PLANES]
+    assert [p.constant_term for p in loaded] == [Decimal('2'), Decimal('-3.1')]
+    assert loaded[0].basepoint == PLANES[0].basepoint
+
+
+def test_lines_round_trip():
+    lines = [Line(Vector(['1', '2']), '3'), Line(Vector(['0', '1']), '-1')]
+    loaded = loads(dumps(lines))
+    assert all(isinstance(l, Line) for l in loaded)
+    assert [(l.normal_vector, l.constant_term, l.basepoint) for l in loaded] == \
+        [(l.normal_vector, l.constant_term, l.basepoint) for l in lines]
+
+
+def test_open_appends_and_updates_count(tmp_path):
+    path = str(tmp_path / 'planes.larf')
+    with RecordWriter.open(path, KIND_EQUATION, 3, dtype='decimal', scale=6) as w:
+        w.append(PLANES[0])
+    # The existing header wins over the arguments when appending
+    with RecordWriter.open(path, KIND_VECTOR, 5) as w:
+        assert w.count == 1
+        w.append(PLANES[1])
+
+    with open(path, 'rb') as f:
+        header = read_header(f.read(HEADER.size))
+    assert header['count'] == 2
+    assert header['kind'] == KIND_EQUATION
+    with RecordReader.open(path) as r:
+        assert len(r) == 2
+        assert r[1].constant_term == Decimal('-3.1')
+
+
+def test_close_releases_raw_views(tmp_path):
+    path = str(tmp_path / 'vectors.larf')
+    with RecordWriter.open(path, KIND_VECTOR, 2) as w:
+        w.append(Vector([1, 2]))
+    with RecordReader.open(path) as r:
+        view = r.raw(0)
+        assert view.tolist() == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        view.tolist()
+
+
+def test_fixed_point_out_of_range():
+    with pytest.raises(FormatError, match='does not fit'):
+        dumps([Vector(['1e15'])], dtype='decimal', scale=6)
+
+
+def test_bad_magic():
+    data = bytearray(dumps(PLANES))
+    data[:4] = b'NOPE'
+    with pytest.raises(FormatError, match='Not a vector record file'):
+        RecordReader(bytes(data))
+
+
+def test_bad_version():
+    data = bytearray(dumps(PLANES))
+    struct.pack_into('<B', data, 4, 99)
+    with pytest.raises(FormatError, match='Unsupported format version 99'):
+        RecordReader(bytes(data))
@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import pytest
+
+from linear_algebra.service import SolverService, SolverClient
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+
+async def start_service():
+    service = SolverService(batch_window=0.001)
+    server = await service.start(port=0)
+    return service, server, server.sockets[0].getsockname()[1]
+
+
+def test_batched_requests():
+    async def main():
+        service, server, port = await start_service()
+        client = await SolverClient.connect(port=port)
+        results = await asyncio.gather(
+            client.solve([[2, 1], [1, 3]], [3, 5]),
+            client.solve([[2, 1], [1, 3]], [1, 1]),
+            client.intersect([[1, 0], 1], [[0, 1], 2]),
+            client.project([3, 4], [1, 0]))
+        await client.close()
+        server.close()
+        return results, service.metrics.as_dict()
+
+    results, metrics = run(main())
+    assert results[0]['solution'] == pytest.approx([0.8, 1.4])
+    assert results[2] == {'point': [1.0, 2.0], 'coincident': False}
+    assert results[3] == {'parallel': [3.0, 0.0], 'orthogonal': [0.0, 4.0]}
+    assert metrics['requests'] == 4
+
+
+def test_requests_that_are_not_objects_get_an_error():
+    async def main():
+        service, server, port = await start_service()
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'[1, 2]\nnot json\n{"id": 7, "op": "nope"}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+        server.close()
+        return responses
+
+    responses = run(main())
+    assert responses[:2] == [{'id': None, 'error': SolverService.INVALID_REQUEST_MSG}] * 2
+    assert responses[2] == {'id': 7, 'error': SolverService.UNKNOWN_OP_MSG.format('nope')}
+
+
+def test_pending_requests_fail_when_connection_closes():
+    async def main():
+        async def hang_up(reader, writer):
+            await reader.readline()
+            writer.close()
+
+        server = await asyncio.start_server(hang_up, '127.0.0.1', 0)
+        client = await SolverClient.connect(port=server.sockets[0].getsockname()[1])
+        errors = []
+        for _ in range(2):
+            try:
+                await client.solve([[1]], [1])
+            except Exception as e:
+                errors.append(str(e))
+        await client.close()
+        server.close()
+        return errors
+
+    assert run(main()) == [SolverClient.CONNECTION_CLOSED_MSG] * 2
+
+
+def test_pending_requests_fail_on_malformed_response():
+    async def main():
+        async def garbage(reader, writer):
+            await reader.readline()
+            writer.write(b'}}}\n')
+            await writer.drain()
+
+        server = await asyncio.start_server(garbage, '127.0.0.1', 0)
+        client = await SolverClient.connect(port=server.sockets[0].getsockname()[1])
+        with pytest.raises(Exception, match='Malformed response'):
+            await client.solve([[1]], [1])
+        await client.close()
+        server.close()
+
+    run(main())
+
+
+def test_client_abort_with_requests_in_flight(caplog):
+    async def main():
+        service = SolverService(batch_window=0.001)
+        finished = asyncio.get_running_loop().create_future()
+
+        async def handle(reader, writer):
+            try:
+                await service.handle_connection(reader, writer)
+                finished.set_result(None)
+            except Exception as e:
+                finished.set_result(e)
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.sockets[0].getsockname()[1])
+        request = {'op': 'solve', 'coefficients': [[2, 1], [1, 3]], 'constants': [3, 5]}
+        for i in range(50):
+            writer.write((json.dumps(dict(request, id=i)) + '\n').encode())
+        await writer.drain()
+        writer.transport.abort()
+        error = await finished
+        server.close()
+        return error
+
+    assert run(main()) is None
+    assert 'socket.send() raised exception' not in caplog.text
@@ -0,0 +1,44 @@
+import pytest
+
+from linear_algebra.vector import Vector
+from linear_algebra.lu import LUFactorization
+from linear_algebra.solve_cache import SolveCache, canonical_key
+from linear_algebra.precision import local_precision
+
+ROWS = [['1', '1'], ['1', '1.000000000001']]
+CONSTANTS = ['1', '2']
+
+
+def test_key_ignores_spelling():
+    assert canonical_key([['1', '2']], ['3']) == canonical_key([['1.0', '2E+0']], ['3.00'])
+
+
+def test_key_depends_on_precision_and_tolerance():
+    key = canonical_key([['1', '2']], ['3'])
+    with local_precision(50):
+        assert canonical_key([['1', '2']], ['3']) != key
+    with local_precision(tolerance=1e-20):
+        assert canonical_key([['1', '2']], ['3']) != key
+
+
+def test_hits_after_first_solve(tmp_path, system):
+    cache = SolveCache(str(tmp_path / 'cache.sqlite'))
+    first = cache.solve(system(ROWS, CONSTANTS, tolerance=1e-20))
+    assert cache.solve(system(ROWS, CONSTANTS, tolerance=1e-20)).solution == first.solution
+    assert cache.stats()['hits_memory'] == 1
+
+    # A fresh cache on the same file finds the entry on disk
+    cache.close()
+    cache = SolveCache(str(tmp_path / 'cache.sqlite'))
+    assert cache.solve(system(ROWS, CONSTANTS, tolerance=1e-20)).solution == first.solution
+    assert cache.stats()['hits_disk'] == 1
+
+
+def test_system_settings_are_used(system):
+    cache = SolveCache()
+    # Near singular under the default tolerance, solvable under its own
+    with pytest.raises(Exception, match=LUFactorization.SINGULAR_MSG):
+        cache.solve(system(ROWS, CONSTANTS))
+    assert cache.solve(system(ROWS, CONSTANTS, tolerance=1e-20)).solution == Vector(['-999999999999', '1E+12'])
+    cache.solve(system(ROWS, CONSTANTS, precision=50, tolerance=1e-20))
+    assert cache.stats()['memory_entries'] == 2
@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+
+from linear_algebra.structure import MatrixStructure, BandedSolver, thomas_solve, triangular_solve
+
+
+def tridiagonal(n):
+    return [[4 if i == j else -1 if abs(i - j) == 1 else 0 for j in range(n)] for i in range(n)]
+
+
+def check_solution(coefficients, constants, x):
+    for row, c in zip(coefficients, constants):
+        assert abs(sum(Decimal(a) * xj for a, xj in zip(row, x)) - c) < Decimal('1e-20')
+
+
+def test_structure_bandwidths():
+    s = MatrixStructure([[2, 1, 0, 0], [1, 2, 1, 0], [0, 0, 2, 1], [3, 0, 1, 5]])
+    assert (s.lower_bandwidth, s.upper_bandwidth) == (3, 1)
+    assert not s.is_tridiagonal()
+    assert s.weakly_diagonally_dominant
+    assert not s.strictly_diagonally_dominant
+
+
+def test_structure_predicates():
+    assert MatrixStructure([[1, 0], [0, 2]]).is_diagonal()
+    assert MatrixStructure([[1, 0], [3, 2]]).is_lower_triangular()
+    assert MatrixStructure(tridiagonal(5)).is_tridiagonal()
+    assert MatrixStructure(tridiagonal(5)).strictly_diagonally_dominant
+
+
+@pytest.mark.parametrize('coefficients, method', [
+    ([[2, 0, 0], [0, 4, 0], [0, 0, 5]], 'diagonal'),
+    ([[2, 0, 0], [1, 4, 0], [3, 1, 5]], 'triangular'),
+    ([[2, 1, 3], [0, 4, 1], [0, 0, 5]], 'triangular'),
+    (tridiagonal(6), 'thomas'),
+    ([[1, 2, 3], [4, 5, 6], [7, 8, 10]], 'mixed_precision'),
+])
+def test_solve_routes_by_structure(coefficients, method, system):
+    constants = list(range(1, len(coefficients) + 1))
+    report = system(coefficients, constants).solve()
+    assert report.method == method
+    assert report.structure is not None
+    check_solution(coefficients, constants, report.solution)
+
+
+def test_solve_banded(system):
+    n = 20
+    coefficients = [[6 if i == j else -1 if 0 < abs(i - j) <= 2 else 0 for j in range(n)] for i in range(n)]
+    constants = [i % 3 for i in range(n)]
+    report = system(coefficients, constants).solve()
+    assert report.method == 'banded'
+    check_solution(coefficients, constants, report.solution)
+
+
+def test_thomas_raises_on_zero_pivot():
+    coefficients = [[0, 0, 0], [1, 1, 0], [0, 1, 1]]
+    with pytest.raises(Exception, match=BandedSolver.ZERO_PIVOT_MSG):
+        thomas_solve(coefficients, [1, 1, 1])
+
+
+def test_triangular_solve_matches_substitution():
+    x = triangular_solve([[Decimal(2), Decimal(0)], [Decimal(1), Decimal(4)]],
+                         [Decimal(2), Decimal(9)], lower=True)
+    assert x == [1, 2]
+
+
+def test_banded_solver_matches_thomas():
+    coefficients = [[Decimal(a) for a in row] for row in tridiagonal(8)]
+    constants = [Decimal(i) for i in range(8)]
+    banded = BandedSolver(coefficients, 1, 1).solve(constants)
+    assert all(abs(a - b) < Decimal('1e-25') for a, b in zip(banded, thomas_solve(coefficients, constants)))